@@ -1,5 +1,7 @@
 # pylint: disable=duplicate-code
 
+from typing import Literal
+
 import skrough.typing as rght
 from skrough.algorithms import hooks
 from skrough.algorithms.meta import processing
@@ -9,17 +11,39 @@ from skrough.algorithms.reusables.attrs_daar import (
 from skrough.algorithms.reusables.attrs_greedy import attrs_greedy_stage
 from skrough.algorithms.reusables.attrs_reduction import attrs_reduction_stage
 from skrough.algorithms.reusables.objs_choose import objs_choose_randomly
-from skrough.dataprep import prepare_factorized_array, prepare_factorized_vector
+from skrough.profiling import Profiler
+from skrough.structs.decision_table import DecisionTable
 from skrough.structs.group_index import resolve_group_index_class
 from skrough.structs.group_index._protocol import GroupIndexProtocol
+from skrough.structs.objs_attrs_subset import ObjsAttrsSubset
 from skrough.structs.state import ProcessingState
 
+
+def _get_original_objs_attrs_subsets(
+    data: DecisionTable,
+    bireducts: list[ObjsAttrsSubset],
+) -> list[ObjsAttrsSubset]:
+    """Map the objects of bireducts of a deduplicated table back to original rows."""
+    if data.objs_inverse is None:
+        return bireducts
+    return [
+        ObjsAttrsSubset(
+            objs=data.get_original_objs(bireduct.objs),
+            attrs=bireduct.attrs,
+        )
+        for bireduct in bireducts
+    ]
+
+
 _get_bireduct_greedy_heuristic = processing.ProcessingMultiStage.from_hooks(
-    init_multi_stage_hooks=[
+    shared_init_hooks=[
         hooks.init_hooks.init_hook_pass_data,
+        hooks.init_hooks.init_hook_epsilon_approx_threshold,
+    ],
+    init_multi_stage_hooks=[
         hooks.init_hooks.init_hook_single_group_index,
         hooks.init_hooks.init_hook_result_attrs_empty,
-        hooks.init_hooks.init_hook_epsilon_approx_threshold,
+        hooks.init_hooks.init_hook_partition_cache,
     ],
     stages=[
         attrs_greedy_stage,
@@ -40,18 +64,27 @@ def get_bireduct_greedy_heuristic(
     seed: rght.Seed = None,
     n_jobs: int | None = None,
     group_index_class: str | type[GroupIndexProtocol] | None = None,
+    shrink_pure_groups: bool = False,
+    share_data: bool = False,
+    batch_size: int | Literal["auto"] | None = None,
+    backend: str | None = None,
+    profiler: Profiler | None = None,
+    partition_cache_max_bytes: int | None = None,
+    deduplicate: bool = False,
 ):
-    x, x_counts = prepare_factorized_array(x)
-    y, y_count = prepare_factorized_vector(y)
+    data = DecisionTable.from_data_like(x, y, deduplicate=deduplicate)
 
     state = ProcessingState.from_optional(
         processing_fun=None,
         rng=None,
+        profiler=profiler,
     )
-    state.set_input_data_x(x)
-    state.set_input_data_x_counts(x_counts)
-    state.set_input_data_y(y)
-    state.set_input_data_y_count(y_count)
+    state.set_input_data_x(data.x)
+    state.set_input_data_x_counts(data.x_counts)
+    state.set_input_data_y(data.y)
+    state.set_input_data_y_count(data.y_count)
+    if data.weights is not None:
+        state.set_input_data_weights(data.weights)
     state.set_config_disorder_fun(disorder_fun)
     state.set_config_epsilon(epsilon)
     if candidates_count is not None:
@@ -59,22 +92,36 @@ def get_bireduct_greedy_heuristic(
     state.set_config_select_attrs_disorder_score_based_max_count(1)
     state.set_config_set_approx_threshold_to_current(True)
     state.set_group_index_class(resolve_group_index_class(group_index_class))
+    state.set_config_partition_cache_max_bytes(partition_cache_max_bytes)
+    disorder_score_stats = data.get_disorder_score_stats(
+        disorder_fun, state.get_group_index_class()
+    )
+    state.set_values_disorder_score_base(disorder_score_stats.base)
+    state.set_values_disorder_score_total(disorder_score_stats.total)
+    state.set_config_shrink_pure_groups(shrink_pure_groups)
 
     result = _get_bireduct_greedy_heuristic.call_parallel(
         n_times=n_bireducts,
         state=state,
         seed=seed,
         n_jobs=n_jobs,
+        share_data=share_data,
+        batch_size=batch_size,
+        backend=backend,
     )
-    return result
+    return _get_original_objs_attrs_subsets(data, result)
 
 
 _get_bireduct_daar_heuristic = processing.ProcessingMultiStage.from_hooks(
-    init_multi_stage_hooks=[
+    shared_init_hooks=[
         hooks.init_hooks.init_hook_pass_data,
+        hooks.init_hooks.init_hook_epsilon_approx_threshold,
+    ],
+    init_multi_stage_hooks=[
         hooks.init_hooks.init_hook_single_group_index,
         hooks.init_hooks.init_hook_result_attrs_empty,
-        hooks.init_hooks.init_hook_epsilon_approx_threshold,
+        hooks.init_hooks.init_hook_daar_permutations_bank,
+        hooks.init_hooks.init_hook_partition_cache,
     ],
     stages=[
         attrs_daar_with_approx_and_count_stage,
@@ -98,15 +145,22 @@ def get_bireduct_daar_heuristic(
     probes_count: int | None = None,
     smoothing_parameter: float | None = None,
     fast: bool = False,
+    permutations_bank_size: int | None = None,
+    speculative_count: int | None = None,
     n_bireducts: int = 1,
     seed: rght.Seed = None,
     n_jobs: int | None = None,
     group_index_class: str | type[GroupIndexProtocol] | None = None,
+    share_data: bool = False,
+    batch_size: int | Literal["auto"] | None = None,
+    backend: str | None = None,
+    profiler: Profiler | None = None,
+    partition_cache_max_bytes: int | None = None,
+    deduplicate: bool = False,
 ):
-    x, x_counts = prepare_factorized_array(x)
-    y, y_count = prepare_factorized_vector(y)
+    data = DecisionTable.from_data_like(x, y, deduplicate=deduplicate)
 
-    n_attrs = max(1, x.shape[1])
+    n_attrs = max(1, data.x.shape[1])
     if allowed_randomness is None:
         allowed_randomness = 1 / n_attrs
     if probes_count is None:
@@ -115,11 +169,14 @@ def get_bireduct_daar_heuristic(
     state = ProcessingState.from_optional(
         processing_fun=None,
         rng=None,
+        profiler=profiler,
     )
-    state.set_input_data_x(x)
-    state.set_input_data_x_counts(x_counts)
-    state.set_input_data_y(y)
-    state.set_input_data_y_count(y_count)
+    state.set_input_data_x(data.x)
+    state.set_input_data_x_counts(data.x_counts)
+    state.set_input_data_y(data.y)
+    state.set_input_data_y_count(data.y_count)
+    if data.weights is not None:
+        state.set_input_data_weights(data.weights)
     state.set_config_disorder_fun(disorder_fun)
     state.set_config_epsilon(epsilon)
     if candidates_count is not None:
@@ -129,6 +186,8 @@ def get_bireduct_daar_heuristic(
     state.set_config_consecutive_empty_iterations_max_count(consecutive_daar_reps)
     state.set_config_daar_allowed_randomness(allowed_randomness)
     state.set_config_daar_fast(fast)
+    state.set_config_daar_permutations_bank_size(permutations_bank_size)
+    state.set_config_daar_speculative_count(speculative_count)
     state.set_config_daar_probes_count(probes_count)
     state.set_config_consecutive_empty_iterations_max_count(consecutive_daar_reps)
     state.set_config_set_approx_threshold_to_current(False)
@@ -137,11 +196,20 @@ def get_bireduct_daar_heuristic(
     if smoothing_parameter is not None:
         state.set_config_daar_smoothing_parameter(smoothing_parameter)
     state.set_group_index_class(resolve_group_index_class(group_index_class))
+    state.set_config_partition_cache_max_bytes(partition_cache_max_bytes)
+    disorder_score_stats = data.get_disorder_score_stats(
+        disorder_fun, state.get_group_index_class()
+    )
+    state.set_values_disorder_score_base(disorder_score_stats.base)
+    state.set_values_disorder_score_total(disorder_score_stats.total)
 
     result = _get_bireduct_daar_heuristic.call_parallel(
         n_times=n_bireducts,
         state=state,
         seed=seed,
         n_jobs=n_jobs,
+        share_data=share_data,
+        batch_size=batch_size,
+        backend=backend,
     )
-    return result
+    return _get_original_objs_attrs_subsets(data, result)
@@ -1 +1,12 @@
 RNG_INTEGERS_PARAM = 2**32
+
+BATCH_SIZE_AUTO_TARGET_SECONDS = 0.2
+"""Target duration of a batch of runs when the batch size is chosen automatically."""
+
+BATCH_SIZE_AUTO_TIMED_RUNS = 2
+"""Number of runs executed in the calling process when the batch size is chosen
+automatically; the batch size is chosen from the duration of the last of them."""
+
+SHARE_DATA_MAX_NBYTES = 0
+"""Size threshold (in bytes) of arrays memory-mapped by :mod:`joblib` when the data is
+shared with workers, i.e., all non-empty arrays are memory-mapped."""
@@ -1,8 +1,13 @@
 import logging
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 
 import numpy as np
 
 import skrough.typing as rght
+from skrough.algorithms.constants import RNG_INTEGERS_PARAM
+from skrough.algorithms.hooks.helpers import get_values_weights_or_none
 from skrough.attrs_checks import check_if_attr_better_than_shuffled
 from skrough.logs import log_call
 from skrough.structs.state import ProcessingState
@@ -11,12 +16,101 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_DAAR_SMOOTHING_PARAMETER = 1
 
+_AttrCheck = Callable[[int, np.random.Generator, Callable[[], bool] | None], bool]
+
+
+def _find_first_passing_speculatively(
+    elements: rght.Elements,
+    check: _AttrCheck,
+    seeds: np.ndarray,
+    speculative_count: int,
+    executor: ThreadPoolExecutor,
+) -> int | None:
+    """Find the position of the first element passing the check.
+
+    Up to ``speculative_count`` consecutive elements are checked at once on the
+    ``executor`` thread pool, the ``i``-th element with a random generator seeded with
+    ``seeds[i]``. Whenever an element passes, the checks of all later elements are
+    aborted, as their results are not needed anymore.
+    """
+    n_elements = len(elements)
+    first_passed = n_elements
+    lock = threading.Lock()
+
+    def _run(i: int) -> bool:
+        nonlocal first_passed
+        passed = check(
+            elements[i],
+            np.random.default_rng(seeds[i]),
+            lambda: first_passed < i,
+        )
+        if passed:
+            with lock:
+                first_passed = min(first_passed, i)
+        return passed
+
+    futures: dict[int, Future] = {}
+    next_i = 0
+    try:
+        for i in range(n_elements):
+            while next_i < n_elements and next_i < i + speculative_count:
+                futures[next_i] = executor.submit(_run, next_i)
+                next_i += 1
+            if futures.pop(i).result():
+                return i
+    finally:
+        # the pool is shared by the whole run, so the checks still running are
+        # waited for (they abort quickly) before the pool is used again
+        for future in futures.values():
+            future.cancel()
+        wait(futures.values())
+    return None
+
+
+def _get_daar_speculative_executor(
+    state: ProcessingState,
+    speculative_count: int,
+) -> ThreadPoolExecutor:
+    """Get the thread pool for speculative checking, creating it on first use.
+
+    The pool is kept in the ``state``, so it is created once per processing run and
+    its worker threads exit once the state is discarded.
+    """
+    if not state.is_set_values_daar_speculative_executor():
+        state.set_values_daar_speculative_executor(
+            ThreadPoolExecutor(max_workers=speculative_count)
+        )
+    return state.get_values_daar_speculative_executor()
+
 
 @log_call
 def filter_hook_attrs_first_daar(
     state: ProcessingState,
     elements: rght.Elements,
 ) -> rght.Elements:
+    """Filter hook function to find the first attribute passing the DAAR check.
+
+    Candidate attributes are checked in the given order with
+    :func:`~skrough.attrs_checks.check_if_attr_better_than_shuffled` and the first
+    attribute that is better than its shuffled copies is returned. The checks draw
+    from the random generator of the ``state`` one after another.
+
+    If the ``daar_speculative_count`` config value is set, up to
+    ``daar_speculative_count`` consecutive candidates are checked at once on a thread
+    pool, which is created once per processing run. The checks of candidates that
+    follow the earliest passing one are aborted. A separate random seed is then drawn
+    for every candidate attribute upfront and each check uses its own random
+    generator, so the result does not depend on the ``daar_speculative_count`` value.
+    It differs, however, from the result of the sequential checking used when the
+    config value is not set, as the random draws are different.
+
+    Args:
+        state: An object representing the processing state.
+        elements: Candidate attributes.
+
+    Returns:
+        The first attribute passing the check or no attributes at all.
+    """
     daar_allowed_randomness = state.get_config_daar_allowed_randomness()
     logger.debug("Param daar_allowed_randomness == %f", daar_allowed_randomness)
     daar_fast = state.get_config_daar_fast()
@@ -34,10 +128,20 @@ def filter_hook_attrs_first_daar(
     x_counts = state.get_values_x_counts()
     y = state.get_values_y()
     y_count = state.get_values_y_count()
-    result = []
-    for attr in elements:
+    weights = get_values_weights_or_none(state)
+    permutations = (
+        state.get_values_daar_permutations_bank()
+        if state.is_set_values_daar_permutations_bank()
+        else None
+    )
+
+    def _check(
+        attr: int,
+        rng: np.random.Generator,
+        should_abort: Callable[[], bool] | None,
+    ) -> bool:
         logger.debug("Check if attr <%d> is better than shuffled", attr)
-        if check_if_attr_better_than_shuffled(
+        return check_if_attr_better_than_shuffled(
             group_index=group_index,
             attr_values=x[:, attr],
             attr_values_count=x_counts[attr],
@@ -48,12 +152,38 @@ def filter_hook_attrs_first_daar(
             smoothing_parameter=daar_smoothing_parameter,
             fast=daar_fast,
             disorder_fun=disorder_fun,
-            rng=state.get_rng(),
-        ):
-            logger.debug(
-                "Attr <%d> is better than shuffled with respect to allowed_randomness",
-                attr,
-            )
-            result.append(attr)
-            break  # in this version we finish whenever the first one is found
+            rng=rng,
+            permutations=permutations,
+            should_abort=should_abort,
+            weights=weights,
+        )
+
+    result = []
+    if state.is_set_config_daar_speculative_count():
+        daar_speculative_count = state.get_config_daar_speculative_count()
+        logger.debug("Param daar_speculative_count == %d", daar_speculative_count)
+        if daar_speculative_count < 1:
+            raise ValueError("Speculative count should be a positive number")
+        # every candidate is checked with its own random generator, so that the
+        # result does not depend on the order in which the checks are run
+        seeds = state.get_rng().integers(RNG_INTEGERS_PARAM, size=len(elements))
+        position = _find_first_passing_speculatively(
+            elements,
+            _check,
+            seeds,
+            daar_speculative_count,
+            _get_daar_speculative_executor(state, daar_speculative_count),
+        )
+        if position is not None:
+            result.append(elements[position])
+    else:
+        for attr in elements:
+            if _check(attr, state.get_rng(), None):
+                result.append(attr)
+                break  # in this version we finish whenever the first one is found
+    if len(result) > 0:
+        logger.debug(
+            "Attr <%d> is better than shuffled with respect to allowed_randomness",
+            result[0],
+        )
     return np.asarray(result)
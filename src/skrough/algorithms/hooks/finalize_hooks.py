@@ -1,6 +1,8 @@
 import logging
 from dataclasses import dataclass
 
+from skrough.algorithms.hooks.helpers import get_group_index_for_attrs
+from skrough.greedy_engine import get_greedy_reduct_attrs
 from skrough.instances import choose_objects
 from skrough.logs import log_call
 from skrough.structs.state import ProcessingState
@@ -8,6 +10,66 @@ from skrough.structs.state import ProcessingState
 logger = logging.getLogger(__name__)
 
 
+@log_call
+def finalize_hook_restore_group_index(
+    state: ProcessingState,
+) -> None:
+    """Finalize hook function to stop tracking objects of impure groups only.
+
+    If active objects are tracked in the ``state`` (see
+    :func:`~skrough.algorithms.hooks.init_hooks.init_hook_active_objs`), the group
+    index describing all objects is rebuilt from the current result attributes and
+    stored in the ``state``, and the active objects are no longer tracked.
+
+    Args:
+        state: An object representing the processing state.
+    """
+    if state.is_set_values_active_objs():
+        group_index = get_group_index_for_attrs(
+            state,
+            attrs=state.get_values_result_attrs(),
+        )
+        state.set_values_group_index(group_index)
+        state.set_values_active_objs(None)
+
+
+@log_call
+def finalize_hook_attrs_greedy_compiled(
+    state: ProcessingState,
+) -> None:
+    """Finalize hook function to find an approximate reduct with the compiled engine.
+
+    The whole greedy heuristic, i.e., the greedy stage followed by the reduction stage
+    (cf. :mod:`~skrough.algorithms.reusables.attrs_greedy` and
+    :mod:`~skrough.algorithms.reusables.attrs_reduction`), is run by
+    :func:`~skrough.greedy_engine.get_greedy_reduct_attrs` in a single compiled
+    function and the found attributes are stored in the ``state`` as the result
+    attributes. The candidate attributes are drawn from the random generator of the
+    ``state``, but not with the same draws as by the hook-based stages (cf.
+    :mod:`skrough.greedy_engine`).
+
+    Args:
+        state: An object representing the processing state.
+    """
+    candidates_count = (
+        state.get_config_candidates_select_random_max_count()
+        if state.is_set_config_candidates_select_random_max_count()
+        else None
+    )
+    result_attrs = get_greedy_reduct_attrs(
+        x=state.get_values_x(),
+        x_counts=state.get_values_x_counts(),
+        y=state.get_values_y(),
+        y_count=state.get_values_y_count(),
+        disorder_fun=state.get_config_disorder_fun(),
+        approx_threshold=state.get_values_disorder_score_approx_threshold(),
+        candidates_count=candidates_count,
+        rng=state.get_rng(),
+    )
+    logger.debug("Result attrs count = %d", len(result_attrs))
+    state.set_values_result_attrs(result_attrs)
+
+
 @dataclass
 class FinalizeHookChooseObjsRandomly:
     @log_call
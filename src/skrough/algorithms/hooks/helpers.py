@@ -1,30 +1,152 @@
 import logging
 
+import numpy as np
+
+import skrough.typing as rght
+from skrough.homogeneity import encode_homogeneity
 from skrough.logs import log_call
 from skrough.structs.group_index import GroupIndex
+from skrough.structs.partition_cache import get_objs_fingerprint
 from skrough.structs.state import ProcessingState
+from skrough.unique import get_uniques_and_compacted
 
 logger = logging.getLogger(__name__)
 
 
+def get_values_weights_or_none(state: ProcessingState) -> np.ndarray | None:
+    """Get the weights of objects from the ``state`` or :obj:`None` if not set."""
+    return state.get_values_weights() if state.is_set_values_weights() else None
+
+
 @log_call
 def check_if_below_approx_threshold(
     state: ProcessingState,
     group_index: GroupIndex,
+    approx_threshold: float | None = None,
 ) -> bool:
     values = state.get_values_y()
     values_count = state.get_values_y_count()
+    weights = get_values_weights_or_none(state)
     if state.is_set_values_result_objs():
         values = values[state.get_values_result_objs()]
-    current_disorder_score = group_index.get_disorder_score(
-        values=values,
-        values_count=values_count,
-        disorder_fun=state.get_config_disorder_fun(),
+        if weights is not None:
+            weights = weights[state.get_values_result_objs()]
+    approx_disorder_score_threshold = (
+        approx_threshold
+        if approx_threshold is not None
+        else state.get_values_disorder_score_approx_threshold()
     )
-    approx_disorder_score_threshold = state.get_values_disorder_score_approx_threshold()
+    if state.is_set_values_active_objs():
+        # the group index covers only the active objects; the dropped objects
+        # come from decision-homogeneous groups which contribute nothing to
+        # the disorder score, so it suffices to normalize by all objects
+        active_objs = state.get_values_active_objs()
+        distribution = group_index.get_distribution(
+            values=values[active_objs],
+            values_count=values_count,
+            weights=weights[active_objs] if weights is not None else None,
+        )
+        current_disorder_score = state.get_config_disorder_fun()(
+            distribution,
+            len(values) if weights is None else int(np.sum(weights)),
+        )
+    elif weights is not None:
+        current_disorder_score = group_index.get_disorder_score(
+            values=values,
+            values_count=values_count,
+            disorder_fun=state.get_config_disorder_fun(),
+            weights=weights,
+        )
+    else:
+        current_disorder_score = group_index.get_tracked_disorder_score(
+            values=values,
+            values_count=values_count,
+            disorder_fun=state.get_config_disorder_fun(),
+        )
+        # the tracked total may differ from a from-scratch computation by
+        # rounding errors, so decide close calls on the exact score
+        if np.isclose(current_disorder_score, approx_disorder_score_threshold):
+            current_disorder_score = group_index.get_disorder_score(
+                values=values,
+                values_count=values_count,
+                disorder_fun=state.get_config_disorder_fun(),
+            )
     logger.debug("current_disorder_score = %f", current_disorder_score)
     logger.debug(
         "approx_disorder_score_value_threshold = %f",
         approx_disorder_score_threshold,
     )
     return bool(current_disorder_score <= approx_disorder_score_threshold)
+
+
+@log_call
+def shrink_to_impure_groups(
+    state: ProcessingState,
+    group_index: GroupIndex,
+    active_objs: np.ndarray,
+) -> None:
+    """Drop objects of decision-homogeneous groups from further processing.
+
+    The given ``group_index`` describes the ``active_objs`` objects (by their
+    positions in ``active_objs``). Objects from groups whose decision values
+    are homogeneous are dropped - such groups contribute nothing to any of the
+    built-in disorder measures and will not do so after any further split.
+    The remaining objects are stored in the ``state`` as the new active objects
+    together with a compressed group index describing them.
+    """
+    values = state.get_values_y()[active_objs]
+    _, group_ids = get_uniques_and_compacted(group_index.index)
+    distribution = GroupIndex.from_index(group_ids).get_distribution(
+        values=values,
+        values_count=state.get_values_y_count(),
+    )
+    impure = encode_homogeneity(distribution)[group_ids] == 0
+    logger.debug("Active objects count = %d", np.count_nonzero(impure))
+    state.set_values_active_objs(np.asarray(active_objs)[impure])
+    state.set_values_group_index(
+        state.get_group_index_class().from_index(group_ids[impure], compress=True)
+    )
+
+
+@log_call
+def get_group_index_for_attrs(
+    state: ProcessingState,
+    attrs: rght.IndexListLike,
+    objs: rght.IndexListLike | None = None,
+) -> GroupIndex:
+    """Get the group index induced by the given attributes.
+
+    The group index is built for the ``objs`` objects (all objects if not given) with
+    the group index implementation of the ``state``. If a partition cache is set in
+    the ``state`` (see
+    :func:`~skrough.algorithms.hooks.init_hooks.init_hook_partition_cache`), the group
+    index is taken from the cache, if possible. The returned group index can be
+    shared with the cache, so it should not be modified in place.
+
+    Args:
+        state: An object representing the processing state.
+        attrs: Attributes inducing the group index.
+        objs: Objects the group index should describe. Defaults to :obj:`None`, i.e.,
+            all objects.
+
+    Returns:
+        The group index describing the ``objs`` objects by their positions in
+        ``objs``.
+    """
+    x = state.get_values_x()
+    if objs is not None:
+        x = x[objs]
+    x_counts = state.get_values_x_counts()
+    if not state.is_set_values_partition_cache():
+        return state.get_group_index_class().from_data(
+            x=x,
+            x_counts=x_counts,
+            attrs=attrs,
+        )
+    return state.get_values_partition_cache().get_group_index(
+        group_index_class=state.get_group_index_class(),
+        x=x,
+        x_counts=x_counts,
+        attrs=attrs,
+        objs_fingerprint=get_objs_fingerprint(objs) if objs is not None else None,
+    )
@@ -2,9 +2,19 @@
 
 import logging
 
+import numpy as np
+
+from skrough.algorithms.hooks.helpers import (
+    get_values_weights_or_none,
+    shrink_to_impure_groups,
+)
 from skrough.dataprep import prepare_factorized_array, prepare_factorized_vector
-from skrough.disorder_score import get_disorder_score_stats
+from skrough.disorder_score import (
+    get_disorder_score_stats,
+    get_epsilon_approx_threshold,
+)
 from skrough.logs import log_call
+from skrough.structs.partition_cache import PartitionCache
 from skrough.structs.state import ProcessingState
 
 logger = logging.getLogger(__name__)
@@ -48,6 +58,8 @@ def init_hook_pass_data(
     state.set_values_x_counts(state.get_input_data_x_counts())
     state.set_values_y(state.get_input_data_y())
     state.set_values_y_count(state.get_input_data_y_count())
+    if state.is_set_input_data_weights():
+        state.set_values_weights(state.get_input_data_weights())
 
 
 # TODO: update docstring
@@ -115,25 +127,98 @@ def init_hook_result_attrs_empty(
     state.set_values_result_attrs([])
 
 
+def _get_disorder_score_base_and_total(
+    state: ProcessingState,
+) -> tuple[float, float]:
+    """Get the base and total disorder score, computing them unless already known.
+
+    The values may be known in advance, e.g., when they are taken from the cache of
+    a :class:`~skrough.structs.decision_table.DecisionTable`.
+    """
+    if not (
+        state.is_set_values_disorder_score_base()
+        and state.is_set_values_disorder_score_total()
+    ):
+        disorder_stats = get_disorder_score_stats(
+            x=state.get_values_x(),
+            x_counts=state.get_values_x_counts(),
+            y=state.get_values_y(),
+            y_count=state.get_values_y_count(),
+            disorder_fun=state.get_config_disorder_fun(),
+            group_index_class=state.get_group_index_class(),
+            weights=get_values_weights_or_none(state),
+        )
+        state.set_values_disorder_score_base(disorder_stats.base)
+        state.set_values_disorder_score_total(disorder_stats.total)
+    return (
+        state.get_values_disorder_score_base(),
+        state.get_values_disorder_score_total(),
+    )
+
+
 @log_call
 def init_hook_epsilon_approx_threshold(
     state: ProcessingState,
 ) -> None:
-    disorder_stats = get_disorder_score_stats(
-        x=state.get_values_x(),
-        x_counts=state.get_values_x_counts(),
-        y=state.get_values_y(),
-        y_count=state.get_values_y_count(),
-        disorder_fun=state.get_config_disorder_fun(),
-        epsilon=state.get_config_epsilon(),
-        group_index_class=state.get_group_index_class(),
+    """Init hook function to compute the approximation threshold for the epsilon.
+
+    The approximation threshold is computed for the ``epsilon`` config (cf.
+    :func:`~skrough.disorder_score.get_epsilon_approx_threshold`) using the base and
+    total disorder score, which are computed and stored in the ``state`` unless they
+    are already set.
+
+    Args:
+        state: An object representing the processing state.
+    """
+    base, total = _get_disorder_score_base_and_total(state)
+    state.set_values_disorder_score_approx_threshold(
+        get_epsilon_approx_threshold(base, total, state.get_config_epsilon())
+    )
+
+
+@log_call
+def init_hook_epsilon_path_approx_thresholds(
+    state: ProcessingState,
+) -> None:
+    """Init hook function to compute approximation thresholds for many epsilons.
+
+    The approximation thresholds are computed for all the epsilon values from the
+    ``epsilons`` config (cf.
+    :func:`~skrough.disorder_score.get_epsilon_approx_threshold`) and stored in the
+    ``state`` in the same order. The lowest of the thresholds, i.e., the one for the
+    smallest epsilon, is stored as the disorder score approximation threshold, so that
+    processes reaching it reach also all the other thresholds. The base and total
+    disorder score are handled as by :func:`init_hook_epsilon_approx_threshold`.
+
+    Args:
+        state: An object representing the processing state.
+    """
+    base, total = _get_disorder_score_base_and_total(state)
+    approx_thresholds = [
+        get_epsilon_approx_threshold(base, total, epsilon)
+        for epsilon in state.get_config_epsilons()
+    ]
+    if len(approx_thresholds) == 0:
+        raise ValueError("At least one epsilon value should be given")
+    state.set_values_epsilon_path_approx_thresholds(approx_thresholds)
+    state.set_values_disorder_score_approx_threshold(min(approx_thresholds))
+
+
+@log_call
+def init_hook_epsilon_path_cuts_empty(
+    state: ProcessingState,
+) -> None:
+    """Init hook function to initialize the cuts of the epsilon path.
+
+    No cut is known yet for any of the approximation thresholds computed by
+    :func:`init_hook_epsilon_path_approx_thresholds`.
+
+    Args:
+        state: An object representing the processing state.
+    """
+    state.set_values_epsilon_path_cuts(
+        [None] * len(state.get_values_epsilon_path_approx_thresholds())
     )
-    state.set_values_disorder_score_base(disorder_stats.base)
-    state.set_values_disorder_score_total(disorder_stats.total)
-    if disorder_stats.approx_threshold is not None:
-        state.set_values_disorder_score_approx_threshold(
-            disorder_stats.approx_threshold
-        )
 
 
 @log_call
@@ -149,5 +234,140 @@ def init_hook_current_approx_threshold(
             values=state.get_values_y(),
             values_count=state.get_values_y_count(),
             disorder_fun=state.get_config_disorder_fun(),
+            weights=get_values_weights_or_none(state),
         )
         state.set_values_disorder_score_approx_threshold(approx_threshold)
+
+
+@log_call
+def init_hook_active_objs(
+    state: ProcessingState,
+) -> None:
+    """Init hook function to start tracking objects of impure groups only.
+
+    The hook is active only if the ``shrink_pure_groups`` config flag is set to
+    :obj:`True`. In such a case, objects from decision-homogeneous groups of the
+    current group index are dropped and the remaining (active) objects are tracked
+    in the ``state``. From then on, the group index stored in the ``state``
+    describes the active objects only, so that hooks splitting and scoring groups
+    touch only the objects that can still contribute to the disorder score.
+
+    Args:
+        state: An object representing the processing state.
+    """
+    if (
+        state.is_set_config_shrink_pure_groups()
+        and state.get_config_shrink_pure_groups() is True
+    ):
+        shrink_to_impure_groups(
+            state,
+            state.get_values_group_index(),
+            np.arange(len(state.get_values_y())),
+        )
+
+
+@log_call
+def init_hook_track_disorder(
+    state: ProcessingState,
+) -> None:
+    """Init hook function to start incremental disorder tracking.
+
+    The hook is active only if the ``track_disorder`` config flag is set to
+    :obj:`True`. In such a case, disorder tracking (cf.
+    :meth:`~skrough.structs.group_index.GroupIndex.track_disorder`) is enabled for
+    the group index stored in the ``state``, so that the group indices obtained from
+    it by consecutive splits maintain their disorder score incrementally and the stop
+    checks read it instead of recomputing the decision distribution. Every split then
+    updates the tracked contributions as well, which pays off only when the stop
+    checks are expensive compared to the splits.
+
+    The disorder measure should be a ``numba``-compiled sum of independent per-group
+    terms, which are zero for decision-homogeneous groups, as it is for all measures
+    from :mod:`skrough.disorder_measures`. Otherwise, the stop decisions are wrong,
+    so tracking should not be enabled for any other measure.
+
+    Tracking is not started when the processing is restricted to a subset of objects
+    (result objects or active objects), as the stop checks then score other decision
+    values, nor when the objects are weighted.
+
+    Args:
+        state: An object representing the processing state.
+    """
+    if (
+        not state.is_set_config_track_disorder()
+        or state.get_config_track_disorder() is not True
+        or state.is_set_values_result_objs()
+        or state.is_set_values_active_objs()
+        or state.is_set_values_weights()
+    ):
+        return
+    state.get_values_group_index().track_disorder(
+        values=state.get_values_y(),
+        values_count=state.get_values_y_count(),
+        disorder_fun=state.get_config_disorder_fun(),
+    )
+
+
+@log_call
+def init_hook_daar_permutations_bank(
+    state: ProcessingState,
+) -> None:
+    """Init hook function to prepare a bank of object permutations for DAAR probes.
+
+    The hook is active only if the ``daar_permutations_bank_size`` config value is
+    set. In such a case, the given number of random permutations of all objects is
+    drawn once (using the random generator of the ``state``) and stored in the
+    ``state`` as a compact ``int32`` matrix (one permutation per row). DAAR probes
+    then gather the shuffled attribute values through the bank permutations instead
+    of drawing fresh permutations for every probe of every candidate attribute.
+
+    Statistical caveats: probes of the same attribute are independent only as long
+    as they use different bank permutations, i.e., a bank smaller than the
+    ``daar_probes_count`` config value reuses permutations within a single check and
+    therefore reduces the effective number of probes. Moreover, the same
+    permutations are reused across candidate attributes and iterations, so the
+    outcomes of the checks are no longer independent of each other.
+
+    Args:
+        state: An object representing the processing state.
+    """
+    if not state.is_set_config_daar_permutations_bank_size():
+        return
+    bank_size = state.get_config_daar_permutations_bank_size()
+    if bank_size < 1:
+        raise ValueError("Permutations bank size should be a positive number")
+    n_objs = len(state.get_values_x())
+    dtype = np.int32 if n_objs <= np.iinfo(np.int32).max else np.int64
+    bank = state.get_rng().permuted(
+        np.tile(np.arange(n_objs, dtype=dtype), (bank_size, 1)),
+        axis=1,
+    )
+    state.set_values_daar_permutations_bank(bank)
+
+
+@log_call
+def init_hook_partition_cache(
+    state: ProcessingState,
+) -> None:
+    """Init hook function to prepare a cache of group indices for the processing run.
+
+    The hook is active only if the ``partition_cache_max_bytes`` config value is set.
+    In such a case, an empty :class:`~skrough.structs.partition_cache.PartitionCache`
+    with the given memory budget is stored in the ``state``. Hooks building group
+    indices induced by attribute sets (cf.
+    :func:`~skrough.algorithms.hooks.helpers.get_group_index_for_attrs`) then reuse
+    the group indices already built in the run. The cache collects hit, miss and
+    eviction counters (cf.
+    :class:`~skrough.structs.partition_cache.PartitionCacheStats`).
+
+    The hook should be run for every processing run separately, i.e., not as a shared
+    init hook, so that the cache is not shared by concurrent runs.
+
+    Args:
+        state: An object representing the processing state.
+    """
+    if not state.is_set_config_partition_cache_max_bytes():
+        return
+    state.set_values_partition_cache(
+        PartitionCache(max_bytes=state.get_config_partition_cache_max_bytes())
+    )
@@ -1,8 +1,13 @@
 import logging
 
 import skrough.typing as rght
-from skrough.algorithms.hooks.helpers import check_if_below_approx_threshold
+from skrough.algorithms.hooks.helpers import (
+    check_if_below_approx_threshold,
+    get_group_index_for_attrs,
+    shrink_to_impure_groups,
+)
 from skrough.logs import log_call
+from skrough.partitions import reduce_attrs_sequentially
 from skrough.structs.state import ProcessingState
 
 logger = logging.getLogger(__name__)
@@ -18,13 +23,24 @@ def inner_process_hook_add_first_attr(
         elements = elements[1:]
         state.get_values_result_attrs().append(int(attr))
         group_index = state.get_values_group_index()
-        state.set_values_group_index(
-            group_index.split(
-                values=state.get_values_x()[:, attr],
-                values_count=int(state.get_values_x_counts()[attr]),
+        values = state.get_values_x()[:, attr]
+        values_count = int(state.get_values_x_counts()[attr])
+        if state.is_set_values_active_objs():
+            active_objs = state.get_values_active_objs()
+            group_index = group_index.split(
+                values=values[active_objs],
+                values_count=values_count,
                 compress=True,
             )
-        )
+            shrink_to_impure_groups(state, group_index, active_objs)
+        else:
+            state.set_values_group_index(
+                group_index.split(
+                    values=values,
+                    values_count=values_count,
+                    compress=True,
+                )
+            )
     return elements
 
 
@@ -35,15 +51,64 @@ def inner_process_hook_discard_first_attr_approx_threshold(
     attr = elements[0]
     elements = elements[1:]
     attrs_to_try = [a for a in state.get_values_result_attrs() if a != attr]
-    x = state.get_values_x()
-    x_counts = state.get_values_x_counts()
-    if state.is_set_values_result_objs():
-        x = x[state.get_values_result_objs()]
-    group_index = state.get_group_index_class().from_data(
-        x=x,
-        x_counts=x_counts,
+    group_index = get_group_index_for_attrs(
+        state,
         attrs=attrs_to_try,
+        objs=(
+            state.get_values_result_objs()
+            if state.is_set_values_result_objs()
+            else None
+        ),
     )
     if check_if_below_approx_threshold(state, group_index):
         state.set_values_result_attrs(attrs_to_try)
     return elements
+
+
+@log_call
+def inner_process_hook_discard_attrs_approx_threshold(
+    state: ProcessingState,
+    elements: rght.Elements,
+) -> rght.Elements:
+    """Try to discard all the given attrs one by one, keeping the approx threshold.
+
+    The attrs are processed in the given order, exactly as by consecutive calls of
+    :func:`inner_process_hook_discard_first_attr_approx_threshold`, but the group
+    indices induced by the result attrs with a single attr left out are obtained by
+    the leave-one-out refinement from :func:`skrough.partitions.reduce_attrs_sequentially`
+    instead of being built from scratch for every attr.
+
+    Args:
+        state: State object that holds the computation's state.
+        elements: Attrs to be tried for removal, in the order of processing.
+
+    Returns:
+        An empty collection, as all the given elements are processed.
+    """
+    result_attrs = state.get_values_result_attrs()
+    elements = [int(attr) for attr in elements]
+    objs = state.get_values_result_objs() if state.is_set_values_result_objs() else None
+    x = state.get_values_x()
+    x_counts = state.get_values_x_counts()
+    if objs is not None:
+        x = x[objs]
+    elements_set = set(elements)
+    group_index = get_group_index_for_attrs(
+        state,
+        attrs=[attr for attr in result_attrs if attr not in elements_set],
+        objs=objs,
+    )
+    kept = reduce_attrs_sequentially(
+        x,
+        x_counts,
+        elements,
+        is_removable=lambda _, group_index: check_if_below_approx_threshold(
+            state, group_index
+        ),
+        group_index=group_index,
+    )
+    removed = elements_set.difference(kept)
+    state.set_values_result_attrs(
+        [attr for attr in result_attrs if attr not in removed]
+    )
+    return []
@@ -1,35 +1,389 @@
+import heapq
 import logging
+import math
 
 import numpy as np
 
 import skrough.typing as rght
+from skrough.algorithms.hooks.helpers import get_values_weights_or_none
 from skrough.logs import log_call
+from skrough.permutations import get_stratified_objs_permutation
 from skrough.structs.group_index import GroupIndex
 from skrough.structs.state import ProcessingState
+from skrough.unify import unify_index_list
+from skrough.unique import get_uniques_and_compacted
 
 logger = logging.getLogger(__name__)
 
 
+DEFAULT_SUCCESSIVE_HALVING_KEEP_FRACTION = 0.5
+
+
+def _get_disorder_scores_after_splits(
+    state: ProcessingState,
+    group_index: GroupIndex,
+    attrs: np.ndarray,
+    objs: np.ndarray | None = None,
+) -> np.ndarray:
+    """Score splits of ``group_index`` describing ``objs`` (active or all by default)."""
+    x = state.get_values_x()
+    x_counts = state.get_values_x_counts()
+    y = state.get_values_y()
+    weights = get_values_weights_or_none(state)
+    scored_attrs = attrs
+    if objs is None and state.is_set_values_active_objs():
+        # the group index covers only the active objects; for the built-in
+        # disorder measures, scores computed on them differ from the full ones
+        # by a common factor only, so the order of candidates is preserved
+        objs = state.get_values_active_objs()
+    if objs is not None:
+        x = x[np.ix_(objs, attrs)]
+        x_counts = x_counts[attrs]
+        y = y[objs]
+        if weights is not None:
+            weights = weights[objs]
+        scored_attrs = np.arange(len(attrs))
+    return group_index.get_disorder_scores_after_splits(
+        x=x,
+        x_counts=x_counts,
+        attrs=scored_attrs,
+        values=y,
+        values_count=state.get_values_y_count(),
+        disorder_fun=state.get_config_disorder_fun(),
+        weights=weights,
+    )
+
+
 @log_call
 def select_hook_attrs_disorder_score_based(
     state: ProcessingState,
     elements: rght.Elements,
 ) -> rght.Elements:
+    attrs = unify_index_list(elements)
+    scores = _get_disorder_scores_after_splits(
+        state,
+        state.get_values_group_index(),
+        attrs,
+    )
+    # find indices for which the scores are the lowest, ties are broken by the
+    # order of candidates
+    attrs_count = state.get_config_select_attrs_disorder_score_based_max_count()
+    selected_attrs_idx = np.argsort(scores, kind="stable")[:attrs_count]
+    return attrs[selected_attrs_idx]
+
+
+def _get_successive_halving_sample(
+    state: ProcessingState,
+    group_index: GroupIndex,
+    sample_size: int,
+) -> tuple[np.ndarray, GroupIndex]:
+    """Get objects of a sample of the given size and the group index restricted to them.
+
+    Samples are prefixes of a permutation of all objects stratified by the decision,
+    which is drawn once and kept in the ``state``, so that the samples of consecutive
+    rounds are nested. When the group index covers the active objects only, the
+    inactive ones are skipped. The restricted group indices are kept in the ``state``
+    as long as the ``group_index`` stays the same.
+    """
+    if not state.is_set_values_successive_halving_order():
+        state.set_values_successive_halving_order(
+            get_stratified_objs_permutation(state.get_values_y(), seed=state.get_rng())
+        )
+    if (
+        not state.is_set_values_successive_halving_group_index()
+        or state.get_values_successive_halving_group_index() is not group_index
+    ):
+        state.set_values_successive_halving_group_index(group_index)
+        state.set_values_successive_halving_samples({})
+    samples = state.get_values_successive_halving_samples()
+    if sample_size not in samples:
+        # positions of the sampled objects in the group index
+        positions = state.get_values_successive_halving_order()
+        if state.is_set_values_active_objs():
+            active_objs = state.get_values_active_objs()
+            active_positions = np.full(len(state.get_values_y()), -1, dtype=np.int64)
+            active_positions[active_objs] = np.arange(len(active_objs))
+            positions = active_positions[positions]
+            positions = positions[positions >= 0][:sample_size]
+            objs = active_objs[positions]
+        else:
+            positions = positions[:sample_size]
+            objs = positions
+        _, group_ids = get_uniques_and_compacted(group_index.index[positions])
+        samples[sample_size] = (
+            objs,
+            state.get_group_index_class().from_index(group_ids),
+        )
+    return samples[sample_size]
+
+
+@log_call
+def select_hook_attrs_disorder_score_based_successive_halving(
+    state: ProcessingState,
+    elements: rght.Elements,
+) -> rght.Elements:
+    """Select hook function choosing attrs by disorder score, screening on subsamples.
+
+    The candidates are first scored on a small sample of objects (of the
+    ``successive_halving_initial_sample_size`` config size), stratified by the
+    decision. Only the best ``successive_halving_keep_fraction`` of them (but not
+    fewer than the number of attrs to be selected) survive to the next round, which
+    scores them on a twice larger sample. The rounds are repeated until the sample
+    would cover all objects or there are no more candidates than attrs to be selected.
+    The survivors are finally scored on all objects and selected as in
+    :func:`select_hook_attrs_disorder_score_based`.
+
+    The samples of consecutive rounds are nested prefixes of a stratified permutation
+    of objects drawn once (using the random generator of the ``state``), and the group
+    indices restricted to the samples are kept in the ``state`` and reused until the
+    group index of the ``state`` changes. A good candidate may be dropped when it
+    looks bad on a small sample, so the selected attrs may differ from the ones
+    selected by :func:`select_hook_attrs_disorder_score_based`.
+
+    Args:
+        state: An object representing the processing state.
+        elements: Candidate attrs.
+
+    Returns:
+        The selected attrs, in the order of increasing scores.
+    """
+    sample_size = state.get_config_successive_halving_initial_sample_size()
+    if sample_size < 1:
+        raise ValueError("Initial sample size should be a positive number")
+    keep_fraction = state.get_config_successive_halving_keep_fraction(
+        default=DEFAULT_SUCCESSIVE_HALVING_KEEP_FRACTION
+    )
+    if not 0 < keep_fraction < 1:
+        raise ValueError("Keep fraction should be between 0 and 1 (exclusively)")
+    group_index: GroupIndex = state.get_values_group_index()
+    attrs = unify_index_list(elements)
+    attrs_count = state.get_config_select_attrs_disorder_score_based_max_count()
+    if attrs_count < 1:
+        return attrs[:0]
+    candidates_idx = np.arange(len(attrs))
+    while sample_size < group_index.n_objs and len(candidates_idx) > attrs_count:
+        objs, sample_group_index = _get_successive_halving_sample(
+            state,
+            group_index,
+            sample_size,
+        )
+        scores = _get_disorder_scores_after_splits(
+            state,
+            sample_group_index,
+            attrs[candidates_idx],
+            objs,
+        )
+        keep_count = max(attrs_count, math.ceil(len(candidates_idx) * keep_fraction))
+        logger.debug("Sample of %d objects keeps %d candidates", len(objs), keep_count)
+        # survivors keep the order of candidates, which breaks ties in the end
+        candidates_idx = np.sort(
+            candidates_idx[np.argsort(scores, kind="stable")[:keep_count]]
+        )
+        sample_size *= 2
+    scores = _get_disorder_scores_after_splits(
+        state,
+        group_index,
+        attrs[candidates_idx],
+    )
+    selected_attrs_idx = candidates_idx[np.argsort(scores, kind="stable")[:attrs_count]]
+    return attrs[selected_attrs_idx]
+
+
+@log_call
+def select_hook_attrs_disorder_score_based_early_abort(
+    state: ProcessingState,
+    elements: rght.Elements,
+) -> rght.Elements:
+    """Select hook function choosing attrs by disorder score, aborting hopeless ones.
+
+    The hook selects attrs as :func:`select_hook_attrs_disorder_score_based` does
+    but the candidates are scored one by one, with
+    :meth:`~skrough.structs.group_index.GroupIndexProtocol.get_disorder_score_after_split`.
+    Scores computed one by one may differ from the ones computed for a block of
+    candidates in the last bits, so candidates with tied scores may be selected
+    differently, i.e., the selected attrs have the same scores up to rounding errors
+    but they are not necessarily the same attrs. Once as many candidates as are to be
+    selected have been scored, the worst of the best scores found so far is passed as
+    the ``abort_above`` bound, so that the group index may stop accumulating the score
+    of a candidate as soon as the candidate cannot be selected anymore. Whether the
+    scan is actually cut short depends on the group index implementation - the ones
+    computing the disorder score group by group (e.g.,
+    :class:`~skrough.structs.group_index.GroupIndexCSR`) stop early, the other ones
+    compute the exact score anyway.
+
+    The number of candidate evaluations that exceeded the bound is accumulated in the
+    ``state`` (cf.
+    :meth:`~skrough.structs.state.ProcessingState.get_values_aborted_evaluations_count`).
+
+    Args:
+        state: An object representing the processing state.
+        elements: Candidate attrs.
+
+    Returns:
+        The selected attrs, in the order of increasing scores.
+    """
     group_index: GroupIndex = state.get_values_group_index()
-    scores = np.fromiter(
-        (
-            group_index.get_disorder_score_after_split(
-                split_values=state.get_values_x()[:, i],
-                split_values_count=int(state.get_values_x_counts()[i]),
-                values=state.get_values_y(),
-                values_count=state.get_values_y_count(),
-                disorder_fun=state.get_config_disorder_fun(),
-            )
-            for i in elements
-        ),
-        dtype=float,
+    attrs = unify_index_list(elements)
+    x = state.get_values_x()
+    x_counts = state.get_values_x_counts()
+    y = state.get_values_y()
+    y_count = state.get_values_y_count()
+    disorder_fun = state.get_config_disorder_fun()
+    scored_attrs = attrs
+    if state.is_set_values_active_objs():
+        # cf. select_hook_attrs_disorder_score_based
+        active_objs = state.get_values_active_objs()
+        x = x[np.ix_(active_objs, attrs)]
+        x_counts = x_counts[attrs]
+        y = y[active_objs]
+        scored_attrs = np.arange(len(attrs))
+
+    attrs_count = state.get_config_select_attrs_disorder_score_based_max_count()
+    if attrs_count < 1:
+        return attrs[:0]
+    # the best candidates found so far, with the worst one at the top of the heap;
+    # entries: (negated score, negated candidate position)
+    best: list[tuple[float, int]] = []
+    aborted_evaluations_count = 0
+    for i, attr in enumerate(scored_attrs):
+        abort_above = -best[0][0] if len(best) == attrs_count else None
+        score = group_index.get_disorder_score_after_split(
+            split_values=x[:, attr],
+            split_values_count=int(x_counts[attr]),
+            values=y,
+            values_count=y_count,
+            disorder_fun=disorder_fun,
+            abort_above=abort_above,
+        )
+        if abort_above is None:
+            heapq.heappush(best, (-score, -i))
+        elif score < abort_above:
+            # ties are broken by the order of candidates, so a later candidate
+            # has to be strictly better to replace the worst one
+            heapq.heapreplace(best, (-score, -i))
+        elif score > abort_above:
+            aborted_evaluations_count += 1
+    logger.debug("Aborted evaluations = %d", aborted_evaluations_count)
+    state.set_values_aborted_evaluations_count(
+        state.get_values_aborted_evaluations_count(default=0)
+        + aborted_evaluations_count
     )
-    # find indices for which the scores are the lowest
+    selected_attrs_idx = [
+        i for _, i in sorted((-neg_score, -neg_i) for neg_score, neg_i in best)
+    ]
+    return attrs[np.asarray(selected_attrs_idx, dtype=np.int64)]
+
+
+@log_call
+def select_hook_attrs_disorder_score_based_lazy(
+    state: ProcessingState,
+    elements: rght.Elements,
+) -> rght.Elements:
+    """Select hook function choosing attrs by disorder score gains, evaluated lazily.
+
+    The hook selects the same attrs as :func:`select_hook_attrs_disorder_score_based`,
+    i.e., the attrs whose splits reduce the disorder score the most, under the
+    assumption that the gain (disorder score reduction) of an attr never grows from
+    one iteration to the next (diminishing returns). Gains computed in the earlier
+    iterations are kept in the ``state`` and serve as upper bounds of the current
+    ones. The candidates are put in a priority queue ordered by these bounds
+    (candidates with no gain computed so far come first) and only the top entries are
+    re-evaluated, until the top one is evaluated in the current iteration - then its
+    gain is not lower than the bounds of all the remaining candidates, so it is
+    selected without evaluating them (cf. the CELF algorithm).
+
+    The assumption does not hold for all data sets, e.g., attrs that determine the
+    decision only together (like in the XOR function) gain more after one of them is
+    added. In such cases, the selected attrs may differ from the ones selected by
+    :func:`select_hook_attrs_disorder_score_based`.
+
+    When only the active objects are kept in the group index (cf.
+    :func:`~skrough.algorithms.hooks.helpers.shrink_to_impure_groups`), the gains are
+    computed on them and rescaled by the ratio of the current disorder score of all
+    objects to the one of the active objects, so that the gains from different
+    iterations stay comparable while the active objects shrink. The rescaled gains are
+    exact for disorder measures in which the number of objects is only a common factor
+    of the per-group terms, as it is for all measures from
+    :mod:`skrough.disorder_measures`. For other measures, the bounds kept from the
+    earlier iterations are approximate.
+
+    The number of evaluations saved, compared to scoring all the candidates, is
+    accumulated in the ``state`` (cf.
+    :meth:`~skrough.structs.state.ProcessingState.get_values_lazy_greedy_saved_evaluations_count`).
+
+    Args:
+        state: An object representing the processing state.
+        elements: Candidate attrs.
+
+    Returns:
+        The selected attrs, in the order of decreasing gains.
+    """
+    group_index: GroupIndex = state.get_values_group_index()
+    attrs = unify_index_list(elements)
+    x = state.get_values_x()
+    x_counts = state.get_values_x_counts()
+    y = state.get_values_y()
+    y_count = state.get_values_y_count()
+    disorder_fun = state.get_config_disorder_fun()
+    scored_attrs = attrs
+    if state.is_set_values_active_objs():
+        # gains computed on the active objects only are rescaled to all objects,
+        # so that they stay comparable when the active objects shrink
+        active_objs = state.get_values_active_objs()
+        x = x[np.ix_(active_objs, attrs)]
+        x_counts = x_counts[attrs]
+        distribution = group_index.get_distribution(
+            values=y[active_objs],
+            values_count=y_count,
+        )
+        y = y[active_objs]
+        current_score = disorder_fun(distribution, len(active_objs))
+        full_score = disorder_fun(distribution, len(state.get_values_y()))
+        scale = full_score / current_score if current_score > 0 else 0.0
+        scored_attrs = np.arange(len(attrs))
+    else:
+        current_score = group_index.get_tracked_disorder_score(
+            values=y,
+            values_count=y_count,
+            disorder_fun=disorder_fun,
+        )
+        scale = 1.0
+
+    gains = (
+        dict(state.get_values_lazy_greedy_gains())
+        if state.is_set_values_lazy_greedy_gains()
+        else {}
+    )
+    # entries: (negated gain or its bound, candidate position, is evaluated)
+    queue = [
+        (-gains.get(int(attr), math.inf), i, False) for i, attr in enumerate(attrs)
+    ]
+    heapq.heapify(queue)
     attrs_count = state.get_config_select_attrs_disorder_score_based_max_count()
-    selected_attrs_idx = np.argsort(scores)[:attrs_count]
-    return np.asarray(elements)[selected_attrs_idx]
+    selected_attrs_idx: list[int] = []
+    evaluations_count = 0
+    while queue and len(selected_attrs_idx) < attrs_count:
+        _, i, is_evaluated = heapq.heappop(queue)
+        if is_evaluated:
+            selected_attrs_idx.append(i)
+            continue
+        score = group_index.get_disorder_scores_after_splits(
+            x=x,
+            x_counts=x_counts,
+            attrs=scored_attrs[i : i + 1],
+            values=y,
+            values_count=y_count,
+            disorder_fun=disorder_fun,
+        )[0]
+        evaluations_count += 1
+        gain = (current_score - score) * scale
+        gains[int(attrs[i])] = gain
+        heapq.heappush(queue, (-gain, i, True))
+    state.set_values_lazy_greedy_gains(gains)
+    saved_evaluations_count = len(attrs) - evaluations_count
+    logger.debug("Lazy greedy saved evaluations = %d", saved_evaluations_count)
+    state.set_values_lazy_greedy_saved_evaluations_count(
+        state.get_values_lazy_greedy_saved_evaluations_count(default=0)
+        + saved_evaluations_count
+    )
+    return attrs[np.asarray(selected_attrs_idx, dtype=np.int64)]
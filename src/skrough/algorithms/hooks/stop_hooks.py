@@ -57,6 +57,44 @@ def stop_hook_approx_threshold(
     return check_if_below_approx_threshold(state, group_index)
 
 
+@log_call
+def stop_hook_epsilon_path_approx_thresholds(
+    state: ProcessingState,
+) -> bool:
+    """Check if all the approximation thresholds of the epsilon path were reached.
+
+    The function checks the current group index against the approximation thresholds
+    computed for many epsilon values (cf.
+    :func:`~skrough.algorithms.hooks.init_hooks.init_hook_epsilon_path_approx_thresholds`)
+    in the same way as :func:`stop_hook_approx_threshold` does for a single threshold.
+    Whenever a threshold is reached for the first time, the current number of the
+    result attrs is recorded as the cut for the threshold, i.e., the result attrs a
+    process stopped by :func:`stop_hook_approx_threshold` with the given threshold
+    would end with are the prefix of the result attrs of that length.
+
+    Args:
+        state: State object that holds the computation's state.
+
+    Returns:
+        Indication whether all the approximation thresholds are reached.
+    """
+    group_index = state.get_values_group_index()
+    approx_thresholds = state.get_values_epsilon_path_approx_thresholds()
+    cuts = list(state.get_values_epsilon_path_cuts())
+    result_attrs_count = len(state.get_values_result_attrs())
+    # a threshold can be reached only if all the higher ones are reached
+    for i in sorted(range(len(approx_thresholds)), key=lambda i: -approx_thresholds[i]):
+        if cuts[i] is not None:
+            continue
+        if not check_if_below_approx_threshold(
+            state, group_index, approx_threshold=approx_thresholds[i]
+        ):
+            break
+        cuts[i] = result_attrs_count
+    state.set_values_epsilon_path_cuts(cuts)
+    return all(cut is not None for cut in cuts)
+
+
 # TODO: add description for max_count == None ~ no limit
 @log_call
 def stop_hook_attrs_count(
@@ -11,7 +11,7 @@ from skrough.algorithms.meta.describe import (
     autogenerate_description_node,
     describe,
 )
-from skrough.algorithms.meta.helpers import normalize_sequence
+from skrough.algorithms.meta.helpers import call_profiled, normalize_sequence
 from skrough.logs import log_call
 from skrough.structs.state import ProcessingState
 
@@ -48,7 +48,10 @@ class StopHooksAggregate(AggregateMixin):
         state: ProcessingState,
         raise_loop_break: bool,
     ) -> bool:
-        result = any(stop_hook(state) for stop_hook in self.normalized_hooks)
+        result = any(
+            call_profiled(state, str(i), stop_hook, state)
+            for i, stop_hook in enumerate(self.normalized_hooks)
+        )
         if result and raise_loop_break:
             raise LoopBreak()
         return result
@@ -75,8 +78,8 @@ class InnerStopHooksAggregate(AggregateMixin):
         raise_loop_break: bool,
     ) -> bool:
         result = any(
-            stop_hook(state=state, elements=elements)
-            for stop_hook in self.normalized_hooks
+            call_profiled(state, str(i), stop_hook, state=state, elements=elements)
+            for i, stop_hook in enumerate(self.normalized_hooks)
         )
         if result and raise_loop_break:
             raise LoopBreak()
@@ -101,8 +104,8 @@ class UpdateStateHooksAggregate(AggregateMixin):
         self,
         state: ProcessingState,
     ) -> None:
-        for hook in self.normalized_hooks:
-            hook(state)
+        for i, hook in enumerate(self.normalized_hooks):
+            call_profiled(state, str(i), hook, state)
 
 
 @dataclass
@@ -124,8 +127,8 @@ class ProduceElementsHooksAggregate(AggregateMixin):
         state: ProcessingState,
     ) -> rght.Elements:
         result: list[Any] = []
-        for hook in self.normalized_hooks:
-            result.extend(hook(state))
+        for i, hook in enumerate(self.normalized_hooks):
+            result.extend(call_profiled(state, str(i), hook, state))
         return pd.Series(result).unique()
 
 
@@ -149,8 +152,8 @@ class ProcessElementsHooksAggregate(AggregateMixin):
         elements: rght.Elements,
     ) -> rght.Elements:
         result: list[Any] = []
-        for hook in self.normalized_hooks:
-            result.extend(hook(state, elements))
+        for i, hook in enumerate(self.normalized_hooks):
+            result.extend(call_profiled(state, str(i), hook, state, elements))
         return pd.Series(result).unique()
 
 
@@ -174,6 +177,6 @@ class ChainProcessElementsHooksAggregate(AggregateMixin):
         elements: rght.Elements,
     ) -> rght.Elements:
         result = elements
-        for hook in self.normalized_hooks:
-            result = hook(state, result)
+        for i, hook in enumerate(self.normalized_hooks):
+            result = call_profiled(state, str(i), hook, state, result)
         return result
@@ -1,9 +1,14 @@
 """Helper functions for :mod:`skrough.algorithms.meta` subpackage."""
 
+import contextlib
 import logging
-from typing import Callable, Sequence, TypeVar
+from typing import Any, Callable, Sequence, TypeVar
 
+import joblib
+
+from skrough.algorithms.constants import SHARE_DATA_MAX_NBYTES
 from skrough.logs import log_call
+from skrough.structs.state import ProcessingState
 
 logger = logging.getLogger(__name__)
 
@@ -48,3 +53,89 @@ def normalize_sequence(
     else:
         result = list(items)
     return result
+
+
+def profile_scope(
+    state: ProcessingState, node_name: str
+) -> contextlib.AbstractContextManager[Any]:
+    """Get a context measuring a processing element with the profiler of the state.
+
+    Args:
+        state: An object representing the processing state.
+        node_name: Node name of the measured element.
+
+    Returns:
+        A context of :meth:`~skrough.profiling.Profiler.measure` if a profiler is
+        attached to the ``state`` or a no-op context otherwise.
+    """
+    if not state.is_set_profiler():
+        return contextlib.nullcontext()
+    return state.get_profiler().measure(node_name)
+
+
+def call_profiled(
+    state: ProcessingState,
+    node_name: str,
+    fun: Callable,
+    /,
+    *args,
+    **kwargs,
+):
+    """Call a processing element measuring it with the profiler of the state.
+
+    The element is called with the given arguments. If a profiler is attached to the
+    ``state``, the call is measured under the given ``node_name`` and the number of
+    returned elements is recorded whenever the result is sized (booleans and
+    :obj:`None` returned by stop and update hooks do not count).
+
+    Args:
+        state: An object representing the processing state.
+        node_name: Node name of the called element.
+        fun: The processing element to be called.
+        *args: Positional arguments for ``fun``.
+        **kwargs: Keyword arguments for ``fun``.
+
+    Returns:
+        The result of the call.
+    """
+    if not state.is_set_profiler():
+        return fun(*args, **kwargs)
+    with state.get_profiler().measure(node_name) as record:
+        result = fun(*args, **kwargs)
+        if hasattr(result, "__len__"):
+            record.elements += len(result)
+    return result
+
+
+def get_parallel(
+    n_jobs: int | None,
+    backend: str | None,
+    share_data: bool,
+) -> joblib.Parallel:
+    """Get a :class:`joblib.Parallel` instance running tasks with the given settings.
+
+    With ``share_data`` the automatic memory-mapping of :mod:`joblib` is applied to all
+    arrays passed to the workers, not only to the ones larger than its default
+    threshold, i.e., every array is dumped once per call to a temporary folder
+    (``/dev/shm`` when available) and the workers receive read-only memory-mapped views
+    of it instead of copies. The files are removed by :mod:`joblib` after the call. The
+    setting has no effect for the ``"threading"`` backend, which shares all arrays
+    anyway.
+
+    Args:
+        n_jobs: Number of parallel jobs, cf. :class:`joblib.Parallel`.
+        backend: Parallelization backend, cf. :class:`joblib.Parallel`.
+        share_data: Whether to share all arrays with workers through memory-mapped
+            files.
+
+    Returns:
+        A :class:`joblib.Parallel` instance.
+    """
+    if share_data:
+        return joblib.Parallel(
+            n_jobs=n_jobs,
+            backend=backend,
+            max_nbytes=SHARE_DATA_MAX_NBYTES,
+            mmap_mode="r",
+        )
+    return joblib.Parallel(n_jobs=n_jobs, backend=backend)
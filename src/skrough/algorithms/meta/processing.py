@@ -1,21 +1,32 @@
 # pylint: disable=duplicate-code
 
 import logging
-from dataclasses import dataclass
-from typing import Any, Sequence, cast
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Any, Literal, Sequence
 
 import joblib
 import numpy as np
 
 import skrough.interface
 import skrough.typing as rght
-from skrough.algorithms.constants import RNG_INTEGERS_PARAM
+from skrough.algorithms.constants import (
+    BATCH_SIZE_AUTO_TARGET_SECONDS,
+    BATCH_SIZE_AUTO_TIMED_RUNS,
+    RNG_INTEGERS_PARAM,
+)
 from skrough.algorithms.meta.aggregates import UpdateStateHooksAggregate
 from skrough.algorithms.meta.describe import (
     autogenerate_description_node,
     describe,
 )
-from skrough.algorithms.meta.helpers import normalize_sequence
+from skrough.algorithms.meta.helpers import (
+    call_profiled,
+    get_parallel,
+    normalize_sequence,
+    profile_scope,
+)
 from skrough.algorithms.meta.stage import Stage
 from skrough.logs import log_call
 from skrough.structs.description_node import NODE_META_OPTIONAL_KEY
@@ -24,6 +35,32 @@ from skrough.structs.state import ProcessingState
 logger = logging.getLogger(__name__)
 
 
+def get_auto_batch_size(
+    run_seconds: float,
+    n_runs: int,
+    n_jobs: int | None,
+) -> int:
+    """Choose the number of runs grouped in a single parallel task.
+
+    The batch size is chosen so that a batch lasts at least
+    :const:`~skrough.algorithms.constants.BATCH_SIZE_AUTO_TARGET_SECONDS`, which keeps
+    the scheduling and result passing overhead small compared to the actual work, but
+    it is limited so that every worker still gets at least one batch.
+
+    Args:
+        run_seconds: Measured duration of a single run.
+        n_runs: Number of runs to be batched.
+        n_jobs: Number of parallel jobs, cf. :class:`joblib.Parallel`.
+
+    Returns:
+        Batch size, i.e., a positive integer.
+    """
+    n_workers = max(1, joblib.effective_n_jobs(n_jobs))
+    by_latency = math.ceil(BATCH_SIZE_AUTO_TARGET_SECONDS / max(run_seconds, 1e-9))
+    by_balance = math.ceil(n_runs / n_workers)
+    return max(1, min(by_latency, by_balance))
+
+
 @dataclass
 class ProcessingMultiStage(skrough.interface.Describable):
     init_multi_stage_agg: UpdateStateHooksAggregate
@@ -31,6 +68,12 @@ class ProcessingMultiStage(skrough.interface.Describable):
     stages: Sequence[Stage]
     finalize_agg: UpdateStateHooksAggregate
     prepare_result_fun: skrough.interface.PrepareResultFunction
+    shared_init_agg: UpdateStateHooksAggregate = field(
+        default_factory=lambda: UpdateStateHooksAggregate.from_hooks(None)
+    )
+    """Hooks that are deterministic and independent of the random seed. They run
+    before ``init_multi_stage_agg`` and, in :meth:`call_parallel`, only once for
+    all the runs, which then share the resulting state values."""
 
     @classmethod
     @log_call
@@ -42,8 +85,10 @@ class ProcessingMultiStage(skrough.interface.Describable):
         init_hooks: Sequence[skrough.interface.UpdateStateHook] | None = None,
         stages: Sequence[Stage] | None = None,
         finalize_hooks: Sequence[skrough.interface.UpdateStateHook] | None = None,
+        shared_init_hooks: Sequence[skrough.interface.UpdateStateHook] | None = None,
     ):
         return cls(
+            shared_init_agg=UpdateStateHooksAggregate.from_hooks(shared_init_hooks),
             init_multi_stage_agg=UpdateStateHooksAggregate.from_hooks(
                 init_multi_stage_hooks
             ),
@@ -58,29 +103,44 @@ class ProcessingMultiStage(skrough.interface.Describable):
         self,
         state: ProcessingState,
         seed: rght.Seed = None,
+        run_shared_init: bool = True,
     ) -> Any:
         logger.debug("Set random generator in state")
         if not state.is_set_rng():
             state.set_rng(np.random.default_rng(seed))
 
+        if run_shared_init:
+            logger.debug("Run shared init hooks")
+            call_profiled(state, "shared_init", self.shared_init_agg, state)
+
         logger.debug("Run init state hooks")
-        self.init_multi_stage_agg(state)
+        call_profiled(state, "init_multi_stage", self.init_multi_stage_agg, state)
 
         logger.debug("Run init hooks")
-        self.init_agg(state)
+        call_profiled(state, "init", self.init_agg, state)
 
         logger.debug("Run stages sequentially")
-        for i, stage in enumerate(self.stages):
-            logger.debug("Run stage %d", i)
-            stage(state)
+        with profile_scope(state, "stages"):
+            for i, stage in enumerate(self.stages):
+                logger.debug("Run stage %d", i)
+                call_profiled(state, str(i), stage, state)
 
         logger.debug("Run finalize hooks")
-        self.finalize_agg(state)
+        call_profiled(state, "finalize", self.finalize_agg, state)
 
         logger.debug("Prepare result function")
-        result = self.prepare_result_fun(state)
+        result = call_profiled(state, "prepare_result", self.prepare_result_fun, state)
         return result
 
+    def _run_batch(
+        self,
+        state: ProcessingState,
+        seeds: Sequence[rght.Seed],
+    ) -> list[Any]:
+        return [
+            self(state=state.fork(), seed=seed, run_shared_init=False) for seed in seeds
+        ]
+
     @log_call
     def call_parallel(
         self,
@@ -88,22 +148,101 @@ class ProcessingMultiStage(skrough.interface.Describable):
         state: ProcessingState | None,
         seed: rght.Seed = None,
         n_jobs: int | None = None,
+        share_data: bool = False,
+        batch_size: int | Literal["auto"] | None = None,
+        backend: str | None = None,
     ) -> list[Any]:
+        """Run the processing several times, possibly in parallel.
+
+        Args:
+            n_times: Number of runs.
+            state: Initial state, copied for every run.
+            seed: Seed used to derive the seeds of the consecutive runs.
+            n_jobs: Number of parallel jobs, cf. :class:`joblib.Parallel`.
+            share_data: Whether to share all arrays of the ``state`` with workers
+                through memory-mapped files, cf.
+                :func:`~skrough.algorithms.meta.helpers.get_parallel`.
+            batch_size: Number of runs grouped in a single parallel task. Runs of a
+                batch are executed one after another by the same worker and their
+                results are returned in bulk. ``"auto"`` means to execute the first
+                two runs in the calling process and choose the batch size from the
+                duration of the second one, which is not affected by the compilation
+                of the compiled kernels. :obj:`None` means one task per run. Defaults to
+                :obj:`None`.
+            backend: Parallelization backend, cf. :class:`joblib.Parallel`. With
+                ``"threading"`` the runs share all arrays with no serialization; the
+                compiled kernels release the GIL, so the runs still execute in
+                parallel. :obj:`None` means the default :mod:`joblib` backend.
+                Defaults to :obj:`None`.
+
+        Returns:
+            Results of the consecutive runs.
+        """
+        if batch_size is not None and batch_size != "auto":
+            batch_size = int(batch_size)
+            if batch_size < 1:
+                raise ValueError("Batch size should be a positive number")
         rng = np.random.default_rng(seed)
-        result = joblib.Parallel(n_jobs=n_jobs)(
-            joblib.delayed(self)(
-                state=state,
-                seed=rng.integers(RNG_INTEGERS_PARAM),
+        seeds = [rng.integers(RNG_INTEGERS_PARAM) for _ in range(n_times)]
+        if state is None:
+            state = ProcessingState.from_optional(processing_fun=None)
+        # run seed-independent init once, every run gets its own fork of the
+        # resulting state, which shares the inputs with it
+        state = state.fork()
+        result: list[Any] = []
+        logger.debug("Run shared init hooks")
+        call_profiled(state, "shared_init", self.shared_init_agg, state)
+        if batch_size == "auto":
+            # the first run warms up the compiled kernels, so the batch size is
+            # chosen from the duration of the second one
+            warm_up_seeds = seeds[:BATCH_SIZE_AUTO_TIMED_RUNS]
+            seeds = seeds[BATCH_SIZE_AUTO_TIMED_RUNS:]
+            run_seconds = 0.0
+            for run_seed in warm_up_seeds:
+                start = time.perf_counter()
+                result.extend(self._run_batch(state, [run_seed]))
+                run_seconds = time.perf_counter() - start
+            if len(seeds) == 0:
+                return result
+            batch_size = get_auto_batch_size(
+                run_seconds=run_seconds,
+                n_runs=len(seeds),
+                n_jobs=n_jobs,
             )
-            for _ in range(n_times)
-        )
-        return cast(list[Any], result)
+            logger.debug("Auto batch size = %d", batch_size)
+        if batch_size is None:
+            result.extend(
+                get_parallel(n_jobs, backend, share_data)(
+                    joblib.delayed(self)(
+                        state=state.fork(),
+                        seed=run_seed,
+                        run_shared_init=False,
+                    )
+                    for run_seed in seeds
+                )
+            )
+        else:
+            batches = get_parallel(n_jobs, backend, share_data)(
+                joblib.delayed(self._run_batch)(
+                    state=state,
+                    seeds=seeds[i : i + batch_size],
+                )
+                for i in range(0, len(seeds), batch_size)
+            )
+            for batch in batches:
+                result.extend(batch)
+        return result
 
     def get_description_graph(self):
         result = autogenerate_description_node(
             processing_element=self, process_docstring=True
         )
         result.children = [
+            describe(
+                self.shared_init_agg,
+                override_node_name="shared_init",
+                override_node_meta={NODE_META_OPTIONAL_KEY: True},
+            ),
             describe(
                 self.init_multi_stage_agg,
                 override_node_name="init_multi_stage",
@@ -130,6 +269,7 @@ class ProcessingMultiStage(skrough.interface.Describable):
 
     def _get_children_processing_elements(self):
         return [
+            self.shared_init_agg,
             self.init_multi_stage_agg,
             self.init_agg,
             *self.stages,
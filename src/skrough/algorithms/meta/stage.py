@@ -16,6 +16,7 @@ from skrough.algorithms.meta.describe import (
     autogenerate_description_node,
     describe,
 )
+from skrough.algorithms.meta.helpers import call_profiled, profile_scope
 from skrough.logs import log_call
 from skrough.structs.description_node import NODE_META_OPTIONAL_KEY, DescriptionNode
 from skrough.structs.state import ProcessingState
@@ -73,52 +74,80 @@ class Stage(skrough.interface.Describable):
     @log_call
     def __call__(self, state: ProcessingState) -> None:
         logger.debug("Run init hooks")
-        self.init_agg(state)
+        call_profiled(state, "init", self.init_agg, state)
 
         try:
             logger.debug("Check stop_hooks on start")
-            self.stop_agg(state, raise_loop_break=True)
+            call_profiled(
+                state, "check_stop", self.stop_agg, state, raise_loop_break=True
+            )
 
-            while True:
-                logger.debug("Run pre_candidates_hooks")
-                pre_candidates = self.pre_candidates_agg(state)
+            with profile_scope(state, "outer_loop"):
+                self._run_outer_loop(state)
 
-                logger.debug("Run candidates_hooks")
-                candidates = self.candidates_agg(state, pre_candidates)
+        except LoopBreak:
+            logger.debug("Break outer loop")
+
+        logger.debug("Run finalize_hooks")
+        call_profiled(state, "finalize", self.finalize_agg, state)
+
+    def _run_outer_loop(self, state: ProcessingState) -> None:
+        while True:
+            logger.debug("Run pre_candidates_hooks")
+            pre_candidates = call_profiled(
+                state, "pre_candidates", self.pre_candidates_agg, state
+            )
+
+            logger.debug("Run candidates_hooks")
+            candidates = call_profiled(
+                state, "candidates", self.candidates_agg, state, pre_candidates
+            )
 
-                logger.debug("Run select_hooks")
-                selected = self.select_agg(state, candidates)
+            logger.debug("Run select_hooks")
+            selected = call_profiled(
+                state, "select", self.select_agg, state, candidates
+            )
 
-                logger.debug("Run verify_hooks")
-                filtered = self.filter_agg(state, selected)
+            logger.debug("Run verify_hooks")
+            filtered = call_profiled(state, "filter", self.filter_agg, state, selected)
 
-                logger.debug("Run inner_init_hooks")
-                elements = self.inner_init_agg(state, filtered)
+            logger.debug("Run inner_init_hooks")
+            elements = call_profiled(
+                state, "inner_init", self.inner_init_agg, state, filtered
+            )
 
-                should_check_stop_after = True
+            should_check_stop_after = True
 
+            with profile_scope(state, "inner_loop"):
                 while True:
                     logger.debug("Check inner_stop_hooks")
-                    if self.inner_stop_agg(state, elements, raise_loop_break=False):
+                    if call_profiled(
+                        state,
+                        "inner_check_stop",
+                        self.inner_stop_agg,
+                        state,
+                        elements,
+                        raise_loop_break=False,
+                    ):
                         logger.debug("Break inner loop")
                         break
 
                     logger.debug("Run inner_process_hooks")
-                    elements = self.inner_process_agg(state, elements)
+                    elements = call_profiled(
+                        state, "inner_process", self.inner_process_agg, state, elements
+                    )
 
                     logger.debug("Check stop_hooks in inner loop")
-                    self.stop_agg(state, raise_loop_break=True)
+                    call_profiled(
+                        state, "check_stop", self.stop_agg, state, raise_loop_break=True
+                    )
                     should_check_stop_after = False
 
-                if should_check_stop_after:
-                    logger.debug("Check stop_hooks on inner loop exit")
-                    self.stop_agg(state, raise_loop_break=True)
-
-        except LoopBreak:
-            logger.debug("Break outer loop")
-
-        logger.debug("Run finalize_hooks")
-        self.finalize_agg(state)
+            if should_check_stop_after:
+                logger.debug("Check stop_hooks on inner loop exit")
+                call_profiled(
+                    state, "check_stop", self.stop_agg, state, raise_loop_break=True
+                )
 
     def get_description_graph(self):
         result = autogenerate_description_node(
@@ -1,28 +1,91 @@
 # pylint: disable=duplicate-code
 
+from collections.abc import Sequence
+from typing import Literal
+
+import skrough.interface
 import skrough.typing as rght
 from skrough.algorithms import hooks
 from skrough.algorithms.meta import processing
-from skrough.algorithms.reusables.attrs_daar import attrs_daar_stage
-from skrough.algorithms.reusables.attrs_greedy import attrs_greedy_stage
+from skrough.algorithms.meta.stage import Stage
+from skrough.algorithms.reusables.attrs_daar import (
+    attrs_daar_stage,
+    attrs_daar_successive_halving_stage,
+)
+from skrough.algorithms.reusables.attrs_greedy import (
+    attrs_greedy_early_abort_stage,
+    attrs_greedy_epsilon_path_stage,
+    attrs_greedy_lazy_stage,
+    attrs_greedy_stage,
+    attrs_greedy_successive_halving_stage,
+)
 from skrough.algorithms.reusables.attrs_reduction import attrs_reduction_stage
-from skrough.dataprep import prepare_factorized_array, prepare_factorized_vector
+from skrough.profiling import Profiler
+from skrough.structs.attrs_subset import AttrsSubset
+from skrough.structs.decision_table import DecisionTable
 from skrough.structs.group_index import resolve_group_index_class
 from skrough.structs.group_index._protocol import GroupIndexProtocol
 from skrough.structs.state import ProcessingState
 
-_get_approx_reduct_greedy_heuristic = processing.ProcessingMultiStage.from_hooks(
-    init_multi_stage_hooks=[
-        hooks.init_hooks.init_hook_pass_data,
-        hooks.init_hooks.init_hook_single_group_index,
-        hooks.init_hooks.init_hook_result_attrs_empty,
-        hooks.init_hooks.init_hook_epsilon_approx_threshold,
-    ],
-    stages=[attrs_greedy_stage, attrs_reduction_stage],
-    finalize_hooks=None,
-    prepare_result_fun=hooks.prepare_result_hooks.prepare_result_hook_attrs_subset,
+
+def _create_attrs_reduct_processing(
+    attrs_stage: Stage,
+    shared_init_hooks: Sequence[skrough.interface.UpdateStateHook],
+    extra_init_multi_stage_hooks: Sequence[skrough.interface.UpdateStateHook] = (),
+) -> processing.ProcessingMultiStage:
+    """Create a reduct computation growing attrs by ``attrs_stage`` and reducing them.
+
+    The variants of the reduct computations differ only in the stage adding attrs
+    and in the hooks initializing the ``state``, the remaining hooks are common.
+    """
+    return processing.ProcessingMultiStage.from_hooks(
+        shared_init_hooks=shared_init_hooks,
+        init_multi_stage_hooks=[
+            hooks.init_hooks.init_hook_single_group_index,
+            hooks.init_hooks.init_hook_result_attrs_empty,
+            *extra_init_multi_stage_hooks,
+            hooks.init_hooks.init_hook_partition_cache,
+        ],
+        stages=[attrs_stage, attrs_reduction_stage],
+        finalize_hooks=None,
+        prepare_result_fun=hooks.prepare_result_hooks.prepare_result_hook_attrs_subset,
+    )
+
+
+_GREEDY_SHARED_INIT_HOOKS = [
+    hooks.init_hooks.init_hook_pass_data,
+    hooks.init_hooks.init_hook_epsilon_approx_threshold,
+]
+
+_get_approx_reduct_greedy_heuristic = _create_attrs_reduct_processing(
+    attrs_greedy_stage, _GREEDY_SHARED_INIT_HOOKS
+)
+_get_approx_reduct_greedy_heuristic_lazy = _create_attrs_reduct_processing(
+    attrs_greedy_lazy_stage, _GREEDY_SHARED_INIT_HOOKS
+)
+_get_approx_reduct_greedy_heuristic_early_abort = _create_attrs_reduct_processing(
+    attrs_greedy_early_abort_stage, _GREEDY_SHARED_INIT_HOOKS
+)
+_get_approx_reduct_greedy_heuristic_successive_halving = (
+    _create_attrs_reduct_processing(
+        attrs_greedy_successive_halving_stage, _GREEDY_SHARED_INIT_HOOKS
+    )
 )
 
+_get_approx_reduct_greedy_heuristic_compiled = (
+    processing.ProcessingMultiStage.from_hooks(
+        shared_init_hooks=[
+            hooks.init_hooks.init_hook_pass_data,
+            hooks.init_hooks.init_hook_epsilon_approx_threshold,
+        ],
+        stages=None,
+        finalize_hooks=[hooks.finalize_hooks.finalize_hook_attrs_greedy_compiled],
+        prepare_result_fun=hooks.prepare_result_hooks.prepare_result_hook_attrs_subset,
+    )
+)
+
+GREEDY_ENGINES = ("hooks", "compiled")
+
 
 def get_approx_reduct_greedy_heuristic(
     x,
@@ -34,46 +97,231 @@ def get_approx_reduct_greedy_heuristic(
     seed: rght.Seed = None,
     n_jobs: int | None = None,
     group_index_class: str | type[GroupIndexProtocol] | None = None,
+    shrink_pure_groups: bool = False,
+    share_data: bool = False,
+    batch_size: int | Literal["auto"] | None = None,
+    backend: str | None = None,
+    profiler: Profiler | None = None,
+    partition_cache_max_bytes: int | None = None,
+    deduplicate: bool = False,
+    engine: Literal["hooks", "compiled"] = "hooks",
+    lazy: bool = False,
+    early_abort: bool = False,
+    successive_halving_sample_size: int | None = None,
+    successive_halving_keep_fraction: float | None = None,
 ):
-    x, x_counts = prepare_factorized_array(x)
-    y, y_count = prepare_factorized_vector(y)
+    if engine not in GREEDY_ENGINES:
+        raise ValueError(f"Unknown engine {engine!r}. Choose from: {GREEDY_ENGINES}.")
+    if lazy and engine == "compiled":
+        raise ValueError(
+            "Lazy candidate evaluation is not supported by the compiled engine"
+        )
+    if early_abort and engine == "compiled":
+        raise ValueError("Early abort is not supported by the compiled engine")
+    if early_abort and lazy:
+        raise ValueError(
+            "Early abort cannot be combined with lazy candidate evaluation"
+        )
+    if successive_halving_sample_size is not None and (
+        engine == "compiled" or lazy or early_abort
+    ):
+        raise ValueError(
+            "Successive halving cannot be combined with the compiled engine, "
+            "lazy candidate evaluation or early abort"
+        )
+
+    data = DecisionTable.from_data_like(x, y, deduplicate=deduplicate)
+    if data.weights is not None and (
+        engine == "compiled"
+        or lazy
+        or early_abort
+        or successive_halving_sample_size is not None
+    ):
+        raise ValueError(
+            "Weighted objects cannot be combined with the compiled engine, lazy "
+            "candidate evaluation, early abort or successive halving"
+        )
 
     state = ProcessingState.from_optional(
         processing_fun=None,
         rng=None,
+        profiler=profiler,
     )
-    state.set_input_data_x(x)
-    state.set_input_data_x_counts(x_counts)
-    state.set_input_data_y(y)
-    state.set_input_data_y_count(y_count)
+    state.set_input_data_x(data.x)
+    state.set_input_data_x_counts(data.x_counts)
+    state.set_input_data_y(data.y)
+    state.set_input_data_y_count(data.y_count)
+    if data.weights is not None:
+        state.set_input_data_weights(data.weights)
     state.set_config_disorder_fun(disorder_fun)
     state.set_config_epsilon(epsilon)
     state.set_config_select_attrs_disorder_score_based_max_count(1)
     if candidates_count is not None:
         state.set_config_candidates_select_random_max_count(candidates_count)
     state.set_group_index_class(resolve_group_index_class(group_index_class))
+    state.set_config_partition_cache_max_bytes(partition_cache_max_bytes)
+    disorder_score_stats = data.get_disorder_score_stats(
+        disorder_fun, state.get_group_index_class()
+    )
+    state.set_values_disorder_score_base(disorder_score_stats.base)
+    state.set_values_disorder_score_total(disorder_score_stats.total)
+    state.set_config_shrink_pure_groups(shrink_pure_groups)
+    state.set_config_successive_halving_initial_sample_size(
+        successive_halving_sample_size
+    )
+    state.set_config_successive_halving_keep_fraction(successive_halving_keep_fraction)
 
-    result = _get_approx_reduct_greedy_heuristic.call_parallel(
+    if engine == "compiled":
+        processing_multi_stage = _get_approx_reduct_greedy_heuristic_compiled
+    elif lazy:
+        processing_multi_stage = _get_approx_reduct_greedy_heuristic_lazy
+    elif early_abort:
+        processing_multi_stage = _get_approx_reduct_greedy_heuristic_early_abort
+    elif successive_halving_sample_size is not None:
+        processing_multi_stage = _get_approx_reduct_greedy_heuristic_successive_halving
+    else:
+        processing_multi_stage = _get_approx_reduct_greedy_heuristic
+    result = processing_multi_stage.call_parallel(
         n_times=n_reducts,
         state=state,
         seed=seed,
         n_jobs=n_jobs,
+        share_data=share_data,
+        batch_size=batch_size,
+        backend=backend,
     )
     return result
 
 
-_get_approx_reduct_daar_heuristic = processing.ProcessingMultiStage.from_hooks(
-    init_multi_stage_hooks=[
-        hooks.init_hooks.init_hook_pass_data,
-        hooks.init_hooks.init_hook_single_group_index,
-        hooks.init_hooks.init_hook_result_attrs_empty,
-    ],
-    stages=[attrs_daar_stage, attrs_reduction_stage],
+_reduce_epsilon_path_cut = processing.ProcessingMultiStage.from_hooks(
+    stages=[attrs_reduction_stage],
     finalize_hooks=None,
     prepare_result_fun=hooks.prepare_result_hooks.prepare_result_hook_attrs_subset,
 )
 
 
+def _prepare_result_epsilon_path_attrs_subsets(
+    state: ProcessingState,
+) -> list[AttrsSubset]:
+    """Reduce the greedy chain cut at every approximation threshold of the path."""
+    result_attrs = state.get_values_result_attrs()
+    result = []
+    for cut, approx_threshold in zip(
+        state.get_values_epsilon_path_cuts(),
+        state.get_values_epsilon_path_approx_thresholds(),
+    ):
+        cut_state = state.fork()
+        cut_state.set_values_result_attrs(
+            result_attrs[: cut if cut is not None else len(result_attrs)]
+        )
+        cut_state.set_values_disorder_score_approx_threshold(approx_threshold)
+        result.append(_reduce_epsilon_path_cut(state=cut_state, run_shared_init=False))
+    return result
+
+
+_get_approx_reducts_greedy_heuristic_epsilon_path = (
+    processing.ProcessingMultiStage.from_hooks(
+        shared_init_hooks=[
+            hooks.init_hooks.init_hook_pass_data,
+            hooks.init_hooks.init_hook_epsilon_path_approx_thresholds,
+        ],
+        init_multi_stage_hooks=[
+            hooks.init_hooks.init_hook_single_group_index,
+            hooks.init_hooks.init_hook_result_attrs_empty,
+            hooks.init_hooks.init_hook_epsilon_path_cuts_empty,
+            hooks.init_hooks.init_hook_partition_cache,
+        ],
+        stages=[attrs_greedy_epsilon_path_stage],
+        finalize_hooks=None,
+        prepare_result_fun=_prepare_result_epsilon_path_attrs_subsets,
+    )
+)
+
+
+def get_approx_reducts_greedy_heuristic_epsilon_path(
+    x,
+    y,
+    disorder_fun: rght.DisorderMeasure,
+    epsilons: Sequence[float],
+    candidates_count: int | None = None,
+    n_reducts: int = 1,
+    seed: rght.Seed = None,
+    n_jobs: int | None = None,
+    group_index_class: str | type[GroupIndexProtocol] | None = None,
+    shrink_pure_groups: bool = False,
+    share_data: bool = False,
+    batch_size: int | Literal["auto"] | None = None,
+    backend: str | None = None,
+    profiler: Profiler | None = None,
+    partition_cache_max_bytes: int | None = None,
+    deduplicate: bool = False,
+) -> list[list[AttrsSubset]]:
+    """Find approximate reducts for many epsilon values in one greedy run.
+
+    The greedy chain of attributes is grown once, until the approximation threshold
+    of the smallest epsilon is reached, and it is cut at the first attribute for which
+    the threshold of each epsilon is reached. Every cut is then reduced separately.
+    As the chain of a greedy run with a higher epsilon is a prefix of the chain for a
+    lower one, the reducts are the same as the ones obtained by separate calls of
+    :func:`get_approx_reduct_greedy_heuristic` with the same ``seed`` for every epsilon,
+    but the greedy chain is computed only once.
+
+    Returns:
+        One list of reducts for every greedy run, with the reducts given in the order
+        of ``epsilons``.
+    """
+    data = DecisionTable.from_data_like(x, y, deduplicate=deduplicate)
+
+    state = ProcessingState.from_optional(
+        processing_fun=None,
+        rng=None,
+        profiler=profiler,
+    )
+    state.set_input_data_x(data.x)
+    state.set_input_data_x_counts(data.x_counts)
+    state.set_input_data_y(data.y)
+    state.set_input_data_y_count(data.y_count)
+    if data.weights is not None:
+        state.set_input_data_weights(data.weights)
+    state.set_config_disorder_fun(disorder_fun)
+    state.set_config_epsilons(list(epsilons))
+    state.set_config_select_attrs_disorder_score_based_max_count(1)
+    if candidates_count is not None:
+        state.set_config_candidates_select_random_max_count(candidates_count)
+    state.set_group_index_class(resolve_group_index_class(group_index_class))
+    state.set_config_partition_cache_max_bytes(partition_cache_max_bytes)
+    disorder_score_stats = data.get_disorder_score_stats(
+        disorder_fun, state.get_group_index_class()
+    )
+    state.set_values_disorder_score_base(disorder_score_stats.base)
+    state.set_values_disorder_score_total(disorder_score_stats.total)
+    state.set_config_shrink_pure_groups(shrink_pure_groups)
+
+    result = _get_approx_reducts_greedy_heuristic_epsilon_path.call_parallel(
+        n_times=n_reducts,
+        state=state,
+        seed=seed,
+        n_jobs=n_jobs,
+        share_data=share_data,
+        batch_size=batch_size,
+        backend=backend,
+    )
+    return result
+
+
+_DAAR_SHARED_INIT_HOOKS = [hooks.init_hooks.init_hook_pass_data]
+_DAAR_INIT_MULTI_STAGE_HOOKS = [hooks.init_hooks.init_hook_daar_permutations_bank]
+
+_get_approx_reduct_daar_heuristic = _create_attrs_reduct_processing(
+    attrs_daar_stage, _DAAR_SHARED_INIT_HOOKS, _DAAR_INIT_MULTI_STAGE_HOOKS
+)
+_get_approx_reduct_daar_heuristic_successive_halving = _create_attrs_reduct_processing(
+    attrs_daar_successive_halving_stage,
+    _DAAR_SHARED_INIT_HOOKS,
+    _DAAR_INIT_MULTI_STAGE_HOOKS,
+)
+
+
 def get_approx_reduct_daar_heuristic(
     x,
     y,
@@ -84,15 +332,26 @@ def get_approx_reduct_daar_heuristic(
     probes_count: int | None = None,
     smoothing_parameter: float | None = None,
     fast: bool = False,
+    permutations_bank_size: int | None = None,
+    speculative_count: int | None = None,
     n_reducts: int = 1,
     seed: rght.Seed = None,
     n_jobs: int | None = None,
     group_index_class: str | type[GroupIndexProtocol] | None = None,
+    share_data: bool = False,
+    batch_size: int | Literal["auto"] | None = None,
+    backend: str | None = None,
+    profiler: Profiler | None = None,
+    partition_cache_max_bytes: int | None = None,
+    deduplicate: bool = False,
+    successive_halving_sample_size: int | None = None,
+    successive_halving_keep_fraction: float | None = None,
 ):
-    x, x_counts = prepare_factorized_array(x)
-    y, y_count = prepare_factorized_vector(y)
+    data = DecisionTable.from_data_like(x, y, deduplicate=deduplicate)
+    if data.weights is not None and successive_halving_sample_size is not None:
+        raise ValueError("Weighted objects cannot be combined with successive halving")
 
-    n_attrs = max(1, x.shape[1])
+    n_attrs = max(1, data.x.shape[1])
     if allowed_randomness is None:
         allowed_randomness = 1 / n_attrs
     if probes_count is None:
@@ -101,28 +360,46 @@ def get_approx_reduct_daar_heuristic(
     state = ProcessingState.from_optional(
         processing_fun=None,
         rng=None,
+        profiler=profiler,
     )
-    state.set_input_data_x(x)
-    state.set_input_data_x_counts(x_counts)
-    state.set_input_data_y(y)
-    state.set_input_data_y_count(y_count)
+    state.set_input_data_x(data.x)
+    state.set_input_data_x_counts(data.x_counts)
+    state.set_input_data_y(data.y)
+    state.set_input_data_y_count(data.y_count)
+    if data.weights is not None:
+        state.set_input_data_weights(data.weights)
     state.set_config_disorder_fun(disorder_fun)
     state.set_config_select_attrs_disorder_score_based_max_count(1)
     if candidates_count is not None:
         state.set_config_candidates_select_random_max_count(candidates_count)
     state.set_config_daar_allowed_randomness(allowed_randomness)
     state.set_config_daar_fast(fast)
+    state.set_config_daar_permutations_bank_size(permutations_bank_size)
+    state.set_config_daar_speculative_count(speculative_count)
     state.set_config_daar_probes_count(probes_count)
     state.set_config_consecutive_empty_iterations_max_count(consecutive_daar_reps)
     state.set_config_set_approx_threshold_to_current(True)
     if smoothing_parameter is not None:
         state.set_config_daar_smoothing_parameter(smoothing_parameter)
     state.set_group_index_class(resolve_group_index_class(group_index_class))
+    state.set_config_partition_cache_max_bytes(partition_cache_max_bytes)
+    state.set_config_successive_halving_initial_sample_size(
+        successive_halving_sample_size
+    )
+    state.set_config_successive_halving_keep_fraction(successive_halving_keep_fraction)
 
-    result = _get_approx_reduct_daar_heuristic.call_parallel(
+    processing_multi_stage = (
+        _get_approx_reduct_daar_heuristic
+        if successive_halving_sample_size is None
+        else _get_approx_reduct_daar_heuristic_successive_halving
+    )
+    result = processing_multi_stage.call_parallel(
         n_times=n_reducts,
         state=state,
         seed=seed,
         n_jobs=n_jobs,
+        share_data=share_data,
+        batch_size=batch_size,
+        backend=backend,
     )
     return result
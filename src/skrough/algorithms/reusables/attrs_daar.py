@@ -4,7 +4,10 @@ from dataclasses import replace
 
 from skrough.algorithms import hooks
 from skrough.algorithms.meta import stage
-from skrough.algorithms.meta.aggregates import StopHooksAggregate
+from skrough.algorithms.meta.aggregates import (
+    ProcessElementsHooksAggregate,
+    StopHooksAggregate,
+)
 
 _common = stage.Stage.from_hooks(
     stop_hooks=[hooks.stop_hooks.dummy_stop_hook],
@@ -44,3 +47,12 @@ attrs_daar_with_approx_and_count_stage = replace(
         ]
     ),
 )
+
+attrs_daar_successive_halving_stage = replace(
+    attrs_daar_stage,
+    select_agg=ProcessElementsHooksAggregate.from_hooks(
+        [
+            hooks.select_hooks.select_hook_attrs_disorder_score_based_successive_halving,
+        ]
+    ),
+)
@@ -1,13 +1,22 @@
 # pylint: disable=duplicate-code
 
+from dataclasses import replace
+
 from skrough.algorithms import hooks
 from skrough.algorithms.meta import stage
+from skrough.algorithms.meta.aggregates import (
+    ProcessElementsHooksAggregate,
+    StopHooksAggregate,
+)
 
 attrs_greedy_stage = stage.Stage.from_hooks(
     stop_hooks=[
         hooks.stop_hooks.stop_hook_approx_threshold,
     ],
-    init_hooks=None,
+    init_hooks=[
+        hooks.init_hooks.init_hook_active_objs,
+        hooks.init_hooks.init_hook_track_disorder,
+    ],
     pre_candidates_hooks=[
         hooks.pre_candidates_hooks.pre_candidates_hook_remaining_attrs,
     ],
@@ -19,5 +28,41 @@ attrs_greedy_stage = stage.Stage.from_hooks(
     inner_init_hooks=None,
     inner_stop_hooks=[hooks.inner_stop_hooks.inner_stop_hook_empty],
     inner_process_hooks=[hooks.inner_process_hooks.inner_process_hook_add_first_attr],
-    finalize_hooks=None,
+    finalize_hooks=[hooks.finalize_hooks.finalize_hook_restore_group_index],
+)
+
+attrs_greedy_lazy_stage = replace(
+    attrs_greedy_stage,
+    select_agg=ProcessElementsHooksAggregate.from_hooks(
+        [
+            hooks.select_hooks.select_hook_attrs_disorder_score_based_lazy,
+        ]
+    ),
+)
+
+attrs_greedy_early_abort_stage = replace(
+    attrs_greedy_stage,
+    select_agg=ProcessElementsHooksAggregate.from_hooks(
+        [
+            hooks.select_hooks.select_hook_attrs_disorder_score_based_early_abort,
+        ]
+    ),
+)
+
+attrs_greedy_successive_halving_stage = replace(
+    attrs_greedy_stage,
+    select_agg=ProcessElementsHooksAggregate.from_hooks(
+        [
+            hooks.select_hooks.select_hook_attrs_disorder_score_based_successive_halving,
+        ]
+    ),
+)
+
+attrs_greedy_epsilon_path_stage = replace(
+    attrs_greedy_stage,
+    stop_agg=StopHooksAggregate.from_hooks(
+        [
+            hooks.stop_hooks.stop_hook_epsilon_path_approx_thresholds,
+        ]
+    ),
 )
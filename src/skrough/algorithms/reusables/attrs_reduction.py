@@ -15,7 +15,7 @@ attrs_reduction_stage = stage.Stage.from_hooks(
     inner_init_hooks=None,
     inner_stop_hooks=[hooks.inner_stop_hooks.inner_stop_hook_empty_loop_break],
     inner_process_hooks=[
-        hooks.inner_process_hooks.inner_process_hook_discard_first_attr_approx_threshold
+        hooks.inner_process_hooks.inner_process_hook_discard_attrs_approx_threshold
     ],
     finalize_hooks=None,
 )
@@ -1,4 +1,6 @@
 import logging
+import math
+from collections.abc import Callable
 
 import numpy as np
 
@@ -8,6 +10,36 @@ from skrough.structs.group_index import GroupIndex
 
 logger = logging.getLogger(__name__)
 
+PROBES_BLOCK_MAX_ELEMENTS = 2**22
+"""Maximum number of elements of a block of shuffled attribute copies scored at once
+by :func:`check_if_attr_better_than_shuffled`."""
+
+
+def _get_disorder_scores_after_splits(
+    group_index: GroupIndex,
+    splits: np.ndarray,
+    splits_values_count: int,
+    values: np.ndarray,
+    values_count: int,
+    disorder_fun: rght.DisorderMeasure,
+    weights: np.ndarray | None,
+) -> np.ndarray:
+    """Compute disorder scores after splitting ``group_index`` by each row of ``splits``.
+
+    The whole block of splits is scored in a single call (cf.
+    :meth:`~skrough.structs.group_index.GroupIndexProtocol.get_disorder_scores_after_splits`),
+    which takes the rows as columns of a data table.
+    """
+    return group_index.get_disorder_scores_after_splits(
+        x=splits.T,
+        x_counts=np.full(len(splits), splits_values_count, dtype=np.int64),
+        attrs=np.arange(len(splits)),
+        values=values,
+        values_count=values_count,
+        disorder_fun=disorder_fun,
+        weights=weights,
+    )
+
 
 @log_call
 def check_if_attr_better_than_shuffled(
@@ -22,7 +54,15 @@ def check_if_attr_better_than_shuffled(
     fast: bool,
     disorder_fun: rght.DisorderMeasure,
     rng: np.random.Generator,
+    permutations: np.ndarray | None = None,
+    should_abort: Callable[[], bool] | None = None,
+    weights: np.ndarray | None = None,
 ) -> bool:
+    # objects are weighted by their multiplicities in a deduplicated table; the
+    # probes permute the unique objects, so each shuffled copy moves all the
+    # duplicates of an object together and the check only approximates the one
+    # performed on the table with duplicates
+    #
     # for result to be True we need `attr_probe_score >= (1 - allowed_randomness)`
     #
     # where `attr_probe_score` is estimated using the Laplace smoothing
@@ -71,53 +111,111 @@ def check_if_attr_better_than_shuffled(
         probes_count + smoothing_parameter * smoothing_dims
     ) - smoothing_parameter
 
-    attr_disorder_score = group_index.get_disorder_score_after_split(
-        attr_values,
+    # the attribute is scored in the same way as its shuffled copies, so that the
+    # scores of identical splits are equal
+    attr_disorder_score = _get_disorder_scores_after_splits(
+        group_index,
+        np.asarray(attr_values)[np.newaxis],
         attr_values_count,
         values,
         values_count,
         disorder_fun,
-    )
-    attr_values_shuffled: np.ndarray = np.array(attr_values)
-
-    # let us prepare a function that shuffles `attr_values_shuffled`
-    if fast:
-        permutation = rng.permutation(len(attr_values_shuffled))
-
-        def shuffle_values():
-            nonlocal attr_values_shuffled
-            attr_values_shuffled = attr_values_shuffled[permutation]
+        weights,
+    )[0]
+
+    # let us prepare a function that creates a block of consecutive probes, i.e.,
+    # shuffled copies of `attr_values`
+    if permutations is not None:
+        # the probes gather values through the precomputed permutations, starting
+        # from a random position in the bank
+        bank_position = int(rng.integers(len(permutations)))
+
+        def get_probes(size: int) -> np.ndarray:
+            nonlocal bank_position
+            rows = (bank_position + np.arange(size)) % len(permutations)
+            bank_position = int(rows[-1]) + 1
+            return np.asarray(attr_values)[permutations[rows]]
 
     else:
-
-        def shuffle_values():
-            rng.shuffle(attr_values_shuffled)
-
+        attr_values_shuffled: np.ndarray = np.array(attr_values)
+
+        # let us prepare a function that shuffles `attr_values_shuffled`
+        if fast:
+            permutation = rng.permutation(len(attr_values_shuffled))
+
+            def shuffle_values():
+                nonlocal attr_values_shuffled
+                attr_values_shuffled = attr_values_shuffled[permutation]
+
+        else:
+
+            def shuffle_values():
+                rng.shuffle(attr_values_shuffled)
+
+        def get_probes(size: int) -> np.ndarray:
+            block = np.empty(
+                shape=(size, len(attr_values_shuffled)),
+                dtype=attr_values_shuffled.dtype,
+            )
+            for i in range(size):
+                shuffle_values()
+                block[i] = attr_values_shuffled
+            return block
+
+    # probes are scored in blocks, all shuffled copies of a block at once by the group
+    # index; a block never extends past the first iteration at
+    # which early stopping may happen, so neither the result nor the number of random
+    # draws depends on the block size
+    max_block_size = max(1, PROBES_BLOCK_MAX_ELEMENTS // max(1, len(attr_values)))
     iterations = 0
     current_attr_is_better_count = 0
-    for _ in range(probes_count):
-        iterations += 1
-        shuffle_values()
-        shuffled_disorder_score = group_index.get_disorder_score_after_split(
-            attr_values_shuffled,
+    while iterations < probes_count:
+        # the check is abandoned between blocks whenever its result is not needed
+        # anymore; the returned value is meaningless then
+        if should_abort is not None and should_abort():
+            logger.debug("Check aborted after %d iterations", iterations)
+            return False
+        current_attr_is_worse_equal_count = iterations - current_attr_is_better_count
+        block_size = max(
+            1,
+            min(
+                math.ceil(threshold - current_attr_is_better_count),
+                math.floor(probes_count - threshold)
+                + 1
+                - current_attr_is_worse_equal_count,
+                probes_count - iterations,
+                max_block_size,
+            ),
+        )
+        shuffled_disorder_scores = _get_disorder_scores_after_splits(
+            group_index,
+            get_probes(block_size),
             attr_values_count,
             values,
             values_count,
             disorder_fun,
+            weights,
         )
-        if attr_disorder_score < shuffled_disorder_score:
-            current_attr_is_better_count += 1
-
-        # early stopping - positive case
-        if current_attr_is_better_count >= threshold:
-            result = True
-            break
-
-        # early stopping - negative case
-        # current_attrs_is_worse_equal_count
-        #   == iterations - current_attr_is_better_count
-        if iterations - current_attr_is_better_count > probes_count - threshold:
-            result = False
+        decided = False
+        for shuffled_disorder_score in shuffled_disorder_scores:
+            iterations += 1
+            if attr_disorder_score < shuffled_disorder_score:
+                current_attr_is_better_count += 1
+
+            # early stopping - positive case
+            if current_attr_is_better_count >= threshold:
+                result = True
+                decided = True
+                break
+
+            # early stopping - negative case
+            # current_attrs_is_worse_equal_count
+            #   == iterations - current_attr_is_better_count
+            if iterations - current_attr_is_better_count > probes_count - threshold:
+                result = False
+                decided = True
+                break
+        if decided:
             break
 
     logger.debug("smoothing_parameter == %f", smoothing_parameter)
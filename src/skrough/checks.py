@@ -10,8 +10,9 @@ import numpy as np
 
 import skrough.typing as rght
 from skrough.disorder_measures.disorder_measures import conflicts_count
-from skrough.disorder_score import get_disorder_score_for_data, get_disorder_score_stats
+from skrough.disorder_score import get_disorder_score_stats
 from skrough.instances import choose_objects
+from skrough.partitions import get_leave_one_out_disorder_scores
 from skrough.structs.group_index import GroupIndex
 from skrough.unify import unify_index_list
 from skrough.unique import get_rows_nunique
@@ -187,18 +188,17 @@ def check_if_approx_reduct(
         return False
 
     if check_attrs_reduction:
-        all_attrs = set(attrs)
-        for i in attrs:
-            reduced_disorder_score = get_disorder_score_for_data(
-                x,
-                x_counts,
-                y,
-                y_count,
-                disorder_fun=disorder_fun,
-                attrs=list(all_attrs - {i}),
-            )
-            if reduced_disorder_score <= disorder_score_stats.approx_threshold:
-                return False
+        distinct_attrs = list(dict.fromkeys(int(attr) for attr in attrs))
+        reduced_disorder_scores = get_leave_one_out_disorder_scores(
+            x,
+            x_counts,
+            y,
+            y_count,
+            attrs=distinct_attrs,
+            disorder_fun=disorder_fun,
+        )
+        if np.any(reduced_disorder_scores <= disorder_score_stats.approx_threshold):
+            return False
 
     return True
 
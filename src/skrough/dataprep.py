@@ -64,17 +64,35 @@ def prepare_factorized_vector(
     return factorized_values, count_distinct
 
 
+@overload
+def prepare_factorized_array(
+    data_x: np.ndarray,
+    return_unique_values: Literal[False] = False,
+) -> tuple[np.ndarray, np.ndarray]: ...
+
+
+@overload
+def prepare_factorized_array(
+    data_x: np.ndarray,
+    return_unique_values: Literal[True],
+) -> tuple[np.ndarray, np.ndarray, list[np.ndarray]]: ...
+
+
 # TODO: add handling also for pd.DataFrame
 @log_call
 def prepare_factorized_array(
     data_x: np.ndarray,
-) -> tuple[np.ndarray, np.ndarray]:
+    return_unique_values: bool = False,
+) -> tuple[np.ndarray, np.ndarray] | tuple[np.ndarray, np.ndarray, list[np.ndarray]]:
     """Factorize data table.
 
     Factorize data table and return statistics of feature domain sizes.
 
     Args:
         data_x: A dataset to be factorized.
+        return_unique_values: Whether to return also the distinct values of every
+            column, i.e., the mapping of the factorized values back to the original
+            ones. Defaults to :obj:`False`.
 
     Returns:
         Result is consisted of the following elements
@@ -82,6 +100,8 @@ def prepare_factorized_array(
         - factorized data returned in a form of a 2D array
         - data feature domain sizes returned in a form of 1d array, i.e., a single value
           (domain size) returned for each column
+        - (optionally) distinct values of every column, given in the order of their
+          factorized codes
 
     Examples:
         >>> ar = np.array([[5, 3],
@@ -94,13 +114,19 @@ def prepare_factorized_array(
         array([2, 2]))
     """
     if data_x.size == 0:
-        return data_x, np.zeros(data_x.shape[1])
+        x_counts = np.zeros(data_x.shape[1])
+        if return_unique_values:
+            return data_x, x_counts, [data_x[:, i] for i in range(data_x.shape[1])]
+        return data_x, x_counts
     factorized = [
-        prepare_factorized_vector(data_x[:, i]) for i in range(data_x.shape[1])
+        prepare_factorized_vector(data_x[:, i], return_unique_values=True)
+        for i in range(data_x.shape[1])
     ]
-    res1, res2 = zip(*factorized)
+    res1, res2, res3 = zip(*factorized)
     x: np.ndarray = np.column_stack(res1)
     x_counts = np.array(res2)
+    if return_unique_values:
+        return x, x_counts, list(res3)
     return x, x_counts
 
 
@@ -147,6 +173,66 @@ def prepare_factorized_data(
     return x, x_counts, y, y_count
 
 
+@log_call
+def prepare_deduplicated_data(
+    x: np.ndarray,
+    y: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Collapse duplicated rows of factorized data.
+
+    Collapse rows of factorized data that are duplicated with respect to both the
+    conditional attributes and the decision into unique rows along with their
+    multiplicities. The unique rows are given in the order of their first occurrence,
+    so data with no duplicated rows is returned unchanged.
+
+    Args:
+        x: Factorized data table.
+        y: Factorized decision values.
+
+    Returns:
+        Result is consisted of the following elements
+
+        - unique rows of the factorized data table
+        - decision values of the unique rows
+        - multiplicities of the unique rows, i.e., integer weights of the objects of
+          the deduplicated data
+        - the unique row of every input row, i.e., the mapping of the input rows to the
+          objects of the deduplicated data
+
+    Examples:
+        >>> x = np.array([[0, 0],
+        ...               [1, 0],
+        ...               [0, 0]])
+        >>> y = np.array([0, 1, 0])
+        >>> prepare_deduplicated_data(x, y)
+        (array([[0, 0],
+                [1, 0]]),
+        array([0, 1]),
+        array([2, 1]),
+        array([0, 1, 0]))
+    """
+    if len(y) == 0:
+        empty = np.zeros(0, dtype=np.int64)
+        return x, y, empty, empty
+    _, first, inverse, counts = np.unique(
+        np.column_stack((x, y)),
+        axis=0,
+        return_index=True,
+        return_inverse=True,
+        return_counts=True,
+    )
+    order = np.argsort(first, kind="stable")
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    unique_rows = first[order]
+    return (
+        x[unique_rows],
+        y[unique_rows],
+        counts[order].astype(np.int64),
+        rank[inverse.reshape(-1)].astype(np.int64),
+    )
+
+
 # TODO: make target_attr optional - so one can shuffle just conditional attrs without
 # the need the target attr to be present
 @log_call
@@ -2,7 +2,7 @@ import numba
 import numpy as np
 
 
-@numba.njit(cache=True)
+@numba.njit(cache=True, nogil=True)
 def gini_impurity(
     distribution: np.ndarray,
     n_elements: int,
@@ -64,7 +64,7 @@ def gini_impurity(
     return result
 
 
-@numba.njit(cache=True, fastmath=True)
+@numba.njit(cache=True, nogil=True, fastmath=True)
 def entropy(
     distribution: np.ndarray,
     n_elements: int,
@@ -122,7 +122,7 @@ def entropy(
     return result
 
 
-@numba.njit(cache=True)
+@numba.njit(cache=True, nogil=True)
 def conflicts_count(
     distribution: np.ndarray,
     n_elements: int,  # pylint: disable=unused-argument
@@ -62,6 +62,40 @@ def get_disorder_score_for_data(
     return result
 
 
+def _check_epsilon(epsilon: float) -> None:
+    if epsilon < 0 or epsilon > 1:
+        raise ValueError(
+            "Epsilon value should be a number between 0.0 and 1.0 inclusive"
+        )
+
+
+def get_epsilon_approx_threshold(
+    base_disorder_score: float,
+    total_disorder_score: float,
+    epsilon: float,
+) -> float:
+    """Compute the approximation threshold for the given epsilon.
+
+    The threshold is computed the same way as ``approx_threshold`` of
+    :func:`get_disorder_score_stats`, i.e., it lies between ``total_disorder_score``
+    (for :code:`epsilon == 0.0`) and ``base_disorder_score`` (for
+    :code:`epsilon == 1.0`) and it is moved up by a very small number to overcome
+    possible floating-point arithmetic issues.
+
+    Args:
+        base_disorder_score: The disorder score for all objects in just one group.
+        total_disorder_score: The disorder score for the grouping induced by all
+            conditional attributes.
+        epsilon: A value :code:`0.0 <= epsilon <= 1.0` defining the threshold.
+
+    Returns:
+        The approximation threshold.
+    """
+    _check_epsilon(epsilon)
+    delta_dependency = base_disorder_score - total_disorder_score
+    return np.nextafter(total_disorder_score + epsilon * delta_dependency, np.inf)
+
+
 @log_call
 def get_disorder_score_stats(
     x: np.ndarray,
@@ -72,6 +106,7 @@ def get_disorder_score_stats(
     increment_attrs: Sequence[rght.IndexListLike] | None = None,
     epsilon: float | None = None,
     group_index_class: type[GroupIndexProtocol] | None = None,
+    weights: np.ndarray | None = None,
 ) -> DisorderScoreStats:
     """Compute disorder score stats.
 
@@ -136,6 +171,11 @@ def get_disorder_score_stats(
             Where ``A`` is a very small number and it is added to overcome some possible
             floating-point arithmetic issues. When set to :obj:`None` then
             ``approx_threshold`` is not computed. Defaults to :obj:`None`.
+        group_index_class: The :class:`GroupIndexProtocol` implementation to use.
+            Defaults to :class:`GroupIndex` (numba-accelerated).
+        weights: Integer weights of the objects, e.g., multiplicities of the rows of
+            deduplicated data (cf. :func:`~skrough.dataprep.prepare_deduplicated_data`).
+            :obj:`None` means that every object counts once. Defaults to :obj:`None`.
 
     Returns:
         :class:`~skrough.structs.disorder_score_stats.DisorderScoreStats` instance
@@ -163,17 +203,17 @@ def get_disorder_score_stats(
         'approx_threshold': 0.6243856189774726}
     """
 
-    if epsilon is not None and (epsilon < 0 or epsilon > 1):
-        raise ValueError(
-            "Epsilon value should be a number between 0.0 and 1.0 inclusive"
-        )
+    if epsilon is not None:
+        _check_epsilon(epsilon)
 
     group_index_class = resolve_group_index_class(group_index_class)
 
     group_index = group_index_class.create_uniform(len(x))
 
     # compute base disorder score
-    base_disorder_score = group_index.get_disorder_score(y, y_count, disorder_fun)
+    base_disorder_score = group_index.get_disorder_score(
+        y, y_count, disorder_fun, weights=weights
+    )
 
     increment_attrs_disorder_score = None
     attrs_added: Set[int] = set()
@@ -186,7 +226,9 @@ def get_disorder_score_stats(
                     x[:, attr], x_counts[attr], compress=True
                 )
             attrs_added = attrs_added.union(attrs_to_add)
-            disorder_score = group_index.get_disorder_score(y, y_count, disorder_fun)
+            disorder_score = group_index.get_disorder_score(
+                y, y_count, disorder_fun, weights=weights
+            )
             increment_attrs_disorder_score.append(disorder_score)
 
     # add remaining attrs
@@ -195,14 +237,14 @@ def get_disorder_score_stats(
         group_index = group_index.split(x[:, attr], x_counts[attr], compress=True)
 
     # compute total disorder score
-    total_disorder_score = group_index.get_disorder_score(y, y_count, disorder_fun)
+    total_disorder_score = group_index.get_disorder_score(
+        y, y_count, disorder_fun, weights=weights
+    )
 
     approx_threshold = None
     if epsilon is not None:
-        delta_dependency = base_disorder_score - total_disorder_score
-        approx_threshold = np.nextafter(
-            total_disorder_score + epsilon * delta_dependency,
-            np.inf,
+        approx_threshold = get_epsilon_approx_threshold(
+            base_disorder_score, total_disorder_score, epsilon
         )
 
     result = DisorderScoreStats(
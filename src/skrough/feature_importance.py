@@ -128,6 +128,7 @@ def get_feature_importance(
     attrs_subsets: Sequence[AttrsSubset | rght.IndexListLike],
     disorder_fun: rght.DisorderMeasure,
     n_jobs: int | None = None,
+    backend: str | None = None,
 ):
     """
     Compute feature importance for a given collection of reducts
@@ -137,7 +138,7 @@ def get_feature_importance(
 
     all_score_gains: Iterable[AttrsSubsetScoreGainMapping] = cast(
         Iterable[AttrsSubsetScoreGainMapping],
-        joblib.Parallel(n_jobs=n_jobs)(
+        joblib.Parallel(n_jobs=n_jobs, backend=backend)(
             joblib.delayed(compute_attrs_score_gains)(
                 x,
                 x_counts,
@@ -239,6 +240,7 @@ def get_feature_importance_for_objs_attrs(
     objs_attrs_collection: Sequence[ObjsAttrsSubset],
     disorder_fun: rght.DisorderMeasure,
     n_jobs: int | None = None,
+    backend: str | None = None,
 ):
     """
     Compute feature importance for a given collection of bireducts
@@ -251,7 +253,7 @@ def get_feature_importance_for_objs_attrs(
 
     score_gain_mappings_collection: Iterable[ObjsAttrsSubsetScoreGainMapping] = cast(
         Iterable[ObjsAttrsSubsetScoreGainMapping],
-        joblib.Parallel(n_jobs=n_jobs)(
+        joblib.Parallel(n_jobs=n_jobs, backend=backend)(
             joblib.delayed(compute_objs_attrs_score_gains)(
                 x,
                 x_counts,
@@ -0,0 +1,318 @@
+"""Compiled engine of the greedy reduct heuristic.
+
+The :mod:`skrough.greedy_engine` module delivers :func:`get_greedy_reduct_attrs` - the
+greedy heuristic for approximate reducts (cf.
+:func:`~skrough.algorithms.reducts.get_approx_reduct_greedy_heuristic`) run as a single
+``@numba.njit``-compiled function. The function covers both stages of the hook-based
+pipeline: the greedy stage (candidate sampling, scoring of the candidate splits,
+selection of the best candidate and the approximation threshold checks) and the
+reduction stage (discarding redundant attributes with leave-one-out partitions, cf.
+:func:`~skrough.partitions.reduce_attrs_sequentially`).
+
+The engine follows the hook-based pipeline run with the default group index step by
+step: groups are numbered in the order of their first occurrence, as by compressed
+splits of the default group index, and disorder scores are computed by the same
+kernels. The candidates, however, are drawn from the given random generator with
+:meth:`numpy.random.Generator.permutation` (:meth:`numpy.random.Generator.choice` is
+not available in compiled code), i.e., the engine consumes its own random stream.
+Therefore, for the same random generator state, the engine and the pipeline draw
+different candidates and they may produce different attributes whenever candidates
+are sampled or equally scored candidates occur.
+"""
+
+import numba
+import numpy as np
+import numpy.typing as npt
+
+import skrough.typing as rght
+from skrough.structs.group_index._numba import (
+    _get_disorder_score_after_split,
+    _get_distribution,
+)
+
+
+@numba.njit(cache=True, nogil=True)
+def _split(
+    group_ids: npt.NDArray[np.int64],
+    n_groups: int,
+    values: npt.NDArray[np.int64],
+    values_count: int,
+) -> tuple[npt.NDArray[np.int64], int]:
+    """Split groups by values and number new groups by their first occurrence.
+
+    When the key space is not larger than the number of objects, ``(group, value)``
+    keys are numbered through a lookup array. Otherwise values are numbered within
+    every group using a stamp array (objects visited group by group) and the resulting
+    keys are renumbered by their first occurrence.
+    """
+    n_objs = group_ids.shape[0]
+    new_group_ids = np.empty(n_objs, dtype=np.int64)
+    n_new_groups = 0
+    keys_space = n_groups * values_count
+    if keys_space <= n_objs:
+        lookup = np.full(keys_space, -1, dtype=np.int64)
+        for i in range(n_objs):
+            key = group_ids[i] * values_count + values[i]
+            if lookup[key] < 0:
+                lookup[key] = n_new_groups
+                n_new_groups += 1
+            new_group_ids[i] = lookup[key]
+        return new_group_ids, n_new_groups
+
+    offsets = np.zeros(n_groups + 1, dtype=np.int64)
+    for i in range(n_objs):
+        offsets[group_ids[i] + 1] += 1
+    for g in range(n_groups):
+        offsets[g + 1] += offsets[g]
+    order = np.empty(n_objs, dtype=np.int64)
+    for i in range(n_objs):
+        order[offsets[group_ids[i]]] = i
+        offsets[group_ids[i]] += 1
+    stamp = np.full(values_count, -1, dtype=np.int64)
+    slot = np.empty(values_count, dtype=np.int64)
+    keys = np.empty(n_objs, dtype=np.int64)
+    n_keys = 0
+    for k in range(n_objs):
+        i = order[k]
+        value = values[i]
+        if stamp[value] != group_ids[i]:
+            stamp[value] = group_ids[i]
+            slot[value] = n_keys
+            n_keys += 1
+        keys[i] = slot[value]
+    relabel = np.full(n_keys, -1, dtype=np.int64)
+    for i in range(n_objs):
+        if relabel[keys[i]] < 0:
+            relabel[keys[i]] = n_new_groups
+            n_new_groups += 1
+        new_group_ids[i] = relabel[keys[i]]
+    return new_group_ids, n_new_groups
+
+
+@numba.njit(cache=True, nogil=True)
+def _refine(
+    group_ids: npt.NDArray[np.int64],
+    n_groups: int,
+    x: npt.NDArray[np.int64],
+    x_counts: npt.NDArray[np.int64],
+    attrs: npt.NDArray[np.int64],
+) -> tuple[npt.NDArray[np.int64], int]:
+    for attr in attrs:
+        group_ids, n_groups = _split(group_ids, n_groups, x[:, attr], x_counts[attr])
+    return group_ids, n_groups
+
+
+@numba.njit(cache=True, nogil=True)
+def _is_below_threshold(
+    group_ids: npt.NDArray[np.int64],
+    n_groups: int,
+    y: npt.NDArray[np.int64],
+    y_count: int,
+    disorder_fun: rght.DisorderMeasure,
+    approx_threshold: float,
+) -> bool:
+    distribution = _get_distribution(group_ids, n_groups, y, y_count)
+    return disorder_fun(distribution, group_ids.shape[0]) <= approx_threshold
+
+
+@numba.njit(cache=True, nogil=True)
+def _reduce_attrs(
+    group_ids: npt.NDArray[np.int64],
+    n_groups: int,
+    x: npt.NDArray[np.int64],
+    x_counts: npt.NDArray[np.int64],
+    y: npt.NDArray[np.int64],
+    y_count: int,
+    disorder_fun: rght.DisorderMeasure,
+    approx_threshold: float,
+    attrs: npt.NDArray[np.int64],
+    lo: int,
+    hi: int,
+    kept: npt.NDArray[np.int64],
+    n_kept: int,
+) -> int:
+    """Divide-and-conquer leave-one-out reduction, cf. :mod:`skrough.partitions`.
+
+    The groups are induced by the attributes kept so far together with all attributes
+    from ``attrs[hi:]``. Kept attributes are appended to ``kept`` and the new number
+    of kept attributes is returned.
+    """
+    if hi - lo == 1:
+        if not _is_below_threshold(
+            group_ids, n_groups, y, y_count, disorder_fun, approx_threshold
+        ):
+            kept[n_kept] = attrs[lo]
+            n_kept += 1
+        return n_kept
+    mid = (lo + hi) // 2
+    left_group_ids, left_n_groups = _refine(
+        group_ids, n_groups, x, x_counts, attrs[mid:hi]
+    )
+    new_n_kept = _reduce_attrs(
+        left_group_ids,
+        left_n_groups,
+        x,
+        x_counts,
+        y,
+        y_count,
+        disorder_fun,
+        approx_threshold,
+        attrs,
+        lo,
+        mid,
+        kept,
+        n_kept,
+    )
+    right_group_ids, right_n_groups = _refine(
+        group_ids, n_groups, x, x_counts, kept[n_kept:new_n_kept]
+    )
+    return _reduce_attrs(
+        right_group_ids,
+        right_n_groups,
+        x,
+        x_counts,
+        y,
+        y_count,
+        disorder_fun,
+        approx_threshold,
+        attrs,
+        mid,
+        hi,
+        kept,
+        new_n_kept,
+    )
+
+
+@numba.njit(cache=True, nogil=True)
+def _get_greedy_reduct_attrs(
+    x: npt.NDArray[np.int64],
+    x_counts: npt.NDArray[np.int64],
+    y: npt.NDArray[np.int64],
+    y_count: int,
+    disorder_fun: rght.DisorderMeasure,
+    approx_threshold: float,
+    candidates_count: int,
+    rng: np.random.Generator,
+) -> npt.NDArray[np.int64]:
+    n_objs, n_attrs = x.shape
+    group_ids = np.zeros(n_objs, dtype=np.int64)
+    n_groups = 1 if n_objs > 0 else 0
+    result = np.empty(n_attrs, dtype=np.int64)
+    n_result = 0
+
+    # greedy stage
+    is_used = np.zeros(n_attrs, dtype=np.bool_)
+    stop = _is_below_threshold(
+        group_ids, n_groups, y, y_count, disorder_fun, approx_threshold
+    )
+    while not stop and n_result < n_attrs:
+        remaining = np.flatnonzero(~is_used)
+        size = remaining.shape[0]
+        if 0 <= candidates_count < size:
+            size = candidates_count
+        candidates = rng.permutation(remaining)[:size]
+        if size == 0:
+            break
+        best_attr = candidates[0]
+        best_score = np.inf
+        for attr in candidates:
+            score = _get_disorder_score_after_split(
+                group_ids,
+                n_groups,
+                x[:, attr],
+                x_counts[attr],
+                y,
+                y_count,
+                disorder_fun,
+            )
+            # the first of the equally scored candidates wins, as for a stable sort
+            if score < best_score:
+                best_attr = attr
+                best_score = score
+        is_used[best_attr] = True
+        result[n_result] = best_attr
+        n_result += 1
+        group_ids, n_groups = _split(
+            group_ids, n_groups, x[:, best_attr], x_counts[best_attr]
+        )
+        stop = _is_below_threshold(
+            group_ids, n_groups, y, y_count, disorder_fun, approx_threshold
+        )
+
+    # reduction stage, the attributes are tried for removal in reverse order
+    if n_result == 0:
+        return result[:0]
+    attrs = result[:n_result][::-1].copy()
+    kept = np.empty(n_result, dtype=np.int64)
+    n_kept = _reduce_attrs(
+        np.zeros(n_objs, dtype=np.int64),
+        1 if n_objs > 0 else 0,
+        x,
+        x_counts,
+        y,
+        y_count,
+        disorder_fun,
+        approx_threshold,
+        attrs,
+        0,
+        n_result,
+        kept,
+        0,
+    )
+    is_kept = np.zeros(n_attrs, dtype=np.bool_)
+    is_kept[kept[:n_kept]] = True
+    n_reduct = 0
+    for attr in result[:n_result]:
+        if is_kept[attr]:
+            result[n_reduct] = attr
+            n_reduct += 1
+    return result[:n_reduct]
+
+
+def get_greedy_reduct_attrs(
+    x: npt.NDArray[np.int64],
+    x_counts: npt.NDArray[np.int64],
+    y: npt.NDArray[np.int64],
+    y_count: int,
+    disorder_fun: rght.DisorderMeasure,
+    approx_threshold: float,
+    candidates_count: int | None,
+    rng: np.random.Generator,
+) -> list[int]:
+    """Get attributes of an approximate reduct using the compiled greedy heuristic.
+
+    Attributes are added one by one, each time the one minimizing the disorder score
+    after the split among the (randomly chosen) candidates, until the disorder score
+    falls below the approximation threshold. Then, the added attributes are tried for
+    removal in reverse order, keeping the disorder score below the threshold.
+
+    Args:
+        x: Factorized data table representing conditional features/attributes.
+        x_counts: Number of distinct attribute values given for each conditional
+            attribute.
+        y: Factorized decision values.
+        y_count: Number of distinct decision attribute values.
+        disorder_fun: Disorder measure function to be used for computing the disorder
+            score.
+        approx_threshold: Disorder score approximation threshold.
+        candidates_count: Number of candidate attributes randomly chosen in every
+            iteration from the remaining attributes. :obj:`None` means all the
+            remaining attributes.
+        rng: Random generator used to choose the candidate attributes.
+
+    Returns:
+        Attributes of the approximate reduct, in the order they were added.
+    """
+    if candidates_count is not None and candidates_count < 0:
+        raise ValueError("Candidates count should be a non-negative number")
+    result = _get_greedy_reduct_attrs(
+        np.asarray(x, dtype=np.int64),
+        np.asarray(x_counts, dtype=np.int64),
+        np.asarray(y, dtype=np.int64),
+        int(y_count),
+        disorder_fun,
+        float(approx_threshold),
+        -1 if candidates_count is None else int(candidates_count),
+        rng,
+    )
+    return [int(attr) for attr in result]
@@ -11,7 +11,7 @@ from skrough.structs.group_index import GroupIndex
 from skrough.unique import get_uniques_and_compacted
 
 
-@numba.njit(cache=True)
+@numba.njit(cache=True, nogil=True)
 def encode_homogeneity(
     distribution: npt.NDArray[np.int64],
 ) -> npt.NDArray[np.int8]:
@@ -71,7 +71,7 @@ def encode_homogeneity(
 HETEROGENEITY_MAX_COLS = 63
 
 
-@numba.njit(cache=True)
+@numba.njit(cache=True, nogil=True)
 def encode_heterogeneity(
     distribution: npt.NDArray[np.int64],
 ) -> npt.NDArray[np.int64]:
@@ -262,7 +262,7 @@ def encode_heterogeneity_alt(
     return result
 
 
-@numba.njit(cache=True)
+@numba.njit(cache=True, nogil=True)
 def _groups_decisions_replace(
     group_index: np.ndarray,
     y: np.ndarray,
@@ -2,13 +2,37 @@
 
 import functools
 import logging
+import os
+
+LOG_CALL_ENV_VAR = "SKROUGH_LOG_CALL"
+"""Name of the environment variable that controls :func:`log_call`. When it is set to
+one of ``0``, ``false``, ``no`` or ``off`` (case-insensitive), the functions are not
+decorated at all, so that call tracing costs nothing. The variable is read when a
+function is decorated, i.e., it has to be set before :mod:`skrough` modules are
+imported."""
+
+LOG_CALL_DISABLED_VALUES = frozenset({"0", "false", "no", "off"})
+
+
+def is_log_call_enabled() -> bool:
+    """Check whether :func:`log_call` decorates functions.
+
+    Returns:
+        :obj:`False` if call tracing is switched off by the :const:`LOG_CALL_ENV_VAR`
+        environment variable, :obj:`True` otherwise.
+    """
+    value = os.environ.get(LOG_CALL_ENV_VAR, "")
+    return value.strip().lower() not in LOG_CALL_DISABLED_VALUES
 
 
 def log_call(fun):
     """Decorator that logs entry and exit of a function.
 
-    Uses the logger of the module where the decorated function is defined.
-    Logs ``enter <func_name>`` and ``exit <func_name>`` at DEBUG level.
+    Uses the logger of the module where the decorated function is defined, which is
+    resolved once, at decoration time. Logs ``enter <func_name>`` and
+    ``exit <func_name>`` at DEBUG level. When DEBUG level is not enabled for the logger,
+    the function is called directly. When call tracing is switched off (cf.
+    :const:`LOG_CALL_ENV_VAR`), the function is returned undecorated.
 
     Args:
         fun: The function to decorate.
@@ -16,13 +40,19 @@ def log_call(fun):
     Returns:
         Wrapped function that logs entry and exit.
     """
+    if not is_log_call_enabled():
+        return fun
+
+    logger = logging.getLogger(fun.__module__)
+    name = fun.__name__
 
     @functools.wraps(fun)
     def decorated(*args, **kwargs):
-        logger = logging.getLogger(fun.__module__)
-        logger.debug("enter %s", fun.__name__)
+        if not logger.isEnabledFor(logging.DEBUG):
+            return fun(*args, **kwargs)
+        logger.debug("enter %s", name)
         result = fun(*args, **kwargs)
-        logger.debug("exit %s", fun.__name__)
+        logger.debug("exit %s", name)
         return result
 
     return decorated
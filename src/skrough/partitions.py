@@ -0,0 +1,169 @@
+"""Leave-one-out partitions of attribute subsets.
+
+The :mod:`skrough.partitions` module delivers functions that visit partitions
+(group indices) induced by an attribute subset with one of its attributes left out.
+Instead of building every such partition from scratch, which costs ``O(k^2)``
+single-attribute splits for ``k`` attributes, the partitions are obtained by a
+divide-and-conquer refinement of partial partitions: the attributes are halved
+recursively, and the partition passed down to one half is refined by all attributes
+of the other half. This way all ``k`` leave-one-out partitions are visited using
+``O(k log k)`` splits while keeping only ``O(log k)`` partial partitions in memory.
+"""
+
+import logging
+from collections.abc import Callable
+
+import numpy as np
+
+import skrough.typing as rght
+from skrough.logs import log_call
+from skrough.structs.group_index import GroupIndexProtocol, resolve_group_index_class
+from skrough.unify import unify_index_list
+
+logger = logging.getLogger(__name__)
+
+
+def _refine(
+    group_index: GroupIndexProtocol,
+    x: np.ndarray,
+    x_counts: np.ndarray,
+    attrs: rght.IndexListLike,
+) -> GroupIndexProtocol:
+    for attr in attrs:
+        group_index = group_index.split(x[:, attr], int(x_counts[attr]), compress=True)
+    return group_index
+
+
+def _reduce_attrs(
+    group_index: GroupIndexProtocol,
+    x: np.ndarray,
+    x_counts: np.ndarray,
+    attrs: list[int],
+    lo: int,
+    hi: int,
+    is_removable: Callable[[int, GroupIndexProtocol], bool],
+    kept: list[int],
+) -> None:
+    # ``group_index`` is induced by the attributes kept so far (and the fixed ones)
+    # together with all attributes from ``attrs[hi:]``
+    if hi - lo == 1:
+        attr = attrs[lo]
+        if not is_removable(attr, group_index):
+            kept.append(attr)
+        return
+    mid = (lo + hi) // 2
+    n_kept = len(kept)
+    left_group_index = _refine(group_index, x, x_counts, attrs[mid:hi])
+    _reduce_attrs(left_group_index, x, x_counts, attrs, lo, mid, is_removable, kept)
+    right_group_index = _refine(group_index, x, x_counts, kept[n_kept:])
+    _reduce_attrs(right_group_index, x, x_counts, attrs, mid, hi, is_removable, kept)
+
+
+@log_call
+def reduce_attrs_sequentially(
+    x: np.ndarray,
+    x_counts: np.ndarray,
+    attrs: rght.IndexListLike,
+    is_removable: Callable[[int, GroupIndexProtocol], bool],
+    group_index: GroupIndexProtocol | None = None,
+    group_index_class: type[GroupIndexProtocol] | None = None,
+) -> list[int]:
+    """Try to remove attributes one by one using leave-one-out partitions.
+
+    The attributes from ``attrs`` are processed in the given order. For every
+    attribute the ``is_removable`` callback is called with the attribute and the group
+    index induced by all attributes still present except the attribute itself, i.e.,
+    the earlier attributes that were kept and all the later ones (plus the attributes
+    inducing ``group_index``). If the callback returns :obj:`True`, the attribute is
+    removed and it is not taken into account for the remaining attributes. All the
+    group indices are obtained by a divide-and-conquer refinement of partial
+    partitions, using ``O(k log k)`` splits for ``k`` attributes.
+
+    Args:
+        x: Factorized data table representing conditional features/attributes.
+        x_counts: Number of distinct attribute values given for each conditional
+            attribute.
+        attrs: Attributes to be processed, in the order of processing. The
+            attributes are expected to be distinct.
+        is_removable: Callback deciding whether the given attribute can be removed
+            given the group index induced by the remaining attributes.
+        group_index: Group index induced by the attributes that are fixed, i.e., that
+            are present in all the visited partitions. :obj:`None` means a uniform
+            group index for all objects from ``x``. Defaults to :obj:`None`.
+        group_index_class: The :class:`GroupIndexProtocol` implementation used to
+            create the uniform group index when ``group_index`` is not given.
+            Defaults to :class:`GroupIndex` (numba-accelerated).
+
+    Returns:
+        Attributes that were kept, in the order of processing.
+    """
+    unified_attrs = [int(attr) for attr in unify_index_list(attrs)]
+    if group_index is None:
+        group_index_class = resolve_group_index_class(group_index_class)
+        group_index = group_index_class.create_uniform(len(x))
+    kept: list[int] = []
+    if len(unified_attrs) > 0:
+        _reduce_attrs(
+            group_index,
+            x,
+            x_counts,
+            unified_attrs,
+            0,
+            len(unified_attrs),
+            is_removable,
+            kept,
+        )
+    logger.debug("Kept attrs count = %d", len(kept))
+    return kept
+
+
+@log_call
+def get_leave_one_out_disorder_scores(
+    x: np.ndarray,
+    x_counts: np.ndarray,
+    y: np.ndarray,
+    y_count: int,
+    attrs: rght.IndexListLike,
+    disorder_fun: rght.DisorderMeasure,
+    group_index_class: type[GroupIndexProtocol] | None = None,
+) -> np.ndarray:
+    """Compute disorder scores induced by attributes with one attribute left out.
+
+    The ``i``-th element of the result is the disorder score for the grouping induced
+    by all attributes from ``attrs`` except ``attrs[i]``. The underlying partitions are
+    obtained using :func:`reduce_attrs_sequentially` that never removes attributes.
+
+    Args:
+        x: Factorized data table representing conditional features/attributes.
+        x_counts: Number of distinct attribute values given for each conditional
+            attribute.
+        y: Factorized decision values.
+        y_count: Number of distinct decision attribute values.
+        attrs: Distinct attributes to leave out one at a time.
+        disorder_fun: Disorder measure function to be used for computing the
+            disorder score.
+        group_index_class: The :class:`GroupIndexProtocol` implementation to use.
+            Defaults to :class:`GroupIndex` (numba-accelerated).
+
+    Returns:
+        Leave-one-out disorder scores.
+    """
+    scores: dict[int, float] = {}
+
+    def _score(attr: int, group_index: GroupIndexProtocol) -> bool:
+        scores[attr] = group_index.get_disorder_score(y, y_count, disorder_fun)
+        return False
+
+    unified_attrs = unify_index_list(attrs)
+    reduce_attrs_sequentially(
+        x,
+        x_counts,
+        unified_attrs,
+        _score,
+        group_index_class=group_index_class,
+    )
+    return np.fromiter(
+        (scores[int(attr)] for attr in unified_attrs),
+        dtype=np.float64,
+        count=len(unified_attrs),
+    )
@@ -217,3 +217,44 @@ def get_attrs_permutation(
         strategy=ObjsAttrsPermutationStrategy.ATTRS_BEFORE,
         seed=seed,
     )
+
+
+def get_stratified_objs_permutation(
+    values: np.ndarray,
+    seed: rght.Seed = None,
+) -> np.ndarray:
+    """Get permutation of objects whose prefixes are stratified samples.
+
+    Get random permutation of objects (given by their positions in ``values``) such
+    that every prefix of the permutation is a sample of objects stratified by
+    ``values``, i.e., the proportions of values in the prefix follow (up to rounding)
+    the proportions of values among all objects. Objects with the same value are
+    ordered randomly and objects of different values are interleaved, so that the
+    ``i``-th object of the ``k``-th value class (of size ``n_k``) is placed around the
+    relative position :code:`(i + 0.5) / n_k` of the permutation.
+
+    Args:
+        values: Values (e.g., decision values) of objects to stratify by.
+        seed: A seed to initialize random generator. Defaults to :obj:`None`.
+
+    Returns:
+        Output permutation.
+    """
+    values = np.asarray(values)
+    n_objs = len(values)
+    if n_objs == 0:
+        return np.arange(0, dtype=np.int64)
+    rng = np.random.default_rng(seed)
+    shuffled = rng.permutation(n_objs)
+    _, classes, counts = np.unique(
+        values[shuffled],
+        return_inverse=True,
+        return_counts=True,
+    )
+    classes = classes.reshape(-1)
+    # rank of every object within its class, following the shuffled order
+    by_class = np.argsort(classes, kind="stable")
+    ranks = np.empty(n_objs, dtype=np.int64)
+    ranks[by_class] = np.arange(n_objs) - np.repeat(np.cumsum(counts) - counts, counts)
+    keys = (ranks + 0.5) / counts[classes]
+    return shuffled[np.argsort(keys, kind="stable")]
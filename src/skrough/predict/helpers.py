@@ -7,6 +7,7 @@ import numpy as np
 
 import skrough.interface
 import skrough.typing as rght
+from skrough.algorithms.meta.helpers import get_parallel
 from skrough.algorithms.meta.processing import RNG_INTEGERS_PARAM
 from skrough.dataprep import prepare_factorized_array, prepare_factorized_vector
 from skrough.permutations import get_objs_permutation
@@ -89,7 +90,7 @@ class PredictionResultPreparer:
         return predictions
 
 
-@numba.njit(cache=True)
+@numba.njit(cache=True, nogil=True)
 def _predict(
     reference_group_ids: np.ndarray,
     reference_decisions_offsets: np.ndarray,
@@ -330,12 +331,14 @@ def predict_ensemble(
     return_proba: bool = False,
     seed: rght.Seed = None,
     n_jobs: int | None = None,
+    share_data: bool = False,
+    backend: str | None = None,
 ):
     no_answer_strategy_runner = NoAnswerStrategyRunner(no_answer_strategy)
 
     rng = np.random.default_rng(seed)
 
-    predictions_collection = joblib.Parallel(n_jobs=n_jobs)(
+    predictions_collection = get_parallel(n_jobs, backend, share_data)(
         joblib.delayed(model_predict_fun)(
             model=model,
             reference_data=reference_data,
@@ -29,6 +29,8 @@ def predict_objs_attrs_ensemble(
     preferred_prediction_dtype: type[np.generic] | None = None,
     seed: rght.Seed = None,
     n_jobs: int | None = None,
+    share_data: bool = False,
+    backend: str | None = None,
 ):
     # TODO: add to docstring that if no_answer_strategy is "missing" but
     # missing_decision is set to some "X" (assuming "X" being an actual decision
@@ -59,6 +61,8 @@ def predict_objs_attrs_ensemble(
         no_answer_strategy=no_answer_strategy,
         seed=seed,
         n_jobs=n_jobs,
+        share_data=share_data,
+        backend=backend,
     )
 
     if not return_proba:
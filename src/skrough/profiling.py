@@ -0,0 +1,202 @@
+"""Profiling of processing elements.
+
+The :mod:`skrough.profiling` module delivers :class:`Profiler` - an opt-in recorder of
+wall time, call counts and element counts of processing elements, i.e., aggregates of
+hooks and the hooks themselves. A profiler is attached to a
+:class:`~skrough.structs.state.ProcessingState` and the processing elements report to
+it under the path of node names they have in the description graph (cf.
+:meth:`~skrough.interface.Describable.get_description_graph`), e.g.,
+``stages/0/outer_loop/select/0`` for the first select hook of the first stage. The
+collected numbers can be exported to JSON, to the Chrome trace-event format (viewable
+in ``chrome://tracing`` or Perfetto) and can be used to annotate the description graph.
+"""
+
+import contextlib
+import json
+import os
+import threading
+import time
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from skrough.structs.description_node import DescriptionNode
+
+PROFILE_PATH_SEPARATOR = "/"
+
+NODE_META_PROFILE_CALLS_KEY = "profile_calls"
+NODE_META_PROFILE_SECONDS_KEY = "profile_seconds"
+NODE_META_PROFILE_ELEMENTS_KEY = "profile_elements"
+
+
+@dataclass
+class ProfileRecord:
+    """Numbers collected for a single processing element."""
+
+    calls: int = 0
+    """number of calls"""
+    seconds: float = 0.0
+    """total wall time of all calls"""
+    elements: int = 0
+    """total number of elements returned by all calls"""
+
+
+class Profiler:
+    """Recorder of wall time, call counts and element counts of processing elements.
+
+    Processing elements report to the profiler using :meth:`measure` which nests the
+    measured scopes, so that every record is identified by the path of node names
+    leading to the measured element. The profiler can be shared by processing runs
+    executed in threads of the same process (every thread keeps its own path). Other
+    processes (e.g., :mod:`joblib` process-based workers) get pickled copies of the
+    profiler and the numbers they collect are not sent back.
+
+    Args:
+        record_events: Whether to record every single call as a trace event, which is
+            required by :meth:`to_chrome_trace`. Defaults to :obj:`True`.
+    """
+
+    def __init__(self, record_events: bool = True):
+        self.record_events = record_events
+        self._records: dict[str, ProfileRecord] = {}
+        self._events: list[dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._start = time.perf_counter()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        del state["_local"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _get_path(self) -> list[str]:
+        if not hasattr(self._local, "path"):
+            self._local.path = []
+        return self._local.path
+
+    @contextlib.contextmanager
+    def measure(self, node_name: str) -> Iterator[ProfileRecord]:
+        """Measure a call of a processing element.
+
+        The element is identified by its ``node_name`` appended to the path of the
+        enclosing measured scopes. The yielded record can be used to report the number
+        of elements returned by the call, by increasing its ``elements`` value.
+
+        Args:
+            node_name: Node name of the measured element.
+
+        Yields:
+            A record collecting the numbers of the current call.
+        """
+        path = self._get_path()
+        path.append(node_name)
+        current = ProfileRecord(calls=1)
+        start = time.perf_counter()
+        try:
+            yield current
+        finally:
+            end = time.perf_counter()
+            key = PROFILE_PATH_SEPARATOR.join(path)
+            path.pop()
+            current.seconds = end - start
+            with self._lock:
+                record = self._records.setdefault(key, ProfileRecord())
+                record.calls += current.calls
+                record.seconds += current.seconds
+                record.elements += current.elements
+                if self.record_events:
+                    self._events.append(
+                        {
+                            "name": node_name,
+                            "cat": key,
+                            "ph": "X",
+                            "ts": (start - self._start) * 1e6,
+                            "dur": current.seconds * 1e6,
+                            "pid": os.getpid(),
+                            "tid": threading.get_ident(),
+                            "args": {"elements": current.elements},
+                        }
+                    )
+
+    def get_records(self) -> dict[str, ProfileRecord]:
+        """Get the collected records keyed by paths of node names.
+
+        Returns:
+            Copies of the collected records.
+        """
+        with self._lock:
+            return {
+                key: ProfileRecord(**asdict(record))
+                for key, record in self._records.items()
+            }
+
+    def to_json(self) -> str:
+        """Export the collected records to JSON.
+
+        Returns:
+            A JSON object mapping paths of node names to the collected numbers.
+        """
+        return json.dumps(
+            {key: asdict(record) for key, record in self.get_records().items()}
+        )
+
+    def to_chrome_trace(self) -> str:
+        """Export the recorded calls to the Chrome trace-event format.
+
+        Returns:
+            A JSON object with complete (``"X"``) events of all recorded calls.
+        """
+        with self._lock:
+            events = list(self._events)
+        return json.dumps({"traceEvents": events, "displayTimeUnit": "ms"})
+
+    def annotate(
+        self,
+        description_node: DescriptionNode,
+        root_path: str = "",
+    ) -> DescriptionNode:
+        """Annotate a description graph with the collected numbers.
+
+        The ``node_meta`` of every node of the graph for which a record was collected
+        is updated (in place) with the :const:`NODE_META_PROFILE_CALLS_KEY`,
+        :const:`NODE_META_PROFILE_SECONDS_KEY` and
+        :const:`NODE_META_PROFILE_ELEMENTS_KEY` entries.
+
+        Args:
+            description_node: The root of the description graph of the profiled
+                processing element.
+            root_path: Path of node names of the root node. Defaults to an empty path,
+                i.e., the processing element that was called with the profiled state.
+
+        Returns:
+            The annotated description graph, i.e., ``description_node``.
+        """
+        records = self.get_records()
+
+        def _annotate(node: DescriptionNode, path: str) -> None:
+            record = records.get(path)
+            if record is not None:
+                node.node_meta = {
+                    **(node.node_meta or {}),
+                    NODE_META_PROFILE_CALLS_KEY: record.calls,
+                    NODE_META_PROFILE_SECONDS_KEY: record.seconds,
+                    NODE_META_PROFILE_ELEMENTS_KEY: record.elements,
+                }
+            for child in node.children or []:
+                if child.node_name is None:
+                    continue
+                child_path = (
+                    f"{path}{PROFILE_PATH_SEPARATOR}{child.node_name}"
+                    if path
+                    else child.node_name
+                )
+                _annotate(child, child_path)
+
+        _annotate(description_node, root_path)
+        return description_node
@@ -105,7 +105,7 @@ def get_gamma_value(
     return len(pos) / len(x)
 
 
-@numba.njit(cache=True)
+@numba.njit(cache=True, nogil=True)
 def get_lower_upper_group_ids(
     membership_distr: np.ndarray,
 ) -> Tuple[np.ndarray, np.ndarray]:
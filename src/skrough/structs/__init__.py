@@ -2,6 +2,7 @@
 
 from skrough.structs.group_index import (  # noqa: F401
     GroupIndex,
+    GroupIndexCSR,
     GroupIndexDict,
     GroupIndexDictNumba,
     GroupIndexHash,
@@ -13,6 +14,7 @@ from skrough.structs.group_index import (  # noqa: F401
 
 __all__ = [
     "GroupIndex",
+    "GroupIndexCSR",
     "GroupIndexDict",
     "GroupIndexDictNumba",
     "GroupIndexHash",
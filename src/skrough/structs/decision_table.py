@@ -0,0 +1,181 @@
+"""Decision table structures."""
+
+from dataclasses import dataclass, field
+from typing import Self
+
+import numpy as np
+
+import skrough.typing as rght
+from skrough.dataprep import (
+    prepare_deduplicated_data,
+    prepare_factorized_array,
+    prepare_factorized_vector,
+)
+from skrough.disorder_score import get_disorder_score_stats
+from skrough.structs.disorder_score_stats import DisorderScoreStats
+from skrough.structs.group_index import resolve_group_index_class
+from skrough.structs.group_index._protocol import GroupIndexProtocol
+
+
+@dataclass
+class DecisionTable:
+    """A class to represent a factorized decision table.
+
+    A class to represent conditional attributes data along with decision values in the
+    factorized form required by the algorithms (cf.
+    :func:`~skrough.dataprep.prepare_factorized_array` and
+    :func:`~skrough.dataprep.prepare_factorized_vector`). The table keeps the mappings
+    of the factorized values back to the original ones and lazily caches the disorder
+    score statistics computed for it, so that it can be prepared once and passed to
+    many calls of the algorithms in place of raw data.
+
+    A table can be deduplicated, i.e., rows duplicated with respect to both the
+    conditional attributes and the decision are then collapsed into single objects
+    weighted by their multiplicities (cf.
+    :func:`~skrough.dataprep.prepare_deduplicated_data`). The objects of such a table
+    can be mapped back to the original rows with :meth:`get_original_objs`.
+    """
+
+    x: np.ndarray
+    """Factorized conditional attributes data."""
+
+    x_counts: np.ndarray
+    """Domain sizes of the conditional attributes."""
+
+    y: np.ndarray
+    """Factorized decision values."""
+
+    y_count: int
+    """Domain size of the decision."""
+
+    x_uniques: list[np.ndarray]
+    """Original values of every conditional attribute, given in the order of their
+    factorized codes."""
+
+    y_uniques: np.ndarray
+    """Original decision values, given in the order of their factorized codes."""
+
+    weights: np.ndarray | None = None
+    """Multiplicities of the objects of a deduplicated table, :obj:`None` otherwise."""
+
+    objs_inverse: np.ndarray | None = None
+    """The object of a deduplicated table for every original row, :obj:`None`
+    otherwise."""
+
+    _disorder_score_stats: dict[
+        tuple[rght.DisorderMeasure, type[GroupIndexProtocol]], DisorderScoreStats
+    ] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    @classmethod
+    def from_data(cls, x: np.ndarray, y: np.ndarray, deduplicate: bool = False):
+        """Create a new instance by factorizing the given data.
+
+        Args:
+            x: Conditional attributes data.
+            y: Decision values.
+            deduplicate: Whether to collapse duplicated rows into weighted objects.
+                Defaults to :obj:`False`.
+
+        Returns:
+            A new instance holding the factorized data.
+        """
+        x, x_counts, x_uniques = prepare_factorized_array(x, return_unique_values=True)
+        y, y_count, y_uniques = prepare_factorized_vector(y, return_unique_values=True)
+        weights = None
+        objs_inverse = None
+        if deduplicate:
+            x, y, weights, objs_inverse = prepare_deduplicated_data(x, y)
+        return cls(
+            x=x,
+            x_counts=x_counts,
+            y=y,
+            y_count=y_count,
+            x_uniques=x_uniques,
+            y_uniques=y_uniques,
+            weights=weights,
+            objs_inverse=objs_inverse,
+        )
+
+    @classmethod
+    def from_data_like(
+        cls,
+        x: Self | np.ndarray,
+        y: np.ndarray | None = None,
+        deduplicate: bool = False,
+    ):
+        """Create a new instance unless a decision table is already given.
+
+        Args:
+            x: A decision table or conditional attributes data.
+            y: Decision values. It should be given if and only if ``x`` is not a
+                decision table. Defaults to :obj:`None`.
+            deduplicate: Whether to collapse duplicated rows into weighted objects
+                when a new instance is created. A given decision table is used as is,
+                so it should already be deduplicated if deduplication is requested.
+                Defaults to :obj:`False`.
+
+        Raises:
+            ValueError: When ``y`` is given along with a decision table, when ``y`` is
+                not given along with raw data or when deduplication is requested for
+                a decision table that is not deduplicated.
+
+        Returns:
+            The ``x`` decision table or a new instance created from ``x`` and ``y``.
+        """
+        if isinstance(x, DecisionTable):
+            if y is not None:
+                raise ValueError("Decision values cannot be given with decision table")
+            if deduplicate and x.weights is None:
+                raise ValueError("Decision table should be deduplicated when requested")
+            return x
+        if y is None:
+            raise ValueError("Decision values should be given")
+        return cls.from_data(x, y, deduplicate=deduplicate)
+
+    def get_original_objs(self, objs: rght.IndexListLike) -> list[int]:
+        """Get the original rows represented by the given objects.
+
+        Args:
+            objs: Objects of the table.
+
+        Returns:
+            The original rows represented by ``objs``, in increasing order for a
+            deduplicated table, or ``objs`` otherwise.
+        """
+        if self.objs_inverse is None:
+            return [int(obj) for obj in objs]
+        return np.flatnonzero(np.isin(self.objs_inverse, objs)).tolist()
+
+    def get_disorder_score_stats(
+        self,
+        disorder_fun: rght.DisorderMeasure,
+        group_index_class: str | type[GroupIndexProtocol] | None = None,
+    ) -> DisorderScoreStats:
+        """Get the base and total disorder score of the table.
+
+        The statistics are computed with
+        :func:`~skrough.disorder_score.get_disorder_score_stats` on the first call for
+        the given disorder measure and group index implementation and they are reused
+        on the consecutive calls.
+
+        Args:
+            disorder_fun: Disorder measure function.
+            group_index_class: The group index implementation to use. Defaults to
+                :obj:`None`, i.e., the default implementation.
+
+        Returns:
+            Disorder score statistics with the base and total disorder score.
+        """
+        group_index_class = resolve_group_index_class(group_index_class)
+        key = (disorder_fun, group_index_class)
+        if key not in self._disorder_score_stats:
+            self._disorder_score_stats[key] = get_disorder_score_stats(
+                x=self.x,
+                x_counts=self.x_counts,
+                y=self.y,
+                y_count=self.y_count,
+                disorder_fun=disorder_fun,
+                group_index_class=group_index_class,
+                weights=self.weights,
+            )
+        return self._disorder_score_stats[key]
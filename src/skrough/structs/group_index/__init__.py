@@ -1,6 +1,6 @@
 """Group index subpackage.
 
-Provides the :class:`GroupIndexProtocol` interface and seven concrete
+Provides the :class:`GroupIndexProtocol` interface and eight concrete
 implementations:
 
 - :class:`GroupIndexNumba` -- numba-accelerated (default, exposed as
@@ -13,8 +13,11 @@ implementations:
 - :class:`GroupIndexDictNumba` -- dict-based split, numba-jitted disorder
 - :class:`GroupIndexLazy` -- lazy hash-based, vectorized string concat,
   sequential group IDs
+- :class:`GroupIndexCSR` -- objects kept contiguous by group (permutation
+  plus group offsets), counting-sort split, linear-scan disorder
 """
 
+from skrough.structs.group_index._csr import GroupIndexCSR
 from skrough.structs.group_index._dict import GroupIndexDict
 from skrough.structs.group_index._dict_numba import GroupIndexDictNumba
 from skrough.structs.group_index._hash import GroupIndexHash
@@ -27,6 +30,7 @@ from skrough.structs.group_index._pure import GroupIndexPure
 
 __all__ = [
     "GroupIndex",
+    "GroupIndexCSR",
     "GroupIndexDict",
     "GroupIndexDictNumba",
     "GroupIndexHash",
@@ -47,6 +51,7 @@ GROUP_INDEX_BY_NAME: dict[str, type[GroupIndexProtocol]] = {
     "dict": GroupIndexDict,
     "dict_numba": GroupIndexDictNumba,
     "lazy": GroupIndexLazy,
+    "csr": GroupIndexCSR,
 }
 """String names for built-in :class:`GroupIndexProtocol` implementations."""
 
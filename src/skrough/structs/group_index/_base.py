@@ -1,6 +1,6 @@
 """Base class with shared group index logic."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Sequence
 
 import numpy as np
@@ -8,6 +8,7 @@ import numpy.typing as npt
 import pandas.core.sorting
 
 import skrough.typing as rght
+from skrough.structs.group_index._tracking import DisorderTracker
 from skrough.unify import unify_index_list
 
 
@@ -25,6 +26,9 @@ class GroupIndexBase:
     """index that assigns objects (by their positions in the index) to groups"""
     n_groups: int
     """number of groups"""
+    _disorder_tracker: DisorderTracker | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def n_objs(self) -> int:
@@ -105,6 +109,36 @@ class GroupIndexBase:
         if len(values) != self.n_objs:
             raise ValueError("Values vector length does not match the group index")
 
+    def _check_weights(self, weights):
+        if len(weights) != self.n_objs:
+            raise ValueError("Weights vector length does not match the group index")
+        if not np.issubdtype(np.asarray(weights).dtype, np.integer):
+            raise ValueError("Weights should be integers")
+
+    def _get_group_ids(self) -> tuple[npt.NDArray[np.int64], int]:
+        """Get 0-based group ids of objects (less than the number of groups)."""
+        return self.index, self.n_groups
+
+    def _get_weighted_distribution(
+        self,
+        values: npt.NDArray[np.int64],
+        values_count: int,
+        weights: npt.NDArray[np.int64],
+    ) -> npt.NDArray[np.int64]:
+        """Compute decision distribution within groups with objects weighted."""
+        self._check_values(values)
+        self._check_weights(weights)
+        if self.n_objs == 0:
+            return np.zeros((0, values_count), dtype=np.int64)
+        group_ids, n_groups = self._get_group_ids()
+        result = np.bincount(
+            np.asarray(group_ids, dtype=np.int64) * values_count + values,
+            weights=weights,
+            minlength=n_groups * values_count,
+        )
+        # sums of integer weights are exact in floating point below 2**53
+        return result.astype(np.int64).reshape(n_groups, values_count)
+
     def split(
         self,
         values: npt.NDArray[np.int64],
@@ -116,7 +150,25 @@ class GroupIndexBase:
 
         It is up to the user to ensure that ``values_count`` correctly
         represents ``values``. Otherwise, the behavior is unspecified.
+
+        If disorder tracking is enabled (cf. :meth:`track_disorder`), the
+        per-group disorder contributions are carried over to the result and
+        updated for the broken groups only.
         """
+        result = self._split(values, values_count, compress)
+        if self._disorder_tracker is not None:
+            result._disorder_tracker = self._disorder_tracker.split(
+                values,
+                values_count,
+            )
+        return result
+
+    def _split(
+        self,
+        values: npt.NDArray[np.int64],
+        values_count: int,
+        compress: bool = False,
+    ):
         self._check_values(values)
 
         result = self.create_empty()
@@ -140,9 +192,14 @@ class GroupIndexBase:
         self,
         values: npt.NDArray[np.int64],
         values_count: int,
+        weights: npt.NDArray[np.int64] | None = None,
     ) -> npt.NDArray[np.int64]:
         """Compute decision distribution within groups of objects.
 
+        If ``weights`` are given, every object is counted as many times as its
+        weight, e.g., the number of duplicated rows it represents. The weights
+        should be integers, they are never rounded.
+
         It is up to the user to ensure that ``values_count`` correctly
         represents ``values``. Otherwise, the behavior is unspecified.
         """
@@ -153,17 +210,86 @@ class GroupIndexBase:
         values: npt.NDArray[np.int64],
         values_count: int,
         disorder_fun: rght.DisorderMeasure,
+        weights: npt.NDArray[np.int64] | None = None,
     ) -> rght.DisorderMeasureReturnType:
         """Compute disorder score for the given grouping of objects.
 
+        If ``weights`` are given, every object is counted as many times as its
+        (integer) weight (cf. :meth:`get_distribution`).
+
         It is up to the user to ensure that ``values_count`` correctly
         represents ``values``. Otherwise, the behavior is unspecified.
         """
         self._check_values(values)
 
+        if weights is not None:
+            distribution = self._get_weighted_distribution(
+                values, values_count, weights
+            )
+            return disorder_fun(distribution, int(np.sum(weights)))
         distribution = self.get_distribution(values, values_count)
         return disorder_fun(distribution, self.n_objs)
 
+    def _get_disorder_score_bounded(
+        self,
+        values: npt.NDArray[np.int64],
+        values_count: int,
+        disorder_fun: rght.DisorderMeasure,
+        abort_above: float | None,
+    ) -> rght.DisorderMeasureReturnType:
+        """Compute disorder score, possibly stopping once it exceeds ``abort_above``.
+
+        This generic implementation always computes the exact score; subclasses
+        accumulating the score group by group override it to stop early (cf.
+        :meth:`get_disorder_score_after_split`).
+        """
+        return self.get_disorder_score(values, values_count, disorder_fun)
+
+    def track_disorder(
+        self,
+        values: npt.NDArray[np.int64],
+        values_count: int,
+        disorder_fun: rght.DisorderMeasure,
+    ) -> None:
+        """Start maintaining the disorder score incrementally across splits.
+
+        Computes the disorder contribution of every group and their total.
+        Group indices derived from this one by :meth:`split` update both
+        incrementally, so that :meth:`get_tracked_disorder_score` does not need
+        to recompute the decision distribution. The disorder measure is assumed
+        to be a ``numba``-compiled sum of per-group terms which are zero for
+        decision-homogeneous groups, as it is for all measures from
+        :mod:`skrough.disorder_measures`.
+
+        It is up to the user to ensure that ``values_count`` correctly
+        represents ``values``. Otherwise, the behavior is unspecified.
+        """
+        self._check_values(values)
+        self._disorder_tracker = DisorderTracker.from_index(
+            self.index,
+            values,
+            values_count,
+            disorder_fun,
+        )
+
+    def get_tracked_disorder_score(
+        self,
+        values: npt.NDArray[np.int64],
+        values_count: int,
+        disorder_fun: rght.DisorderMeasure,
+    ) -> rght.DisorderMeasureReturnType:
+        """Get the disorder score, using the tracked total when available.
+
+        The tracked total (cf. :meth:`track_disorder`) is used if tracking was
+        started for the very same ``values`` array (compared by identity),
+        ``values_count`` and ``disorder_fun``. Otherwise, the score is computed
+        from scratch with :meth:`get_disorder_score`.
+        """
+        tracker = self._disorder_tracker
+        if tracker is not None and tracker.matches(values, values_count, disorder_fun):
+            return tracker.total
+        return self.get_disorder_score(values, values_count, disorder_fun)
+
     def get_disorder_score_after_split(
         self,
         split_values: npt.NDArray[np.int64],
@@ -171,6 +297,77 @@ class GroupIndexBase:
         values: npt.NDArray[np.int64],
         values_count: int,
         disorder_fun: rght.DisorderMeasure,
+        abort_above: float | None = None,
     ):
-        split_group_index = self.split(split_values, split_values_count, compress=False)
-        return split_group_index.get_disorder_score(values, values_count, disorder_fun)
+        """Compute disorder score after splitting by additional attribute.
+
+        When ``abort_above`` is given, the computation may stop as soon as the
+        partially accumulated score exceeds it. The exact score is returned
+        whenever it does not exceed ``abort_above``; otherwise a value greater
+        than ``abort_above`` (and not greater than the exact score) is returned.
+        It relies on the disorder measure being a sum of non-negative per-group
+        terms, as it is for all measures from :mod:`skrough.disorder_measures`.
+        """
+        split_group_index = self._split(
+            split_values, split_values_count, compress=False
+        )
+        return split_group_index._get_disorder_score_bounded(
+            values, values_count, disorder_fun, abort_above
+        )
+
+    def get_disorder_scores_after_splits(
+        self,
+        x: npt.NDArray[np.int64],
+        x_counts: npt.NDArray[np.int64],
+        attrs: rght.IndexListLike,
+        values: npt.NDArray[np.int64],
+        values_count: int,
+        disorder_fun: rght.DisorderMeasure,
+        weights: npt.NDArray[np.int64] | None = None,
+    ) -> npt.NDArray[np.float64]:
+        """Compute disorder scores after splitting by each of the given attributes.
+
+        The result is equivalent to calling ``get_disorder_score_after_split``
+        for the ``x[:, attr]`` column of every attribute in ``attrs``, i.e.,
+        the ``i``-th score corresponds to ``attrs[i]``. This generic
+        implementation does exactly that; subclasses override it to score the
+        whole block of candidate attributes in a single pass over objects.
+
+        If ``weights`` are given, every object is counted as many times as its
+        (integer) weight (cf. :meth:`get_distribution`). This generic
+        implementation then materializes the split by every attribute and scores it
+        with :meth:`get_disorder_score`, which is considerably slower.
+
+        It is up to the user to ensure that ``x_counts`` and ``values_count``
+        correctly represent ``x`` and ``values``. Otherwise, the behavior is
+        unspecified.
+        """
+        unified_attrs = unify_index_list(attrs)
+        if weights is not None:
+            return np.fromiter(
+                (
+                    self.split(x[:, attr], int(x_counts[attr])).get_disorder_score(
+                        values,
+                        values_count,
+                        disorder_fun,
+                        weights=weights,
+                    )
+                    for attr in unified_attrs
+                ),
+                dtype=np.float64,
+                count=len(unified_attrs),
+            )
+        return np.fromiter(
+            (
+                self.get_disorder_score_after_split(
+                    x[:, attr],
+                    int(x_counts[attr]),
+                    values,
+                    values_count,
+                    disorder_fun,
+                )
+                for attr in unified_attrs
+            ),
+            dtype=np.float64,
+            count=len(unified_attrs),
+        )
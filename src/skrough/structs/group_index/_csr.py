@@ -0,0 +1,350 @@
+"""Group index keeping objects sorted by group (CSR-like layout).
+
+Besides the flat ``index`` array, this implementation maintains a
+permutation of objects ``_perm`` in which objects of every group are stored
+contiguously, and group offsets ``_offsets`` such that objects of group
+``g`` are ``_perm[_offsets[g]:_offsets[g + 1]]`` -- the same layout as the
+row pointers/column indices pair of a CSR sparse matrix.
+
+``split`` refines every group with a per-group counting sort (split values
+are numbered in the order of their first occurrence within the group), so
+groups stay contiguous and keys are always sequential -- no ``argsort`` and
+no post-hoc compactification are ever needed.  Distributions and disorder
+scores are computed by linear scans over the contiguous group slices.
+"""
+
+from dataclasses import dataclass, field
+
+import numba
+import numpy as np
+import numpy.typing as npt
+from numba.extending import is_jitted
+
+import skrough.typing as rght
+from skrough.structs.group_index._base import GroupIndexBase
+from skrough.structs.group_index._dict_numba import _streaming_disorder_after_splits
+from skrough.unify import unify_index_list
+
+
+@numba.njit(cache=True, nogil=True)
+def _build_layout(
+    index: npt.NDArray[np.int64],
+    n_groups: int,
+) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+    """Stable counting sort of objects by their group."""
+    n_objs = index.shape[0]
+    offsets = np.zeros(n_groups + 1, dtype=np.int64)
+    for i in range(n_objs):
+        offsets[index[i] + 1] += 1
+    for g in range(n_groups):
+        offsets[g + 1] += offsets[g]
+    positions = offsets[:-1].copy()
+    perm = np.empty(n_objs, dtype=np.int64)
+    for i in range(n_objs):
+        perm[positions[index[i]]] = i
+        positions[index[i]] += 1
+    return perm, offsets
+
+
+@numba.njit(cache=True, nogil=True)
+def _refine_layout(
+    perm: npt.NDArray[np.int64],
+    offsets: npt.NDArray[np.int64],
+    values: npt.NDArray[np.int64],
+    values_count: int,
+) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+    """Refine groups with a per-group counting sort on split values.
+
+    Within every group, split values are numbered in the order of their first
+    occurrence (using a stamp array, so no per-group ``values_count`` sized
+    work is done) and objects are then placed contiguously by that number.
+    Returns the new index, permutation and offsets.
+    """
+    n_objs = perm.shape[0]
+    n_groups = offsets.shape[0] - 1
+    new_index = np.empty(n_objs, dtype=np.int64)
+    new_perm = np.empty(n_objs, dtype=np.int64)
+    new_offsets = np.zeros(n_objs + 1, dtype=np.int64)
+    stamp = np.full(values_count, -1, dtype=np.int64)
+    slot = np.empty(values_count, dtype=np.int64)
+    n_new_groups = 0
+    for g in range(n_groups):
+        start = offsets[g]
+        end = offsets[g + 1]
+        first_new_group = n_new_groups
+        for k in range(start, end):
+            value = values[perm[k]]
+            if stamp[value] != g:
+                stamp[value] = g
+                slot[value] = n_new_groups
+                n_new_groups += 1
+            new_offsets[slot[value] + 1] += 1
+        position = start
+        for new_group in range(first_new_group, n_new_groups):
+            count = new_offsets[new_group + 1]
+            new_offsets[new_group + 1] = position
+            position += count
+        for k in range(start, end):
+            obj = perm[k]
+            new_group = slot[values[obj]]
+            new_perm[new_offsets[new_group + 1]] = obj
+            new_offsets[new_group + 1] += 1
+            new_index[obj] = new_group
+    return new_index, new_perm, new_offsets[: n_new_groups + 1]
+
+
+@numba.njit(cache=True, nogil=True)
+def _get_distribution(
+    perm: npt.NDArray[np.int64],
+    offsets: npt.NDArray[np.int64],
+    values: npt.NDArray[np.int64],
+    values_count: int,
+) -> npt.NDArray[np.int64]:
+    """Compute decision distribution by scanning contiguous group slices."""
+    n_groups = offsets.shape[0] - 1
+    result = np.zeros(shape=(n_groups, values_count), dtype=np.int64)
+    for g in range(n_groups):
+        for k in range(offsets[g], offsets[g + 1]):
+            result[g, values[perm[k]]] += 1
+    return result
+
+
+@numba.njit(cache=True, nogil=True)
+def _get_disorder_score(
+    perm: npt.NDArray[np.int64],
+    offsets: npt.NDArray[np.int64],
+    values: npt.NDArray[np.int64],
+    values_count: int,
+    disorder_fun: rght.DisorderMeasure,
+) -> float:
+    """Streaming disorder score over contiguous group slices."""
+    n_objs = perm.shape[0]
+    n_groups = offsets.shape[0] - 1
+    counts = np.zeros(shape=(1, values_count), dtype=np.int64)
+    total = 0.0
+    for g in range(n_groups):
+        start = offsets[g]
+        end = offsets[g + 1]
+        if start == end:
+            continue
+        for k in range(start, end):
+            counts[0, values[perm[k]]] += 1
+        total += disorder_fun(counts, n_objs)
+        for k in range(start, end):
+            counts[0, values[perm[k]]] = 0
+    return total
+
+
+@numba.njit(cache=True, nogil=True)
+def _get_disorder_score_after_split(
+    perm: npt.NDArray[np.int64],
+    offsets: npt.NDArray[np.int64],
+    split_values: npt.NDArray[np.int64],
+    split_values_count: int,
+    values: npt.NDArray[np.int64],
+    values_count: int,
+    disorder_fun: rght.DisorderMeasure,
+    abort_above: float,
+) -> tuple[float, int]:
+    """Streaming disorder score after a split over contiguous group slices.
+
+    For every group the ``split values x decisions`` counts are gathered in
+    a reusable buffer whose touched cells are reset afterwards, so neither
+    the split group index nor a global distribution is materialized. The scan
+    stops as soon as the accumulated score exceeds ``abort_above``.
+
+    Returns the (possibly partial) score and the number of objects scanned.
+    """
+    n_objs = perm.shape[0]
+    n_groups = offsets.shape[0] - 1
+    counts = np.zeros(shape=(split_values_count, values_count), dtype=np.int64)
+    total = 0.0
+    for g in range(n_groups):
+        start = offsets[g]
+        end = offsets[g + 1]
+        if start == end:
+            continue
+        for k in range(start, end):
+            obj = perm[k]
+            counts[split_values[obj], values[obj]] += 1
+        total += disorder_fun(counts, n_objs)
+        if total > abort_above:
+            return total, end
+        for k in range(start, end):
+            obj = perm[k]
+            counts[split_values[obj], values[obj]] = 0
+    return total, n_objs
+
+
+@dataclass
+class GroupIndexCSR(GroupIndexBase):
+    """Group index with objects stored contiguously by group.
+
+    Keeps the flat ``index`` together with a permutation of objects
+    ``_perm`` and group offsets ``_offsets`` (objects of group ``g`` are
+    ``_perm[_offsets[g]:_offsets[g + 1]]``).  The layout is built with a
+    counting sort on first use and is then maintained by ``split``, which
+    refines every group with a per-group counting sort.  Resulting group
+    keys are always sequential, hence ``compress`` is only needed for group
+    indices created from an index with gaps.
+
+    All distribution and disorder computations are linear scans over the
+    contiguous group slices run in ``@numba.njit``-compiled loops, with
+    no ``argsort`` and no ``n_groups x n_values`` matrix for the disorder
+    scores. Disorder measures which are not ``numba``-compiled cannot be
+    called from these loops, so they are given whole distributions instead.
+    """
+
+    _perm: npt.NDArray[np.int64] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _offsets: npt.NDArray[np.int64] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def _get_layout(self) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+        """Return the permutation and offsets, building them on first use."""
+        if self._perm is None:
+            self._perm, self._offsets = _build_layout(
+                np.asarray(self.index, dtype=np.int64),
+                int(self.n_groups),
+            )
+        return self._perm, self._offsets
+
+    def _split(
+        self,
+        values: npt.NDArray[np.int64],
+        values_count: int,
+        compress: bool = False,
+    ):
+        """Split groups with a per-group counting sort.
+
+        Groups stay contiguous in the permutation and new group keys are
+        always sequential, so ``compress`` has no effect.
+        """
+        self._check_values(values)
+
+        perm, offsets = self._get_layout()
+        new_index, new_perm, new_offsets = _refine_layout(
+            perm, offsets, values, values_count
+        )
+        result = type(self)(index=new_index, n_groups=len(new_offsets) - 1)
+        result._perm = new_perm
+        result._offsets = new_offsets
+        return result
+
+    def get_distribution(
+        self,
+        values: npt.NDArray[np.int64],
+        values_count: int,
+        weights: npt.NDArray[np.int64] | None = None,
+    ) -> npt.NDArray[np.int64]:
+        if weights is not None:
+            return self._get_weighted_distribution(values, values_count, weights)
+        self._check_values(values)
+        return _get_distribution(*self._get_layout(), values, values_count)
+
+    def get_disorder_score(
+        self,
+        values: npt.NDArray[np.int64],
+        values_count: int,
+        disorder_fun: rght.DisorderMeasure,
+        weights: npt.NDArray[np.int64] | None = None,
+    ) -> rght.DisorderMeasureReturnType:
+        if weights is not None or not is_jitted(disorder_fun):
+            return super().get_disorder_score(
+                values, values_count, disorder_fun, weights
+            )
+        self._check_values(values)
+
+        n = self.n_objs
+        if n == 0:
+            return disorder_fun(
+                np.zeros((0, values_count), dtype=np.int64),
+                n,
+            )
+
+        perm, offsets = self._get_layout()
+        return _get_disorder_score(
+            perm,
+            offsets,
+            values,
+            values_count,
+            disorder_fun,
+        )
+
+    def get_disorder_score_after_split(
+        self,
+        split_values: npt.NDArray[np.int64],
+        split_values_count: int,
+        values: npt.NDArray[np.int64],
+        values_count: int,
+        disorder_fun: rght.DisorderMeasure,
+        abort_above: float | None = None,
+    ) -> rght.DisorderMeasureReturnType:
+        if not is_jitted(disorder_fun):
+            return super().get_disorder_score_after_split(
+                split_values,
+                split_values_count,
+                values,
+                values_count,
+                disorder_fun,
+                abort_above,
+            )
+        self._check_values(split_values)
+        self._check_values(values)
+
+        n = self.n_objs
+        if n == 0:
+            return disorder_fun(
+                np.zeros((0, values_count), dtype=np.int64),
+                n,
+            )
+
+        perm, offsets = self._get_layout()
+        score, _ = _get_disorder_score_after_split(
+            perm,
+            offsets,
+            split_values,
+            split_values_count,
+            values,
+            values_count,
+            disorder_fun,
+            np.inf if abort_above is None else float(abort_above),
+        )
+        return score
+
+    def get_disorder_scores_after_splits(
+        self,
+        x: npt.NDArray[np.int64],
+        x_counts: npt.NDArray[np.int64],
+        attrs: rght.IndexListLike,
+        values: npt.NDArray[np.int64],
+        values_count: int,
+        disorder_fun: rght.DisorderMeasure,
+        weights: npt.NDArray[np.int64] | None = None,
+    ) -> npt.NDArray[np.float64]:
+        if weights is not None or not is_jitted(disorder_fun):
+            return super().get_disorder_scores_after_splits(
+                x, x_counts, attrs, values, values_count, disorder_fun, weights
+            )
+        self._check_values(values)
+
+        unified_attrs = unify_index_list(attrs)
+        n = self.n_objs
+        if n == 0:
+            score = disorder_fun(np.zeros((0, values_count), dtype=np.int64), n)
+            return np.full(len(unified_attrs), score, dtype=np.float64)
+
+        perm, _ = self._get_layout()
+        return _streaming_disorder_after_splits(
+            self.index[perm],
+            perm,
+            x,
+            np.asarray(x_counts, dtype=np.int64),
+            unified_attrs,
+            values,
+            values_count,
+            n,
+            disorder_fun,
+        )
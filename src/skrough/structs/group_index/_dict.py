@@ -88,7 +88,7 @@ class GroupIndexDict(GroupIndexBase):
         result._groups = dict(groups)
         return result
 
-    def split(
+    def _split(
         self,
         values: npt.NDArray[np.int64],
         values_count: int,
@@ -128,7 +128,10 @@ class GroupIndexDict(GroupIndexBase):
         self,
         values: npt.NDArray[np.int64],
         values_count: int,
+        weights: npt.NDArray[np.int64] | None = None,
     ) -> npt.NDArray[np.int64]:
+        if weights is not None:
+            return self._get_weighted_distribution(values, values_count, weights)
         self._check_values(values)
         result = np.zeros((self.n_groups, values_count), dtype=np.int64)
         for group_key, obj_indices in self._groups.items():
@@ -141,6 +144,22 @@ class GroupIndexDict(GroupIndexBase):
         values: npt.NDArray[np.int64],
         values_count: int,
         disorder_fun: rght.DisorderMeasure,
+        weights: npt.NDArray[np.int64] | None = None,
+    ) -> rght.DisorderMeasureReturnType:
+        if weights is not None:
+            return super().get_disorder_score(
+                values, values_count, disorder_fun, weights
+            )
+        return self._get_disorder_score_bounded(
+            values, values_count, disorder_fun, None
+        )
+
+    def _get_disorder_score_bounded(
+        self,
+        values: npt.NDArray[np.int64],
+        values_count: int,
+        disorder_fun: rght.DisorderMeasure,
+        abort_above: float | None,
     ) -> rght.DisorderMeasureReturnType:
         self._check_values(values)
 
@@ -161,5 +180,65 @@ class GroupIndexDict(GroupIndexBase):
 
             per_group_row = counts.reshape(1, -1)
             total += disorder_fun(per_group_row, n)
+            if abort_above is not None and total > abort_above:
+                break
 
         return total
+
+    def get_disorder_scores_after_splits(
+        self,
+        x: npt.NDArray[np.int64],
+        x_counts: npt.NDArray[np.int64],
+        attrs: rght.IndexListLike,
+        values: npt.NDArray[np.int64],
+        values_count: int,
+        disorder_fun: rght.DisorderMeasure,
+        weights: npt.NDArray[np.int64] | None = None,
+    ) -> npt.NDArray[np.float64]:
+        """Compute disorder scores after splitting by each of the given attributes.
+
+        The group dicts are iterated only once for the whole block of
+        attributes.  For every group, the ``split values x decisions``
+        counts of all attributes are gathered with a single
+        ``numpy.bincount`` and each attribute's per-group rows are passed to
+        the disorder function with ``n_elements = n_objs``.
+        """
+        if weights is not None:
+            return super().get_disorder_scores_after_splits(
+                x, x_counts, attrs, values, values_count, disorder_fun, weights
+            )
+        self._check_values(values)
+
+        unified_attrs = unify_index_list(attrs)
+        n_attrs = len(unified_attrs)
+        n = self.n_objs
+        if n == 0:
+            score = disorder_fun(np.zeros((0, values_count), dtype=np.int64), n)
+            return np.full(n_attrs, score, dtype=np.float64)
+
+        result = np.zeros(n_attrs, dtype=np.float64)
+        if n_attrs == 0:
+            return result
+
+        split_counts = np.asarray(x_counts, dtype=np.int64)[unified_attrs]
+        max_split_count = int(split_counts.max())
+        block_size = max_split_count * values_count
+        offsets = np.arange(n_attrs, dtype=np.int64) * block_size
+
+        for obj_indices in self._groups.values():
+            if not obj_indices:
+                continue
+
+            codes = (
+                x[np.ix_(obj_indices, unified_attrs)] * values_count
+                + values[obj_indices].reshape(-1, 1)
+                + offsets
+            )
+            counts = np.bincount(
+                codes.ravel(),
+                minlength=n_attrs * block_size,
+            ).reshape(n_attrs, max_split_count, values_count)
+            for k in range(n_attrs):
+                result[k] += disorder_fun(counts[k, : split_counts[k]], n)
+
+        return result
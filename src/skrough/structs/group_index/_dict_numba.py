@@ -12,25 +12,29 @@ import numpy as np
 import numpy.typing as npt
 
 import numba
+from numba.extending import is_jitted
 
 import skrough.typing as rght
 from skrough.structs.group_index._dict import GroupIndexDict
+from skrough.unify import unify_index_list
 
 
-@numba.njit(cache=True)
+@numba.njit(cache=True, nogil=True)
 def _streaming_disorder(
     sorted_groups: npt.NDArray[np.int64],
     sorted_values: npt.NDArray[np.int64],
     values_count: int,
     n_objs: int,
     disorder_fun: rght.DisorderMeasure,
+    abort_above: float,
 ) -> float:
     """Streaming disorder score from pre-sorted index and values.
 
     Iterates contiguous groups inside a numb-jitted loop, calling
     ``disorder_fun`` on per-group 1xV rows.  Because the entire loop is
     compiled, there is no Python overhead per group and no numba boundary
-    crossing per ``disorder_fun`` call.
+    crossing per ``disorder_fun`` call.  The loop stops as soon as the
+    accumulated score exceeds ``abort_above``.
     """
     total = 0.0
     i = 0
@@ -44,10 +48,61 @@ def _streaming_disorder(
             cnt[sorted_values[k]] += 1
 
         total += disorder_fun(cnt.reshape(1, -1), n_objs)
+        if total > abort_above:
+            break
         i = j
     return total
 
 
+@numba.njit(cache=True, nogil=True)
+def _streaming_disorder_after_splits(
+    sorted_groups: npt.NDArray[np.int64],
+    order: npt.NDArray[np.int64],
+    x: npt.NDArray[np.int64],
+    x_counts: npt.NDArray[np.int64],
+    attrs: npt.NDArray[np.int64],
+    values: npt.NDArray[np.int64],
+    values_count: int,
+    n_objs: int,
+    disorder_fun: rght.DisorderMeasure,
+) -> npt.NDArray[np.float64]:
+    """Streaming disorder scores after splitting by each of the given attributes.
+
+    Objects are visited group by group (``order`` sorts them by group) and,
+    for every group, the ``split values x decisions`` counts of all
+    attributes are gathered in a single pass over the group's objects. The
+    per-attribute counts are kept in one reusable buffer whose touched cells
+    are reset after each group, so the memory used does not depend on the
+    number of groups.
+    """
+    n_attrs = attrs.shape[0]
+    result = np.zeros(n_attrs, dtype=np.float64)
+    max_split_count = 0
+    for t in range(n_attrs):
+        max_split_count = max(max_split_count, x_counts[attrs[t]])
+    buffer = np.zeros((n_attrs, max_split_count, values_count), dtype=np.int64)
+    i = 0
+    while i < n_objs:
+        j = i + 1
+        while j < n_objs and sorted_groups[j] == sorted_groups[i]:
+            j += 1
+
+        for k in range(i, j):
+            obj = order[k]
+            for t in range(n_attrs):
+                buffer[t, x[obj, attrs[t]], values[obj]] += 1
+
+        for t in range(n_attrs):
+            result[t] += disorder_fun(buffer[t, : x_counts[attrs[t]]], n_objs)
+
+        for k in range(i, j):
+            obj = order[k]
+            for t in range(n_attrs):
+                buffer[t, x[obj, attrs[t]], values[obj]] = 0
+        i = j
+    return result
+
+
 class GroupIndexDictNumba(GroupIndexDict):
     """Dict-based group index with numba-jitted disorder computation.
 
@@ -55,7 +110,9 @@ class GroupIndexDictNumba(GroupIndexDict):
     :class:`GroupIndexDict` (implicit compactification via the ``M``
     helper dict).  ``get_disorder_score`` sorts objects by group index
     and runs the per-group counting and disorder-function calls entirely
-    inside a ``@numba.njit``-compiled loop.
+    inside a ``@numba.njit``-compiled loop.  Disorder measures which are
+    not ``numba``-compiled are handled by the :class:`GroupIndexDict`
+    implementation instead.
     """
 
     def get_disorder_score(
@@ -63,7 +120,27 @@ class GroupIndexDictNumba(GroupIndexDict):
         values: npt.NDArray[np.int64],
         values_count: int,
         disorder_fun: rght.DisorderMeasure,
+        weights: npt.NDArray[np.int64] | None = None,
+    ) -> rght.DisorderMeasureReturnType:
+        if weights is not None:
+            return super().get_disorder_score(
+                values, values_count, disorder_fun, weights
+            )
+        return self._get_disorder_score_bounded(
+            values, values_count, disorder_fun, None
+        )
+
+    def _get_disorder_score_bounded(
+        self,
+        values: npt.NDArray[np.int64],
+        values_count: int,
+        disorder_fun: rght.DisorderMeasure,
+        abort_above: float | None,
     ) -> rght.DisorderMeasureReturnType:
+        if not is_jitted(disorder_fun):
+            return super()._get_disorder_score_bounded(
+                values, values_count, disorder_fun, abort_above
+            )
         self._check_values(values)
 
         n = self.n_objs
@@ -80,14 +157,53 @@ class GroupIndexDictNumba(GroupIndexDict):
             values_count,
             n,
             disorder_fun,
+            np.inf if abort_above is None else float(abort_above),
+        )
+
+    def get_disorder_scores_after_splits(
+        self,
+        x: npt.NDArray[np.int64],
+        x_counts: npt.NDArray[np.int64],
+        attrs: rght.IndexListLike,
+        values: npt.NDArray[np.int64],
+        values_count: int,
+        disorder_fun: rght.DisorderMeasure,
+        weights: npt.NDArray[np.int64] | None = None,
+    ) -> npt.NDArray[np.float64]:
+        if weights is not None or not is_jitted(disorder_fun):
+            return super().get_disorder_scores_after_splits(
+                x, x_counts, attrs, values, values_count, disorder_fun, weights
+            )
+        self._check_values(values)
+
+        unified_attrs = unify_index_list(attrs)
+        n = self.n_objs
+        if n == 0:
+            score = disorder_fun(np.zeros((0, values_count), dtype=np.int64), n)
+            return np.full(len(unified_attrs), score, dtype=np.float64)
+
+        order = np.argsort(self.index)
+        return _streaming_disorder_after_splits(
+            self.index[order],
+            order,
+            x,
+            np.asarray(x_counts, dtype=np.int64),
+            unified_attrs,
+            values,
+            values_count,
+            n,
+            disorder_fun,
         )
 
     def get_distribution(
         self,
         values: npt.NDArray[np.int64],
         values_count: int,
+        weights: npt.NDArray[np.int64] | None = None,
     ) -> npt.NDArray[np.int64]:
         """Build distribution matrix from the groups dict."""
+        if weights is not None:
+            return self._get_weighted_distribution(values, values_count, weights)
         self._check_values(values)
         result = np.zeros((self.n_groups, values_count), dtype=np.int64)
         for group_key, obj_indices in self._groups.items():
@@ -90,7 +90,7 @@ class GroupIndexHash(GroupIndexBase):
         n_groups = len(np.unique(hashes))
         return cls(index=hashes.view(np.int64), n_groups=n_groups)
 
-    def split(
+    def _split(
         self,
         values: npt.NDArray[np.int64],
         values_count: int,
@@ -116,10 +116,16 @@ class GroupIndexHash(GroupIndexBase):
         """No-op -- no gaps to remove when using raw hash values."""
         return type(self)(index=self.index.copy(), n_groups=self.n_groups)
 
+    def _get_group_ids(self) -> tuple[npt.NDArray[np.int64], int]:
+        """Map the raw hash values to sequential group IDs."""
+        unique_hashes, group_ids = np.unique(self.index, return_inverse=True)
+        return group_ids.astype(np.int64, copy=False), len(unique_hashes)
+
     def get_distribution(
         self,
         values: npt.NDArray[np.int64],
         values_count: int,
+        weights: npt.NDArray[np.int64] | None = None,
     ) -> npt.NDArray[np.int64]:
         """Build the full distribution matrix via sort-then-scan.
 
@@ -130,6 +136,8 @@ class GroupIndexHash(GroupIndexBase):
         Prefer ``get_disorder_score`` for the streaming (low-memory) code
         path.
         """
+        if weights is not None:
+            return self._get_weighted_distribution(values, values_count, weights)
         self._check_values(values)
 
         n = self.n_objs
@@ -161,6 +169,7 @@ class GroupIndexHash(GroupIndexBase):
         values: npt.NDArray[np.int64],
         values_count: int,
         disorder_fun: rght.DisorderMeasure,
+        weights: npt.NDArray[np.int64] | None = None,
     ) -> rght.DisorderMeasureReturnType:
         """Compute disorder score via streaming per-group decomposition.
 
@@ -176,6 +185,21 @@ class GroupIndexHash(GroupIndexBase):
         matrix, making it memory-friendly when the number of groups is
         large.
         """
+        if weights is not None:
+            return super().get_disorder_score(
+                values, values_count, disorder_fun, weights
+            )
+        return self._get_disorder_score_bounded(
+            values, values_count, disorder_fun, None
+        )
+
+    def _get_disorder_score_bounded(
+        self,
+        values: npt.NDArray[np.int64],
+        values_count: int,
+        disorder_fun: rght.DisorderMeasure,
+        abort_above: float | None,
+    ) -> rght.DisorderMeasureReturnType:
         self._check_values(values)
 
         n = self.n_objs
@@ -201,7 +225,58 @@ class GroupIndexHash(GroupIndexBase):
             per_group_row = counts.reshape(1, -1)
 
             total += disorder_fun(per_group_row, n)
+            if abort_above is not None and total > abort_above:
+                break
 
             i = j
 
         return total
+
+    def get_disorder_scores_after_splits(
+        self,
+        x: npt.NDArray[np.int64],
+        x_counts: npt.NDArray[np.int64],
+        attrs: rght.IndexListLike,
+        values: npt.NDArray[np.int64],
+        values_count: int,
+        disorder_fun: rght.DisorderMeasure,
+        weights: npt.NDArray[np.int64] | None = None,
+    ) -> npt.NDArray[np.float64]:
+        """Compute disorder scores after splitting by each of the given attributes.
+
+        Objects are sorted by group hash only once for the whole block of
+        attributes and sequential row indices are derived from the sorted
+        order (as in ``get_distribution``).  The refined distribution of
+        each attribute is then counted with a single ``numpy.bincount``
+        over the sorted objects.
+        """
+        if weights is not None:
+            return super().get_disorder_scores_after_splits(
+                x, x_counts, attrs, values, values_count, disorder_fun, weights
+            )
+        self._check_values(values)
+
+        unified_attrs = unify_index_list(attrs)
+        n = self.n_objs
+        if n == 0:
+            score = disorder_fun(np.zeros((0, values_count), dtype=np.int64), n)
+            return np.full(len(unified_attrs), score, dtype=np.float64)
+
+        order = np.argsort(self.index)
+        sorted_groups = self.index[order]
+        sorted_values = values[order]
+
+        rows = np.zeros(n, dtype=np.int64)
+        np.cumsum(sorted_groups[1:] != sorted_groups[:-1], out=rows[1:])
+        n_rows = int(rows[-1]) + 1
+
+        result = np.empty(len(unified_attrs), dtype=np.float64)
+        for k, attr in enumerate(unified_attrs):
+            split_count = int(x_counts[attr])
+            codes = (rows * split_count + x[order, attr]) * values_count + sorted_values
+            distribution = np.bincount(
+                codes,
+                minlength=n_rows * split_count * values_count,
+            )
+            result[k] = disorder_fun(distribution.reshape(-1, values_count), n)
+        return result
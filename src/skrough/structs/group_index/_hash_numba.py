@@ -11,8 +11,10 @@ import numpy as np
 import numpy.typing as npt
 
 import numba
+from numba.extending import is_jitted
 
 import skrough.typing as rght
+from skrough.structs.group_index._dict_numba import _streaming_disorder_after_splits
 from skrough.structs.group_index._hash import GroupIndexHash
 from skrough.unify import unify_index_list
 
@@ -24,14 +26,14 @@ numa's ``np.uint64()`` constructor.
 """
 
 
-@numba.njit(cache=True, inline="always")
+@numba.njit(cache=True, nogil=True, inline="always")
 def _hash_combine_u64(h: np.uint64, v: np.int64) -> np.uint64:
     """Boost-style hash combine of a uint64 accumulator and an int64 value."""
     h ^= np.uint64(v) + GOLDEN_U64 + (h << np.uint64(6)) + (h >> np.uint64(2))
     return h
 
 
-@numba.njit(cache=True)
+@numba.njit(cache=True, nogil=True)
 def _hash_rows(
     x: npt.NDArray[np.int64],
     unified_attrs: npt.NDArray[np.int64],
@@ -48,7 +50,7 @@ def _hash_rows(
     return hashes
 
 
-@numba.njit(cache=True)
+@numba.njit(cache=True, nogil=True)
 def _hash_split(
     index: npt.NDArray[np.int64],
     values: npt.NDArray[np.int64],
@@ -68,7 +70,9 @@ class GroupIndexHashNumba(GroupIndexHash):
     Uses boost::hash_combine (a simple bitwise mixing function) instead
     of xxhash so that the per-object hashing loop can be compiled by
     numba.  Inherits the streaming ``get_disorder_score`` from
-    :class:`GroupIndexHash`.
+    :class:`GroupIndexHash`; scoring of candidate splits runs in the
+    jitted streaming kernel shared with :class:`GroupIndexDictNumba`,
+    unless the disorder measure is not ``numba``-compiled.
     """
 
     @classmethod
@@ -88,7 +92,7 @@ class GroupIndexHashNumba(GroupIndexHash):
         n_groups = len(np.unique(hashes))
         return cls(index=hashes.view(np.int64), n_groups=n_groups)
 
-    def split(
+    def _split(
         self,
         values: npt.NDArray[np.int64],
         values_count: int,
@@ -98,3 +102,38 @@ class GroupIndexHashNumba(GroupIndexHash):
         new_hashes = _hash_split(self.index, values, self.n_objs)
         n_groups = len(np.unique(new_hashes))
         return type(self)(index=new_hashes.view(np.int64), n_groups=n_groups)
+
+    def get_disorder_scores_after_splits(
+        self,
+        x: npt.NDArray[np.int64],
+        x_counts: npt.NDArray[np.int64],
+        attrs: rght.IndexListLike,
+        values: npt.NDArray[np.int64],
+        values_count: int,
+        disorder_fun: rght.DisorderMeasure,
+        weights: npt.NDArray[np.int64] | None = None,
+    ) -> npt.NDArray[np.float64]:
+        if weights is not None or not is_jitted(disorder_fun):
+            return super().get_disorder_scores_after_splits(
+                x, x_counts, attrs, values, values_count, disorder_fun, weights
+            )
+        self._check_values(values)
+
+        unified_attrs = unify_index_list(attrs)
+        n = self.n_objs
+        if n == 0:
+            score = disorder_fun(np.zeros((0, values_count), dtype=np.int64), n)
+            return np.full(len(unified_attrs), score, dtype=np.float64)
+
+        order = np.argsort(self.index)
+        return _streaming_disorder_after_splits(
+            self.index[order],
+            order,
+            x,
+            np.asarray(x_counts, dtype=np.int64),
+            unified_attrs,
+            values,
+            values_count,
+            n,
+            disorder_fun,
+        )
@@ -90,7 +90,7 @@ class GroupIndexLazy(GroupIndexBase):
 
         return cls(index=concatenated, n_groups=len(concatenated))
 
-    def split(
+    def _split(
         self,
         values: npt.NDArray[np.int64],
         values_count: int,
@@ -110,20 +110,67 @@ class GroupIndexLazy(GroupIndexBase):
         self,
         values: npt.NDArray[np.int64],
         values_count: int,
+        weights: npt.NDArray[np.int64] | None = None,
     ) -> npt.NDArray[np.int64]:
+        if weights is not None:
+            return self._get_weighted_distribution(values, values_count, weights)
         self._check_values(values)
 
         n = len(self.index)
         if n == 0:
             return np.zeros((0, values_count), dtype=np.int64)
 
+        group_ids, n_groups = self._get_group_ids()
+
+        result = np.zeros((n_groups, values_count), dtype=np.int64)
+        np.add.at(result, (group_ids, values), 1)
+        return result
+
+    def get_disorder_scores_after_splits(
+        self,
+        x: npt.NDArray[np.int64],
+        x_counts: npt.NDArray[np.int64],
+        attrs: rght.IndexListLike,
+        values: npt.NDArray[np.int64],
+        values_count: int,
+        disorder_fun: rght.DisorderMeasure,
+        weights: npt.NDArray[np.int64] | None = None,
+    ) -> npt.NDArray[np.float64]:
+        """Compute disorder scores after splitting by each of the given attributes.
+
+        The concatenated strings are hashed and mapped to sequential group
+        IDs only once for the whole block of attributes; splits are then
+        scored on the integer IDs without building the split strings.
+        """
+        if weights is not None:
+            return super().get_disorder_scores_after_splits(
+                x, x_counts, attrs, values, values_count, disorder_fun, weights
+            )
+        self._check_values(values)
+
+        unified_attrs = unify_index_list(attrs)
+        n = len(self.index)
+        if n == 0:
+            score = disorder_fun(np.zeros((0, values_count), dtype=np.int64), n)
+            return np.full(len(unified_attrs), score, dtype=np.float64)
+
+        group_ids, n_groups = self._get_group_ids()
+
+        result = np.empty(len(unified_attrs), dtype=np.float64)
+        for k, attr in enumerate(unified_attrs):
+            split_count = int(x_counts[attr])
+            n_rows = n_groups * split_count
+            distribution = np.zeros((n_rows, values_count), dtype=np.int64)
+            np.add.at(distribution, (group_ids * split_count + x[:, attr], values), 1)
+            result[k] = disorder_fun(distribution, n)
+        return result
+
+    def _get_group_ids(self) -> tuple[npt.NDArray[np.int64], int]:
+        """Hash the concatenated strings and map them to sequential group IDs."""
+        n = len(self.index)
         hashes = np.zeros(n, dtype=np.uint64)
         for i in range(n):
             hashes[i] = xxhash.xxh64(str(self.index[i])).intdigest()
 
         unique_hashes, group_ids = np.unique(hashes, return_inverse=True)
-        n_groups = len(unique_hashes)
-
-        result = np.zeros((n_groups, values_count), dtype=np.int64)
-        np.add.at(result, (group_ids, values), 1)
-        return result
+        return group_ids.astype(np.int64, copy=False), len(unique_hashes)
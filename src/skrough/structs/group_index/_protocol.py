@@ -73,8 +73,9 @@ class GroupIndexProtocol(Protocol):
         self,
         values: npt.NDArray[np.int64],
         values_count: int,
+        weights: npt.NDArray[np.int64] | None = None,
     ) -> npt.NDArray[np.int64]:
-        """Compute decision distribution within groups of objects."""
+        """Compute decision distribution within groups of (weighted) objects."""
         ...
 
     def get_disorder_score(
@@ -82,8 +83,27 @@ class GroupIndexProtocol(Protocol):
         values: npt.NDArray[np.int64],
         values_count: int,
         disorder_fun: rght.DisorderMeasure,
+        weights: npt.NDArray[np.int64] | None = None,
     ) -> rght.DisorderMeasureReturnType:
-        """Compute disorder score for the given grouping of objects."""
+        """Compute disorder score for the given grouping of (weighted) objects."""
+        ...
+
+    def track_disorder(
+        self,
+        values: npt.NDArray[np.int64],
+        values_count: int,
+        disorder_fun: rght.DisorderMeasure,
+    ) -> None:
+        """Start maintaining the disorder score incrementally across splits."""
+        ...
+
+    def get_tracked_disorder_score(
+        self,
+        values: npt.NDArray[np.int64],
+        values_count: int,
+        disorder_fun: rght.DisorderMeasure,
+    ) -> rght.DisorderMeasureReturnType:
+        """Get the disorder score, using the tracked total when available."""
         ...
 
     def get_disorder_score_after_split(
@@ -93,6 +113,26 @@ class GroupIndexProtocol(Protocol):
         values: npt.NDArray[np.int64],
         values_count: int,
         disorder_fun: rght.DisorderMeasure,
+        abort_above: float | None = None,
     ) -> rght.DisorderMeasureReturnType:
-        """Compute disorder score after splitting by additional attribute."""
+        """Compute disorder score after splitting by additional attribute.
+
+        When ``abort_above`` is given, the computation may stop as soon as the
+        partially accumulated score exceeds it. The exact score is returned
+        whenever it does not exceed ``abort_above``; otherwise a value greater
+        than ``abort_above`` (and not greater than the exact score) is returned.
+        """
+        ...
+
+    def get_disorder_scores_after_splits(
+        self,
+        x: npt.NDArray[np.int64],
+        x_counts: npt.NDArray[np.int64],
+        attrs: rght.IndexListLike,
+        values: npt.NDArray[np.int64],
+        values_count: int,
+        disorder_fun: rght.DisorderMeasure,
+        weights: npt.NDArray[np.int64] | None = None,
+    ) -> npt.NDArray[np.float64]:
+        """Compute disorder scores after splitting (weighted) objects by attributes."""
         ...
@@ -3,7 +3,9 @@
 import numpy as np
 import numpy.typing as npt
 
+import skrough.typing as rght
 from skrough.structs.group_index._base import GroupIndexBase
+from skrough.unify import unify_index_list
 
 
 def _get_distribution(
@@ -22,6 +24,68 @@ def _get_distribution(
     return result
 
 
+def _get_disorder_score_after_split(
+    groups: npt.NDArray[np.int64],
+    groups_count: int,
+    split_values: npt.NDArray[np.int64],
+    split_values_count: int,
+    values: npt.NDArray[np.int64],
+    values_count: int,
+    disorder_fun: rght.DisorderMeasure,
+) -> float:
+    """Compute disorder score after a split without materializing the split.
+
+    Objects are keyed on ``(group, split value)`` and the keys are mapped to
+    compact row numbers (in increasing key order), either through a
+    presence mask when the key space is not larger than the number of
+    objects or with ``numpy.unique`` otherwise. The distribution is then
+    counted with a single ``numpy.bincount``, so peak memory is
+    ``O(n_objs)`` regardless of ``groups_count * split_values_count``.
+    """
+    n_objs = len(groups)
+    keys = groups * split_values_count + split_values
+    keys_space = groups_count * split_values_count
+    if keys_space <= n_objs:
+        present = np.zeros(keys_space, dtype=np.int64)
+        present[keys] = 1
+        rows = np.cumsum(present) - 1
+        keys = rows[keys]
+        n_keys = int(rows[-1]) + 1 if keys_space > 0 else 0
+    else:
+        uniques, keys = np.unique(keys, return_inverse=True)
+        n_keys = len(uniques)
+    distribution = np.bincount(
+        keys * values_count + values,
+        minlength=n_keys * values_count,
+    )
+    return disorder_fun(distribution.reshape(n_keys, values_count), n_objs)
+
+
+def _get_disorder_scores_after_splits(
+    groups: npt.NDArray[np.int64],
+    groups_count: int,
+    x: npt.NDArray[np.int64],
+    x_counts: npt.NDArray[np.int64],
+    attrs: npt.NDArray[np.int64],
+    values: npt.NDArray[np.int64],
+    values_count: int,
+    disorder_fun: rght.DisorderMeasure,
+) -> npt.NDArray[np.float64]:
+    """Compute disorder scores after splitting by each of the given attributes."""
+    result = np.empty(len(attrs), dtype=np.float64)
+    for k, attr in enumerate(attrs):
+        result[k] = _get_disorder_score_after_split(
+            groups,
+            groups_count,
+            x[:, attr],
+            int(x_counts[attr]),
+            values,
+            values_count,
+            disorder_fun,
+        )
+    return result
+
+
 class GroupIndexPure(GroupIndexBase):
     """Group index with pure-numpy distribution computation.
 
@@ -34,7 +98,10 @@ class GroupIndexPure(GroupIndexBase):
         self,
         values: npt.NDArray[np.int64],
         values_count: int,
+        weights: npt.NDArray[np.int64] | None = None,
     ) -> npt.NDArray[np.int64]:
+        if weights is not None:
+            return self._get_weighted_distribution(values, values_count, weights)
         self._check_values(values)
         return _get_distribution(
             self.index,
@@ -42,3 +109,52 @@ class GroupIndexPure(GroupIndexBase):
             values,
             values_count,
         )
+
+    def get_disorder_score_after_split(
+        self,
+        split_values: npt.NDArray[np.int64],
+        split_values_count: int,
+        values: npt.NDArray[np.int64],
+        values_count: int,
+        disorder_fun: rght.DisorderMeasure,
+        abort_above: float | None = None,  # pylint: disable=unused-argument
+    ) -> rght.DisorderMeasureReturnType:
+        # the score is computed from the whole distribution at once, so there is
+        # no partial score to compare with ``abort_above``
+        self._check_values(split_values)
+        self._check_values(values)
+        return _get_disorder_score_after_split(
+            self.index,
+            self.n_groups,
+            split_values,
+            split_values_count,
+            values,
+            values_count,
+            disorder_fun,
+        )
+
+    def get_disorder_scores_after_splits(
+        self,
+        x: npt.NDArray[np.int64],
+        x_counts: npt.NDArray[np.int64],
+        attrs: rght.IndexListLike,
+        values: npt.NDArray[np.int64],
+        values_count: int,
+        disorder_fun: rght.DisorderMeasure,
+        weights: npt.NDArray[np.int64] | None = None,
+    ) -> npt.NDArray[np.float64]:
+        if weights is not None:
+            return super().get_disorder_scores_after_splits(
+                x, x_counts, attrs, values, values_count, disorder_fun, weights
+            )
+        self._check_values(values)
+        return _get_disorder_scores_after_splits(
+            self.index,
+            self.n_groups,
+            x,
+            x_counts,
+            unify_index_list(attrs),
+            values,
+            values_count,
+            disorder_fun,
+        )
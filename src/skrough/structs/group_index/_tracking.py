@@ -0,0 +1,223 @@
+"""Incremental maintenance of per-group disorder contributions.
+
+All built-in disorder measures are sums of independent per-group terms, so a
+split changes only the terms of the groups it actually breaks.  A
+:class:`DisorderTracker` keeps a compact group id for every object, the vector of
+per-group contributions and their running total.  :meth:`DisorderTracker.split`
+derives the tracker for a split group index by recomputing the contributions of
+the broken groups only - groups that are not broken keep their contributions,
+and decision-homogeneous groups (zero contribution) are never rescanned as they
+cannot become impure.
+"""
+
+from dataclasses import dataclass
+
+import numba
+import numpy as np
+import numpy.typing as npt
+
+import skrough.typing as rght
+from skrough.unique import get_uniques_and_compacted
+
+
+@numba.njit(cache=True, nogil=True)
+def _get_contributions(
+    group_ids: npt.NDArray[np.int64],
+    n_groups: int,
+    values: npt.NDArray[np.int64],
+    values_count: int,
+    n_elements: int,
+    disorder_fun: rght.DisorderMeasure,
+) -> npt.NDArray[np.float64]:
+    """Compute disorder contribution of every group."""
+    distribution = np.zeros(shape=(n_groups, values_count), dtype=np.int64)
+    for i in range(group_ids.shape[0]):
+        distribution[group_ids[i], values[i]] += 1
+    result = np.empty(n_groups, dtype=np.float64)
+    for g in range(n_groups):
+        result[g] = disorder_fun(distribution[g : g + 1], n_elements)
+    return result
+
+
+@numba.njit(cache=True, nogil=True)
+def _split_contributions(
+    group_ids: npt.NDArray[np.int64],
+    contributions: npt.NDArray[np.float64],
+    split_values: npt.NDArray[np.int64],
+    split_values_count: int,
+    values: npt.NDArray[np.int64],
+    values_count: int,
+    n_elements: int,
+    disorder_fun: rght.DisorderMeasure,
+) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.float64], float, int]:
+    """Refine group ids and update contributions of the broken groups only.
+
+    Returns the new compact group ids, the new contributions, the change of the
+    total disorder score and the change of the number of impure groups.
+    """
+    n_objs = group_ids.shape[0]
+    n_groups = contributions.shape[0]
+    # stable counting sort of objects by their group
+    offsets = np.zeros(n_groups + 1, dtype=np.int64)
+    for i in range(n_objs):
+        offsets[group_ids[i] + 1] += 1
+    for g in range(n_groups):
+        offsets[g + 1] += offsets[g]
+    positions = offsets[:-1].copy()
+    perm = np.empty(n_objs, dtype=np.int64)
+    for i in range(n_objs):
+        perm[positions[group_ids[i]]] = i
+        positions[group_ids[i]] += 1
+
+    new_group_ids = np.empty(n_objs, dtype=np.int64)
+    new_contributions = np.empty(n_objs, dtype=np.float64)
+    stamp = np.full(split_values_count, -1, dtype=np.int64)
+    slot = np.empty(split_values_count, dtype=np.int64)
+    counts = np.zeros(shape=(split_values_count, values_count), dtype=np.int64)
+    removed = 0.0
+    added = 0.0
+    impure_delta = 0
+    n_new_groups = 0
+    for g in range(n_groups):
+        first_new_group = n_new_groups
+        for k in range(offsets[g], offsets[g + 1]):
+            obj = perm[k]
+            split_value = split_values[obj]
+            if stamp[split_value] != g:
+                stamp[split_value] = g
+                slot[split_value] = n_new_groups
+                n_new_groups += 1
+            new_group_ids[obj] = slot[split_value]
+        n_parts = n_new_groups - first_new_group
+        if n_parts == 1 or contributions[g] == 0.0:
+            # unbroken group keeps its term; a homogeneous group stays homogeneous
+            for j in range(first_new_group, n_new_groups):
+                new_contributions[j] = 0.0
+            new_contributions[first_new_group] = contributions[g]
+            continue
+        for k in range(offsets[g], offsets[g + 1]):
+            obj = perm[k]
+            counts[new_group_ids[obj] - first_new_group, values[obj]] += 1
+        removed += contributions[g]
+        impure_delta -= 1
+        for j in range(n_parts):
+            contribution = disorder_fun(counts[j : j + 1], n_elements)
+            new_contributions[first_new_group + j] = contribution
+            added += contribution
+            if contribution != 0.0:
+                impure_delta += 1
+            counts[j, :] = 0
+    return (
+        new_group_ids,
+        new_contributions[:n_new_groups],
+        added - removed,
+        impure_delta,
+    )
+
+
+@dataclass
+class DisorderTracker:
+    """Per-group disorder contributions maintained across splits.
+
+    The tracker is bound to the decision ``values`` (by identity), their
+    ``values_count`` and the ``disorder_fun`` it was created for. It assumes
+    that the disorder measure is a sum of per-group terms which are zero for
+    decision-homogeneous groups - as it is for all measures from
+    :mod:`skrough.disorder_measures`.
+    """
+
+    values: npt.NDArray[np.int64]
+    """decision values the contributions are computed for"""
+    values_count: int
+    """number of distinct decision values"""
+    disorder_fun: rght.DisorderMeasure
+    """disorder measure the contributions are computed with"""
+    group_ids: npt.NDArray[np.int64]
+    """compact group id of every object"""
+    contributions: npt.NDArray[np.float64]
+    """disorder score contribution of every group"""
+    total: float
+    """running total of the contributions, i.e., the current disorder score"""
+    n_impure: int
+    """number of groups with a non-zero contribution"""
+
+    @classmethod
+    def from_index(
+        cls,
+        index: npt.NDArray,
+        values: npt.NDArray[np.int64],
+        values_count: int,
+        disorder_fun: rght.DisorderMeasure,
+    ):
+        """Create a tracker for the grouping given by an arbitrary group index."""
+        n = len(index)
+        if n == 0:
+            group_ids = np.empty(shape=0, dtype=np.int64)
+            contributions = np.empty(shape=0, dtype=np.float64)
+            total = disorder_fun(np.zeros((0, values_count), dtype=np.int64), n)
+        else:
+            uniques, group_ids = get_uniques_and_compacted(index)
+            group_ids = group_ids.astype(np.int64, copy=False)
+            contributions = _get_contributions(
+                group_ids,
+                len(uniques),
+                values,
+                values_count,
+                n,
+                disorder_fun,
+            )
+            total = float(contributions.sum())
+        return cls(
+            values=values,
+            values_count=values_count,
+            disorder_fun=disorder_fun,
+            group_ids=group_ids,
+            contributions=contributions,
+            total=total,
+            n_impure=int(np.count_nonzero(contributions)),
+        )
+
+    def matches(
+        self,
+        values: npt.NDArray[np.int64],
+        values_count: int,
+        disorder_fun: rght.DisorderMeasure,
+    ) -> bool:
+        """Check whether the tracker was created for the given arguments."""
+        return (
+            values is self.values
+            and values_count == self.values_count
+            and disorder_fun is self.disorder_fun
+        )
+
+    def split(
+        self,
+        split_values: npt.NDArray[np.int64],
+        split_values_count: int,
+    ):
+        """Derive the tracker for groups split according to ``split_values``."""
+        if len(self.group_ids) == 0:
+            return self
+        group_ids, contributions, delta, impure_delta = _split_contributions(
+            self.group_ids,
+            self.contributions,
+            np.asarray(split_values, dtype=np.int64),
+            int(split_values_count),
+            self.values,
+            self.values_count,
+            len(self.group_ids),
+            self.disorder_fun,
+        )
+        n_impure = self.n_impure + impure_delta
+        # snap to exact zero once all groups are homogeneous, so that the
+        # running total does not carry rounding residues of removed terms
+        total = self.total + delta if n_impure > 0 else 0.0
+        return type(self)(
+            values=self.values,
+            values_count=self.values_count,
+            disorder_fun=self.disorder_fun,
+            group_ids=group_ids,
+            contributions=contributions,
+            total=total,
+            n_impure=n_impure,
+        )
@@ -0,0 +1,123 @@
+"""Partition cache structures."""
+
+import hashlib
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass, field
+
+import numpy as np
+import numpy.typing as npt
+
+import skrough.typing as rght
+from skrough.structs.group_index._protocol import GroupIndexProtocol
+
+
+@dataclass
+class PartitionCacheStats:
+    """Counters of a :class:`PartitionCache`."""
+
+    hits: int = 0
+    """number of lookups served from the cache"""
+    misses: int = 0
+    """number of lookups that required building a group index"""
+    evictions: int = 0
+    """number of group indices dropped to keep the memory budget"""
+
+
+def get_objs_fingerprint(objs: npt.ArrayLike) -> Hashable:
+    """Get a fingerprint identifying a subset of objects.
+
+    Args:
+        objs: A sequence of integer-location based indices of objects.
+
+    Returns:
+        A hashable fingerprint equal for equal sequences of objects.
+    """
+    objs = np.ascontiguousarray(objs, dtype=np.int64)
+    return len(objs), hashlib.blake2b(objs.tobytes(), digest_size=16).digest()
+
+
+def _get_nbytes(group_index: GroupIndexProtocol) -> int:
+    """Estimate the memory taken by the arrays of a group index."""
+    return sum(
+        value.nbytes
+        for value in getattr(group_index, "__dict__", {}).values()
+        if isinstance(value, np.ndarray)
+    )
+
+
+@dataclass
+class PartitionCache:
+    """A least recently used cache of group indices induced by attribute sets.
+
+    The cache is meant to be used within a single processing run, i.e., for the same
+    input data, the same group index implementation and the same decision values. The
+    group indices are keyed by the set of attributes that induce them, hence the
+    order of attributes is irrelevant, along with an optional fingerprint of the
+    subset of objects they are built for (cf. :func:`get_objs_fingerprint`). The
+    least recently used group indices are evicted whenever the estimated memory taken
+    by the cached ones exceeds ``max_bytes``. The cached group indices are shared by
+    all the lookups, so they should not be modified in place.
+
+    Args:
+        max_bytes: The memory budget of the cache, in bytes.
+    """
+
+    max_bytes: int
+    stats: PartitionCacheStats = field(default_factory=PartitionCacheStats)
+    nbytes: int = 0
+    """estimated memory currently taken by the cached group indices"""
+    _entries: OrderedDict[Hashable, tuple[GroupIndexProtocol, int]] = field(
+        default_factory=OrderedDict, repr=False
+    )
+
+    def __post_init__(self):
+        if self.max_bytes < 0:
+            raise ValueError("Partition cache size should be a non-negative number")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_group_index(
+        self,
+        group_index_class: type[GroupIndexProtocol],
+        x: np.ndarray,
+        x_counts: np.ndarray,
+        attrs: rght.IndexListLike,
+        objs_fingerprint: Hashable | None = None,
+    ) -> GroupIndexProtocol:
+        """Get the group index induced by the given attributes.
+
+        The group index is taken from the cache or, if it is not cached yet, built
+        with ``group_index_class.from_data`` and cached.
+
+        Args:
+            group_index_class: The group index implementation to use.
+            x: Factorized data table, already narrowed to the objects identified by
+                ``objs_fingerprint``, if given.
+            x_counts: Domain sizes of the attributes.
+            attrs: Attributes inducing the group index.
+            objs_fingerprint: A fingerprint of the objects ``x`` is narrowed to (cf.
+                :func:`get_objs_fingerprint`). Defaults to :obj:`None`, i.e., all
+                objects.
+
+        Returns:
+            The group index induced by ``attrs``.
+        """
+        key = (frozenset(int(attr) for attr in attrs), objs_fingerprint)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.stats.hits += 1
+            self._entries.move_to_end(key)
+            return entry[0]
+        self.stats.misses += 1
+        group_index = group_index_class.from_data(x, x_counts, attrs)
+        nbytes = _get_nbytes(group_index)
+        if nbytes <= self.max_bytes:
+            self._entries[key] = (group_index, nbytes)
+            self.nbytes += nbytes
+            while self.nbytes > self.max_bytes:
+                _, (_, evicted_nbytes) = self._entries.popitem(last=False)
+                self.nbytes -= evicted_nbytes
+                self.stats.evictions += 1
+        return group_index
@@ -1,11 +1,14 @@
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from typing import Any, Callable, Mapping
 
 import numpy as np
 
 import skrough.typing as rght
+from skrough.profiling import Profiler
 from skrough.structs.group_index import GroupIndex
 from skrough.structs.group_index._protocol import GroupIndexProtocol
+from skrough.structs.partition_cache import PartitionCache
 
 StateConfig = Mapping[str, Any]
 
@@ -13,40 +16,112 @@ StateConfig = Mapping[str, Any]
 ProcessingFunction = Callable[["ProcessingState"], Any]
 
 
-@dataclass
+@dataclass(slots=True)
+class ProcessingInputs:  # pylint: disable=too-many-instance-attributes
+    """Input data and config of processing.
+
+    The inputs are set up once, before processing, and are shared by all states forked
+    from the same state (cf. :meth:`ProcessingState.fork`). Therefore, they should not
+    be modified in place - :class:`ProcessingState` copies them on first write instead.
+    """
+
+    data_x: np.ndarray | None = None
+    data_x_counts: np.ndarray | None = None
+    data_y: np.ndarray | None = None
+    data_y_count: int | None = None
+    data_weights: np.ndarray | None = None
+
+    disorder_fun: rght.DisorderMeasure | None = None
+    consecutive_empty_iterations_max_count: int | None = None
+    daar_allowed_randomness: float | None = None
+    daar_fast: bool | None = None
+    daar_probes_count: int | None = None
+    daar_smoothing_parameter: float | None = None
+    daar_permutations_bank_size: int | None = None
+    daar_speculative_count: int | None = None
+    epsilon: float | None = None
+    epsilons: list[float] | None = None
+    select_attrs_disorder_score_based_max_count: int | None = None
+    candidates_select_random_max_count: int | None = None
+    result_attrs_max_count: int | None = None
+    set_approx_threshold_to_current: bool | None = None
+    shrink_pure_groups: bool | None = None
+    successive_halving_initial_sample_size: int | None = None
+    successive_halving_keep_fraction: float | None = None
+    track_disorder: bool | None = None
+    partition_cache_max_bytes: int | None = None
+    group_index_class: type[GroupIndexProtocol] | None = None
+
+
+@dataclass(slots=True)
 class ProcessingState:  # pylint: disable=too-many-public-methods,too-many-instance-attributes
+    """State of processing.
+
+    The state consists of the inputs (input data and config, cf.
+    :class:`ProcessingInputs`), which are shared by forked states in a copy-on-write
+    manner, and the per-run ``_values_*`` which every forked state keeps on its own.
+    """
+
     processing_fun: ProcessingFunction | None
     rng: np.random.Generator | None
+    profiler: Profiler | None = None
 
-    _input_data_x: np.ndarray | None = None
-    _input_data_x_counts: np.ndarray | None = None
-    _input_data_y: np.ndarray | None = None
-    _input_data_y_count: int | None = None
-
-    _config_disorder_fun: rght.DisorderMeasure | None = None
-    _config_consecutive_empty_iterations_max_count: int | None = None
-    _config_daar_allowed_randomness: float | None = None
-    _config_daar_fast: bool | None = None
-    _config_daar_probes_count: int | None = None
-    _config_daar_smoothing_parameter: float | None = None
-    _config_epsilon: float | None = None
-    _config_select_attrs_disorder_score_based_max_count: int | None = None
-    _config_candidates_select_random_max_count: int | None = None
-    _config_result_attrs_max_count: int | None = None
-    _config_set_approx_threshold_to_current: bool | None = None
-    _config_group_index_class: type[GroupIndexProtocol] | None = None
+    _inputs: ProcessingInputs = field(default_factory=ProcessingInputs)
+    _inputs_owned: bool = field(default=True, repr=False, compare=False)
 
     _values_group_index: GroupIndex | None = None
     _values_x: np.ndarray | None = None
     _values_x_counts: np.ndarray | None = None
     _values_y: np.ndarray | None = None
     _values_y_count: int | None = None
+    _values_weights: np.ndarray | None = None
     _values_result_objs: list[int] | None = None
     _values_result_attrs: list[int] | None = None
+    _values_active_objs: np.ndarray | None = None
+    _values_daar_permutations_bank: np.ndarray | None = None
+    _values_daar_speculative_executor: ThreadPoolExecutor | None = None
     _values_disorder_score_approx_threshold: float | None = None
     _values_disorder_score_base: float | None = None
     _values_disorder_score_total: float | None = None
+    _values_epsilon_path_approx_thresholds: list[float] | None = None
+    _values_epsilon_path_cuts: list[int | None] | None = None
     _values_consecutive_empty_iterations_count: int | None = None
+    _values_lazy_greedy_gains: dict[int, float] | None = None
+    _values_lazy_greedy_saved_evaluations_count: int | None = None
+    _values_aborted_evaluations_count: int | None = None
+    _values_successive_halving_order: np.ndarray | None = None
+    _values_successive_halving_group_index: GroupIndex | None = None
+    _values_successive_halving_samples: (
+        dict[int, tuple[np.ndarray, GroupIndex]] | None
+    ) = None
+    _values_partition_cache: PartitionCache | None = None
+
+    def _get_own_inputs(self) -> ProcessingInputs:
+        """Get the inputs for writing, copying them first if they are shared."""
+        if not self._inputs_owned:
+            self._inputs = replace(self._inputs)
+            self._inputs_owned = True
+        return self._inputs
+
+    def fork(self) -> "ProcessingState":
+        """Get a state that can be processed independently of this one.
+
+        The forked state shares the inputs with this state until any of the two
+        modifies them (copy-on-write). Per-run values are copied shallowly, i.e.,
+        arrays and other values that hooks only rebind are shared, while the result
+        lists, which are extended in place, are copied. Therefore, forks of the same
+        state can be safely processed concurrently, e.g., by threads.
+
+        Returns:
+            The forked state.
+        """
+        self._inputs_owned = False
+        result = replace(self)
+        if self._values_result_objs is not None:
+            result._values_result_objs = list(self._values_result_objs)
+        if self._values_result_attrs is not None:
+            result._values_result_attrs = list(self._values_result_attrs)
+        return result
 
     def get_rng(self) -> np.random.Generator:
         if self.rng is None:
@@ -59,149 +134,269 @@ class ProcessingState:  # pylint: disable=too-many-public-methods,too-many-insta
     def is_set_rng(self) -> bool:
         return self.rng is not None
 
+    def get_profiler(self) -> Profiler:
+        if self.profiler is None:
+            raise ValueError("empty profiler")
+        return self.profiler
+
+    def set_profiler(self, val: Profiler | None):
+        self.profiler = val
+
+    def is_set_profiler(self) -> bool:
+        return self.profiler is not None
+
     def get_input_data_x(self) -> np.ndarray:
-        if self._input_data_x is None:
+        if self._inputs.data_x is None:
             raise ValueError("empty input_data_x")
-        return self._input_data_x
+        return self._inputs.data_x
 
     def set_input_data_x(self, val: np.ndarray):
-        self._input_data_x = val
+        self._get_own_inputs().data_x = val
+
+    def is_set_input_data_x(self) -> bool:
+        return self._inputs.data_x is not None
 
     def get_input_data_x_counts(self) -> np.ndarray:
-        if self._input_data_x_counts is None:
+        if self._inputs.data_x_counts is None:
             raise ValueError("empty input_data_x_count")
-        return self._input_data_x_counts
+        return self._inputs.data_x_counts
 
     def set_input_data_x_counts(self, val: np.ndarray):
-        self._input_data_x_counts = val
+        self._get_own_inputs().data_x_counts = val
+
+    def is_set_input_data_x_counts(self) -> bool:
+        return self._inputs.data_x_counts is not None
 
     def get_input_data_y(self) -> np.ndarray:
-        if self._input_data_y is None:
+        if self._inputs.data_y is None:
             raise ValueError("empty input_data_y")
-        return self._input_data_y
+        return self._inputs.data_y
 
     def set_input_data_y(self, val: np.ndarray):
-        self._input_data_y = val
+        self._get_own_inputs().data_y = val
+
+    def is_set_input_data_y(self) -> bool:
+        return self._inputs.data_y is not None
+
+    def get_input_data_weights(self) -> np.ndarray:
+        if self._inputs.data_weights is None:
+            raise ValueError("empty input_data_weights")
+        return self._inputs.data_weights
+
+    def set_input_data_weights(self, val: np.ndarray | None):
+        self._get_own_inputs().data_weights = val
+
+    def is_set_input_data_weights(self) -> bool:
+        return self._inputs.data_weights is not None
 
     def get_input_data_y_count(self) -> int:
-        if self._input_data_y_count is None:
+        if self._inputs.data_y_count is None:
             raise ValueError("empty input_data_y_count")
-        return self._input_data_y_count
+        return self._inputs.data_y_count
 
     def set_input_data_y_count(self, val: int):
-        self._input_data_y_count = val
+        self._get_own_inputs().data_y_count = val
+
+    def is_set_input_data_y_count(self) -> bool:
+        return self._inputs.data_y_count is not None
 
     def get_config_disorder_fun(self) -> rght.DisorderMeasure:
-        if self._config_disorder_fun is None:
+        if self._inputs.disorder_fun is None:
             raise ValueError("empty config_disorder_fun")
-        return self._config_disorder_fun
+        return self._inputs.disorder_fun
 
     def set_config_disorder_fun(self, val: rght.DisorderMeasure):
-        self._config_disorder_fun = val
+        self._get_own_inputs().disorder_fun = val
 
     def get_config_consecutive_empty_iterations_max_count(self) -> int:
-        if self._config_consecutive_empty_iterations_max_count is None:
+        if self._inputs.consecutive_empty_iterations_max_count is None:
             raise ValueError("empty config_consecutive_empty_iterations_max_count")
-        return self._config_consecutive_empty_iterations_max_count
+        return self._inputs.consecutive_empty_iterations_max_count
 
     def set_config_consecutive_empty_iterations_max_count(self, val: int):
-        self._config_consecutive_empty_iterations_max_count = val
+        self._get_own_inputs().consecutive_empty_iterations_max_count = val
 
     def get_config_daar_allowed_randomness(self) -> float:
-        if self._config_daar_allowed_randomness is None:
+        if self._inputs.daar_allowed_randomness is None:
             raise ValueError("empty config_daar_allowed_randomness")
-        return self._config_daar_allowed_randomness
+        return self._inputs.daar_allowed_randomness
 
     def set_config_daar_allowed_randomness(self, val: float):
-        self._config_daar_allowed_randomness = val
+        self._get_own_inputs().daar_allowed_randomness = val
 
     def get_config_daar_fast(self) -> bool:
-        if self._config_daar_fast is None:
+        if self._inputs.daar_fast is None:
             raise ValueError("empty config_daar_fast")
-        return self._config_daar_fast
+        return self._inputs.daar_fast
 
     def set_config_daar_fast(self, val: bool):
-        self._config_daar_fast = val
+        self._get_own_inputs().daar_fast = val
 
     def get_config_daar_probes_count(self) -> int:
-        if self._config_daar_probes_count is None:
+        if self._inputs.daar_probes_count is None:
             raise ValueError("empty config_daar_probes_count")
-        return self._config_daar_probes_count
+        return self._inputs.daar_probes_count
 
     def set_config_daar_probes_count(self, val: int):
-        self._config_daar_probes_count = val
+        self._get_own_inputs().daar_probes_count = val
 
     def get_config_daar_smoothing_parameter(
         self, default: float | None = None
     ) -> float:
-        if self._config_daar_smoothing_parameter is None:
+        if self._inputs.daar_smoothing_parameter is None:
             if default is None:
                 raise ValueError("empty config_daar_smoothing_parameter")
             return default
-        return self._config_daar_smoothing_parameter
+        return self._inputs.daar_smoothing_parameter
 
     def set_config_daar_smoothing_parameter(self, val: float):
-        self._config_daar_smoothing_parameter = val
+        self._get_own_inputs().daar_smoothing_parameter = val
+
+    def get_config_daar_permutations_bank_size(self) -> int:
+        if self._inputs.daar_permutations_bank_size is None:
+            raise ValueError("empty config_daar_permutations_bank_size")
+        return self._inputs.daar_permutations_bank_size
+
+    def set_config_daar_permutations_bank_size(self, val: int | None):
+        self._get_own_inputs().daar_permutations_bank_size = val
+
+    def is_set_config_daar_permutations_bank_size(self) -> bool:
+        return self._inputs.daar_permutations_bank_size is not None
+
+    def get_config_daar_speculative_count(self) -> int:
+        if self._inputs.daar_speculative_count is None:
+            raise ValueError("empty config_daar_speculative_count")
+        return self._inputs.daar_speculative_count
+
+    def set_config_daar_speculative_count(self, val: int | None):
+        self._get_own_inputs().daar_speculative_count = val
+
+    def is_set_config_daar_speculative_count(self) -> bool:
+        return self._inputs.daar_speculative_count is not None
 
     def get_config_epsilon(self) -> float:
-        if self._config_epsilon is None:
+        if self._inputs.epsilon is None:
             raise ValueError("empty config_epsilon")
-        return self._config_epsilon
+        return self._inputs.epsilon
 
     def set_config_epsilon(self, val: float):
-        self._config_epsilon = val
+        self._get_own_inputs().epsilon = val
+
+    def get_config_epsilons(self) -> list[float]:
+        if self._inputs.epsilons is None:
+            raise ValueError("empty config_epsilons")
+        return self._inputs.epsilons
+
+    def set_config_epsilons(self, val: list[float]):
+        self._get_own_inputs().epsilons = val
 
     def get_config_select_attrs_disorder_score_based_max_count(self) -> int:
-        if self._config_select_attrs_disorder_score_based_max_count is None:
+        if self._inputs.select_attrs_disorder_score_based_max_count is None:
             raise ValueError("empty config_select_attrs_disorder_score_based_max_count")
-        return self._config_select_attrs_disorder_score_based_max_count
+        return self._inputs.select_attrs_disorder_score_based_max_count
 
     def set_config_select_attrs_disorder_score_based_max_count(self, val: int):
-        self._config_select_attrs_disorder_score_based_max_count = val
+        self._get_own_inputs().select_attrs_disorder_score_based_max_count = val
 
     def get_config_candidates_select_random_max_count(self) -> int:
-        if self._config_candidates_select_random_max_count is None:
+        if self._inputs.candidates_select_random_max_count is None:
             raise ValueError("empty config_candidates_select_random_max_count")
-        return self._config_candidates_select_random_max_count
+        return self._inputs.candidates_select_random_max_count
 
     def set_config_candidates_select_random_max_count(self, val: int):
-        self._config_candidates_select_random_max_count = val
+        self._get_own_inputs().candidates_select_random_max_count = val
 
     def is_set_config_candidates_select_random_max_count(self) -> bool:
-        return self._config_candidates_select_random_max_count is not None
+        return self._inputs.candidates_select_random_max_count is not None
 
     def get_config_result_attrs_max_count(self) -> int:
-        if self._config_result_attrs_max_count is None:
+        if self._inputs.result_attrs_max_count is None:
             raise ValueError("empty config_result_attrs_max_count")
-        return self._config_result_attrs_max_count
+        return self._inputs.result_attrs_max_count
 
     def set_config_result_attrs_max_count(self, val: int):
-        self._config_result_attrs_max_count = val
+        self._get_own_inputs().result_attrs_max_count = val
 
     def is_set_config_result_attrs_max_count(self) -> bool:
-        return self._config_result_attrs_max_count is not None
+        return self._inputs.result_attrs_max_count is not None
 
     def get_config_set_approx_threshold_to_current(self) -> bool:
-        if self._config_set_approx_threshold_to_current is None:
+        if self._inputs.set_approx_threshold_to_current is None:
             raise ValueError("empty config_set_approx_threshold_to_current")
-        return self._config_set_approx_threshold_to_current
+        return self._inputs.set_approx_threshold_to_current
 
     def set_config_set_approx_threshold_to_current(self, val: bool):
-        self._config_set_approx_threshold_to_current = val
+        self._get_own_inputs().set_approx_threshold_to_current = val
 
     def is_set_config_set_approx_threshold_to_current(self) -> bool:
-        return self._config_set_approx_threshold_to_current is not None
+        return self._inputs.set_approx_threshold_to_current is not None
+
+    def get_config_shrink_pure_groups(self) -> bool:
+        if self._inputs.shrink_pure_groups is None:
+            raise ValueError("empty config_shrink_pure_groups")
+        return self._inputs.shrink_pure_groups
+
+    def set_config_shrink_pure_groups(self, val: bool):
+        self._get_own_inputs().shrink_pure_groups = val
+
+    def is_set_config_shrink_pure_groups(self) -> bool:
+        return self._inputs.shrink_pure_groups is not None
+
+    def get_config_successive_halving_initial_sample_size(self) -> int:
+        if self._inputs.successive_halving_initial_sample_size is None:
+            raise ValueError("empty config_successive_halving_initial_sample_size")
+        return self._inputs.successive_halving_initial_sample_size
+
+    def set_config_successive_halving_initial_sample_size(self, val: int | None):
+        self._get_own_inputs().successive_halving_initial_sample_size = val
+
+    def is_set_config_successive_halving_initial_sample_size(self) -> bool:
+        return self._inputs.successive_halving_initial_sample_size is not None
+
+    def get_config_successive_halving_keep_fraction(
+        self, default: float | None = None
+    ) -> float:
+        if self._inputs.successive_halving_keep_fraction is None:
+            if default is None:
+                raise ValueError("empty config_successive_halving_keep_fraction")
+            return default
+        return self._inputs.successive_halving_keep_fraction
+
+    def set_config_successive_halving_keep_fraction(self, val: float | None):
+        self._get_own_inputs().successive_halving_keep_fraction = val
+
+    def get_config_track_disorder(self) -> bool:
+        if self._inputs.track_disorder is None:
+            raise ValueError("empty config_track_disorder")
+        return self._inputs.track_disorder
+
+    def set_config_track_disorder(self, val: bool):
+        self._get_own_inputs().track_disorder = val
+
+    def is_set_config_track_disorder(self) -> bool:
+        return self._inputs.track_disorder is not None
+
+    def get_config_partition_cache_max_bytes(self) -> int:
+        if self._inputs.partition_cache_max_bytes is None:
+            raise ValueError("empty config_partition_cache_max_bytes")
+        return self._inputs.partition_cache_max_bytes
+
+    def set_config_partition_cache_max_bytes(self, val: int | None):
+        self._get_own_inputs().partition_cache_max_bytes = val
+
+    def is_set_config_partition_cache_max_bytes(self) -> bool:
+        return self._inputs.partition_cache_max_bytes is not None
 
     def get_group_index_class(self) -> type[GroupIndexProtocol]:
-        if self._config_group_index_class is None:
+        if self._inputs.group_index_class is None:
             raise ValueError("empty group_index_class")
-        return self._config_group_index_class
+        return self._inputs.group_index_class
 
     def set_group_index_class(self, val: type[GroupIndexProtocol]):
-        self._config_group_index_class = val
+        self._get_own_inputs().group_index_class = val
 
     def is_set_group_index_class(self) -> bool:
-        return self._config_group_index_class is not None
+        return self._inputs.group_index_class is not None
 
     def get_values_group_index(self) -> GroupIndex:
         if self._values_group_index is None:
@@ -244,6 +439,17 @@ class ProcessingState:  # pylint: disable=too-many-public-methods,too-many-insta
     def set_values_y(self, val: np.ndarray):
         self._values_y = val
 
+    def get_values_weights(self) -> np.ndarray:
+        if self._values_weights is None:
+            raise ValueError("empty values_weights")
+        return self._values_weights
+
+    def set_values_weights(self, val: np.ndarray | None):
+        self._values_weights = val
+
+    def is_set_values_weights(self) -> bool:
+        return self._values_weights is not None
+
     def get_values_y_count(self) -> int:
         if self._values_y_count is None:
             raise ValueError("empty values_y_count")
@@ -274,6 +480,39 @@ class ProcessingState:  # pylint: disable=too-many-public-methods,too-many-insta
     def is_set_values_result_attrs(self) -> bool:
         return self._values_result_attrs is not None
 
+    def get_values_active_objs(self) -> np.ndarray:
+        if self._values_active_objs is None:
+            raise ValueError("empty values_active_objs")
+        return self._values_active_objs
+
+    def set_values_active_objs(self, val: np.ndarray | None):
+        self._values_active_objs = val
+
+    def is_set_values_active_objs(self) -> bool:
+        return self._values_active_objs is not None
+
+    def get_values_daar_permutations_bank(self) -> np.ndarray:
+        if self._values_daar_permutations_bank is None:
+            raise ValueError("empty values_daar_permutations_bank")
+        return self._values_daar_permutations_bank
+
+    def set_values_daar_permutations_bank(self, val: np.ndarray | None):
+        self._values_daar_permutations_bank = val
+
+    def is_set_values_daar_permutations_bank(self) -> bool:
+        return self._values_daar_permutations_bank is not None
+
+    def get_values_daar_speculative_executor(self) -> ThreadPoolExecutor:
+        if self._values_daar_speculative_executor is None:
+            raise ValueError("empty values_daar_speculative_executor")
+        return self._values_daar_speculative_executor
+
+    def set_values_daar_speculative_executor(self, val: ThreadPoolExecutor | None):
+        self._values_daar_speculative_executor = val
+
+    def is_set_values_daar_speculative_executor(self) -> bool:
+        return self._values_daar_speculative_executor is not None
+
     def get_values_disorder_score_approx_threshold(self) -> float:
         if self._values_disorder_score_approx_threshold is None:
             raise ValueError("empty values_disorder_score_approx_threshold")
@@ -290,6 +529,9 @@ class ProcessingState:  # pylint: disable=too-many-public-methods,too-many-insta
     def set_values_disorder_score_base(self, val: float):
         self._values_disorder_score_base = val
 
+    def is_set_values_disorder_score_base(self) -> bool:
+        return self._values_disorder_score_base is not None
+
     def get_values_disorder_score_total(self) -> float:
         if self._values_disorder_score_total is None:
             raise ValueError("empty values_disorder_score_total")
@@ -298,6 +540,9 @@ class ProcessingState:  # pylint: disable=too-many-public-methods,too-many-insta
     def set_values_disorder_score_total(self, val: float):
         self._values_disorder_score_total = val
 
+    def is_set_values_disorder_score_total(self) -> bool:
+        return self._values_disorder_score_total is not None
+
     def get_values_consecutive_empty_iterations_count(
         self, default: int | None = None
     ) -> int:
@@ -313,13 +558,109 @@ class ProcessingState:  # pylint: disable=too-many-public-methods,too-many-insta
     def is_set_values_consecutive_empty_iterations_count(self) -> bool:
         return self._values_consecutive_empty_iterations_count is not None
 
+    def get_values_lazy_greedy_gains(self) -> dict[int, float]:
+        if self._values_lazy_greedy_gains is None:
+            raise ValueError("empty values_lazy_greedy_gains")
+        return self._values_lazy_greedy_gains
+
+    def set_values_lazy_greedy_gains(self, val: dict[int, float]):
+        self._values_lazy_greedy_gains = val
+
+    def is_set_values_lazy_greedy_gains(self) -> bool:
+        return self._values_lazy_greedy_gains is not None
+
+    def get_values_lazy_greedy_saved_evaluations_count(
+        self, default: int | None = None
+    ) -> int:
+        if self._values_lazy_greedy_saved_evaluations_count is None:
+            if default is None:
+                raise ValueError("empty values_lazy_greedy_saved_evaluations_count")
+            return default
+        return self._values_lazy_greedy_saved_evaluations_count
+
+    def set_values_lazy_greedy_saved_evaluations_count(self, val: int):
+        self._values_lazy_greedy_saved_evaluations_count = val
+
+    def get_values_aborted_evaluations_count(self, default: int | None = None) -> int:
+        if self._values_aborted_evaluations_count is None:
+            if default is None:
+                raise ValueError("empty values_aborted_evaluations_count")
+            return default
+        return self._values_aborted_evaluations_count
+
+    def set_values_aborted_evaluations_count(self, val: int):
+        self._values_aborted_evaluations_count = val
+
+    def get_values_successive_halving_order(self) -> np.ndarray:
+        if self._values_successive_halving_order is None:
+            raise ValueError("empty values_successive_halving_order")
+        return self._values_successive_halving_order
+
+    def set_values_successive_halving_order(self, val: np.ndarray):
+        self._values_successive_halving_order = val
+
+    def is_set_values_successive_halving_order(self) -> bool:
+        return self._values_successive_halving_order is not None
+
+    def get_values_successive_halving_group_index(self) -> GroupIndex:
+        if self._values_successive_halving_group_index is None:
+            raise ValueError("empty values_successive_halving_group_index")
+        return self._values_successive_halving_group_index
+
+    def set_values_successive_halving_group_index(self, val: GroupIndex):
+        self._values_successive_halving_group_index = val
+
+    def is_set_values_successive_halving_group_index(self) -> bool:
+        return self._values_successive_halving_group_index is not None
+
+    def get_values_successive_halving_samples(
+        self,
+    ) -> dict[int, tuple[np.ndarray, GroupIndex]]:
+        if self._values_successive_halving_samples is None:
+            raise ValueError("empty values_successive_halving_samples")
+        return self._values_successive_halving_samples
+
+    def set_values_successive_halving_samples(
+        self, val: dict[int, tuple[np.ndarray, GroupIndex]]
+    ):
+        self._values_successive_halving_samples = val
+
+    def get_values_epsilon_path_approx_thresholds(self) -> list[float]:
+        if self._values_epsilon_path_approx_thresholds is None:
+            raise ValueError("empty values_epsilon_path_approx_thresholds")
+        return self._values_epsilon_path_approx_thresholds
+
+    def set_values_epsilon_path_approx_thresholds(self, val: list[float]):
+        self._values_epsilon_path_approx_thresholds = val
+
+    def get_values_epsilon_path_cuts(self) -> list[int | None]:
+        if self._values_epsilon_path_cuts is None:
+            raise ValueError("empty values_epsilon_path_cuts")
+        return self._values_epsilon_path_cuts
+
+    def set_values_epsilon_path_cuts(self, val: list[int | None]):
+        self._values_epsilon_path_cuts = val
+
+    def get_values_partition_cache(self) -> PartitionCache:
+        if self._values_partition_cache is None:
+            raise ValueError("empty values_partition_cache")
+        return self._values_partition_cache
+
+    def set_values_partition_cache(self, val: PartitionCache | None):
+        self._values_partition_cache = val
+
+    def is_set_values_partition_cache(self) -> bool:
+        return self._values_partition_cache is not None
+
     @classmethod
     def from_optional(
         cls,
         processing_fun: ProcessingFunction | None,
         rng: np.random.Generator | None = None,
+        profiler: Profiler | None = None,
     ):
         return cls(
             rng=rng,
             processing_fun=processing_fun,
+            profiler=profiler,
         )
@@ -10,7 +10,7 @@ import numba
 import numpy as np
 
 
-@numba.njit(cache=True)
+@numba.njit(cache=True, nogil=True)
 def get_positions_where_values_in(
     values: np.ndarray,
     reference: np.ndarray,
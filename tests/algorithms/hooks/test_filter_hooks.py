@@ -2,6 +2,8 @@ import numpy as np
 import pytest
 
 from skrough.algorithms.hooks.filter_hooks import filter_hook_attrs_first_daar
+from skrough.attrs_checks import check_if_attr_better_than_shuffled
+from skrough.dataprep import prepare_factorized_array, prepare_factorized_vector
 from skrough.disorder_measures import conflicts_count, entropy, gini_impurity
 from skrough.structs.group_index import GroupIndex
 from skrough.structs.state import ProcessingState
@@ -52,7 +54,9 @@ from tests.algorithms.hooks.helpers import prepare_test_data_and_setup_state
         (1.0, [0, 1], [0]),
     ],
 )
+@pytest.mark.parametrize("daar_speculative_count", [None, 1, 3])
 def test_filter_hook_attrs_first_daar(
+    daar_speculative_count,
     x,
     y,
     start_attrs,
@@ -68,6 +72,7 @@ def test_filter_hook_attrs_first_daar(
     state_fixture.set_config_disorder_fun(disorder_fun)
     state_fixture.set_config_daar_fast(False)
     state_fixture.set_config_daar_smoothing_parameter(1.0)
+    state_fixture.set_config_daar_speculative_count(daar_speculative_count)
     x, x_counts, y, _, state_fixture = prepare_test_data_and_setup_state(
         x=x,
         y=y,
@@ -77,3 +82,82 @@ def test_filter_hook_attrs_first_daar(
     state_fixture.set_values_group_index(group_index)
     result = filter_hook_attrs_first_daar(state_fixture, elements)
     assert np.array_equal(result, expected)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_filter_hook_attrs_first_daar_speculative(seed):
+    data_rng = np.random.default_rng(seed)
+    x = data_rng.integers(3, size=(50, 12))
+    y = (x[:, 0] + x[:, data_rng.integers(1, 12)] * data_rng.integers(2, size=50)) % 2
+    elements = data_rng.permutation(x.shape[1])
+
+    def _filter(daar_speculative_count):
+        state = ProcessingState.from_optional(
+            processing_fun=None,
+            rng=np.random.default_rng(seed),
+        )
+        state.set_config_daar_allowed_randomness(0.1)
+        state.set_config_daar_probes_count(50)
+        state.set_config_disorder_fun(entropy)
+        state.set_config_daar_fast(False)
+        state.set_config_daar_speculative_count(daar_speculative_count)
+        x_, x_counts, _, _, state = prepare_test_data_and_setup_state(
+            x=x, y=y, state=state
+        )
+        state.set_values_group_index(GroupIndex.from_data(x_, x_counts, [0]))
+        result = filter_hook_attrs_first_daar(state, elements)
+        if daar_speculative_count is not None:
+            # the thread pool is created once and reused by later calls
+            executor = state.get_values_daar_speculative_executor()
+            filter_hook_attrs_first_daar(state, elements)
+            assert state.get_values_daar_speculative_executor() is executor
+        return result, state.get_rng().random()
+
+    # the sequential checking draws from the generator of the state one check after
+    # another, as the checks are done one by one
+    rng = np.random.default_rng(seed)
+    x_, x_counts = prepare_factorized_array(x)
+    y_, y_count = prepare_factorized_vector(y)
+    group_index = GroupIndex.from_data(x_, x_counts, [0])
+    sequential_expected = []
+    for attr in elements:
+        if check_if_attr_better_than_shuffled(
+            group_index=group_index,
+            attr_values=x_[:, attr],
+            attr_values_count=x_counts[attr],
+            values=y_,
+            values_count=y_count,
+            allowed_randomness=0.1,
+            probes_count=50,
+            smoothing_parameter=1,
+            fast=False,
+            disorder_fun=entropy,
+            rng=rng,
+        ):
+            sequential_expected.append(attr)
+            break
+    sequential_result = _filter(None)
+    assert np.array_equal(sequential_result[0], sequential_expected)
+    assert sequential_result[1] == rng.random()
+
+    expected = _filter(1)
+    for daar_speculative_count in [2, 4, 100]:
+        result = _filter(daar_speculative_count)
+        assert np.array_equal(result[0], expected[0])
+        assert result[1] == expected[1]
+
+
+def test_filter_hook_attrs_first_daar_speculative_invalid(
+    state_fixture: ProcessingState,
+):
+    state_fixture.set_config_daar_allowed_randomness(0.1)
+    state_fixture.set_config_daar_probes_count(10)
+    state_fixture.set_config_disorder_fun(entropy)
+    state_fixture.set_config_daar_fast(False)
+    state_fixture.set_config_daar_speculative_count(0)
+    x, _, _, _, state_fixture = prepare_test_data_and_setup_state(
+        x=np.eye(3), y=[0, 1, 1], state=state_fixture
+    )
+    state_fixture.set_values_group_index(GroupIndex.create_uniform(len(x)))
+    with pytest.raises(ValueError, match="Speculative count"):
+        filter_hook_attrs_first_daar(state_fixture, [0, 1])
@@ -3,15 +3,20 @@ import pandas as pd
 import pytest
 
 from skrough.algorithms.hooks.init_hooks import (
+    init_hook_active_objs,
+    init_hook_daar_permutations_bank,
     init_hook_epsilon_approx_threshold,
     init_hook_factorize_data_x_y,
+    init_hook_partition_cache,
     # init_hook_result_attrs_empty,
     # init_hook_result_objs_empty,
     init_hook_single_group_index,
+    init_hook_track_disorder,
 )
 from skrough.dataprep import prepare_factorized_data
 from skrough.disorder_measures import conflicts_count, entropy, gini_impurity
 from skrough.disorder_score import get_disorder_score_for_data
+from skrough.structs.group_index import GroupIndex
 from skrough.structs.state import ProcessingState
 from tests.algorithms.hooks.helpers import prepare_test_data_and_setup_state
 from tests.helpers import generate_data
@@ -126,3 +131,127 @@ def test_init_hook_approx_threshold(
     assert np.isclose(
         state_fixture.get_values_disorder_score_approx_threshold(), approx_threshold
     )
+
+
+def test_init_hook_approx_threshold_known_base_and_total(
+    state_fixture: ProcessingState,
+):
+    state_fixture.set_config_epsilon(0.5)
+    state_fixture.set_config_disorder_fun(entropy)
+    prepare_test_data_and_setup_state(
+        x=generate_data(size=(5, 3)),
+        y=generate_data(size=5),
+        state=state_fixture,
+    )
+    state_fixture.set_values_disorder_score_base(3.0)
+    state_fixture.set_values_disorder_score_total(1.0)
+    init_hook_epsilon_approx_threshold(state_fixture)
+    assert state_fixture.get_values_disorder_score_base() == 3.0
+    assert state_fixture.get_values_disorder_score_total() == 1.0
+    assert np.isclose(state_fixture.get_values_disorder_score_approx_threshold(), 2.0)
+
+
+@pytest.mark.parametrize(
+    "x, y, start_attrs, shrink_pure_groups, expected_active_objs",
+    [
+        (np.eye(4), [0, 0, 1, 1], [], None, None),
+        (np.eye(4), [0, 0, 1, 1], [], False, None),
+        (np.eye(4), [0, 0, 1, 1], [], True, [0, 1, 2, 3]),
+        (np.eye(4), [1, 1, 1, 1], [], True, []),
+        (np.eye(4), [0, 0, 1, 1], [0], True, [1, 2, 3]),
+        (np.eye(4), [0, 0, 1, 1], [0, 1], True, []),
+        (np.eye(4), [0, 1, 1, 0], [0, 1], True, [2, 3]),
+    ],
+)
+def test_init_hook_active_objs(
+    x,
+    y,
+    start_attrs,
+    shrink_pure_groups,
+    expected_active_objs,
+    state_fixture: ProcessingState,
+):
+    x, x_counts, _, _, state_fixture = prepare_test_data_and_setup_state(
+        x=x,
+        y=y,
+        state=state_fixture,
+    )
+    if shrink_pure_groups is not None:
+        state_fixture.set_config_shrink_pure_groups(shrink_pure_groups)
+    state_fixture.set_values_group_index(GroupIndex.from_data(x, x_counts, start_attrs))
+    init_hook_active_objs(state_fixture)
+    if expected_active_objs is None:
+        assert state_fixture.is_set_values_active_objs() is False
+        assert state_fixture.get_values_group_index().n_objs == len(x)
+    else:
+        active_objs = state_fixture.get_values_active_objs()
+        assert np.array_equal(active_objs, expected_active_objs)
+        assert state_fixture.get_values_group_index().n_objs == len(active_objs)
+
+
+@pytest.mark.parametrize("track_disorder", [None, False, True])
+@pytest.mark.parametrize("result_objs", [None, [0, 1]])
+def test_init_hook_track_disorder(
+    track_disorder, result_objs, state_fixture: ProcessingState
+):
+    x, x_counts, y, y_count, state_fixture = prepare_test_data_and_setup_state(
+        x=np.eye(4),
+        y=[0, 0, 1, 1],
+        state=state_fixture,
+    )
+    state_fixture.set_config_disorder_fun(conflicts_count)
+    state_fixture.set_values_group_index(GroupIndex.create_uniform(len(x)))
+    if track_disorder is not None:
+        state_fixture.set_config_track_disorder(track_disorder)
+    if result_objs is not None:
+        state_fixture.set_values_result_objs(result_objs)
+    init_hook_track_disorder(state_fixture)
+    group_index = state_fixture.get_values_group_index().split(x[:, 0], x_counts[0])
+    tracker = group_index._disorder_tracker  # pylint: disable=protected-access
+    if track_disorder is True and result_objs is None:
+        assert tracker is not None
+        assert group_index.get_tracked_disorder_score(y, y_count, conflicts_count) == 2
+    else:
+        assert tracker is None
+
+
+@pytest.mark.parametrize("bank_size", [None, 1, 5])
+def test_init_hook_daar_permutations_bank(bank_size, state_fixture: ProcessingState):
+    x, _, _, _, state_fixture = prepare_test_data_and_setup_state(
+        x=generate_data(size=(30, 3)),
+        y=generate_data(size=30),
+        state=state_fixture,
+    )
+    state_fixture.set_config_daar_permutations_bank_size(bank_size)
+    init_hook_daar_permutations_bank(state_fixture)
+    if bank_size is None:
+        assert state_fixture.is_set_values_daar_permutations_bank() is False
+    else:
+        bank = state_fixture.get_values_daar_permutations_bank()
+        assert bank.shape == (bank_size, len(x))
+        assert bank.dtype == np.int32
+        for permutation in bank:
+            assert np.array_equal(np.sort(permutation), np.arange(len(x)))
+
+
+def test_init_hook_daar_permutations_bank_invalid(state_fixture: ProcessingState):
+    _, _, _, _, state_fixture = prepare_test_data_and_setup_state(
+        x=np.eye(4),
+        y=[0, 0, 1, 1],
+        state=state_fixture,
+    )
+    state_fixture.set_config_daar_permutations_bank_size(0)
+    with pytest.raises(ValueError, match="Permutations bank size"):
+        init_hook_daar_permutations_bank(state_fixture)
+
+
+@pytest.mark.parametrize("max_bytes", [None, 0, 1000])
+def test_init_hook_partition_cache(max_bytes, state_fixture: ProcessingState):
+    state_fixture.set_config_partition_cache_max_bytes(max_bytes)
+    init_hook_partition_cache(state_fixture)
+    if max_bytes is None:
+        assert state_fixture.is_set_values_partition_cache() is False
+    else:
+        partition_cache = state_fixture.get_values_partition_cache()
+        assert partition_cache.max_bytes == max_bytes
+        assert len(partition_cache) == 0
@@ -3,10 +3,14 @@ import pytest
 
 from skrough.algorithms.hooks.inner_process_hooks import (
     inner_process_hook_add_first_attr,
+    inner_process_hook_discard_attrs_approx_threshold,
+    inner_process_hook_discard_first_attr_approx_threshold,
 )
 from skrough.dataprep import prepare_factorized_array
+from skrough.disorder_measures import conflicts_count, entropy, gini_impurity
 from skrough.structs.group_index import GroupIndex
 from skrough.structs.state import ProcessingState
+from tests.algorithms.hooks.helpers import prepare_test_data_and_setup_state
 
 
 @pytest.mark.parametrize(
@@ -49,3 +53,100 @@ def test_inner_process_hook_add_first_attr(
         actual_group_index = state_fixture.get_values_group_index()
         assert actual_group_index.n_groups == expected_group_index.n_groups
         assert np.array_equal(actual_group_index.index, expected_group_index.index)
+
+
+@pytest.mark.parametrize(
+    "data, y, attr_elements, expected_active_objs",
+    [
+        (np.eye(5), [0, 0, 0, 0, 0], [0, 1], []),
+        (np.eye(5), [0, 1, 1, 0, 1], [], [0, 1, 2, 3, 4]),
+        (np.eye(5), [0, 1, 1, 0, 1], [0], [1, 2, 3, 4]),
+        (np.eye(5), [0, 1, 1, 0, 1], [0, 1, 2], [3, 4]),
+        (
+            [[0, 0], [0, 0], [0, 1], [1, 1], [1, 1], [1, 0]],
+            [0, 1, 0, 0, 1, 1],
+            [0],
+            [0, 1, 2, 3, 4, 5],
+        ),
+        (
+            [[0, 0], [0, 0], [0, 1], [1, 1], [1, 1], [1, 0]],
+            [0, 1, 0, 0, 1, 1],
+            [0, 1],
+            [0, 1, 3, 4],
+        ),
+    ],
+)
+def test_inner_process_hook_add_first_attr_active_objs(
+    data,
+    y,
+    attr_elements,
+    expected_active_objs,
+    state_fixture: ProcessingState,
+):
+    x, x_counts, y, _, state_fixture = prepare_test_data_and_setup_state(
+        x=data,
+        y=y,
+        state=state_fixture,
+    )
+    state_fixture.set_values_group_index(GroupIndex.create_uniform(len(x)))
+    state_fixture.set_values_result_attrs([])
+    state_fixture.set_values_active_objs(np.arange(len(x)))
+
+    while len(attr_elements) > 0:
+        attr_elements = inner_process_hook_add_first_attr(
+            state=state_fixture,
+            elements=attr_elements,
+        )
+
+    active_objs = state_fixture.get_values_active_objs()
+    assert np.array_equal(active_objs, expected_active_objs)
+    group_index = state_fixture.get_values_group_index()
+    assert group_index.n_objs == len(active_objs)
+    expected_group_index = GroupIndex.from_data(
+        x[active_objs], x_counts, state_fixture.get_values_result_attrs()
+    )
+    assert group_index.n_groups == expected_group_index.n_groups
+
+
+@pytest.mark.parametrize("disorder_fun", [conflicts_count, entropy, gini_impurity])
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("result_objs", [None, list(range(0, 30, 2))])
+def test_inner_process_hook_discard_attrs_approx_threshold(
+    disorder_fun,
+    seed,
+    result_objs,
+    state_fixture: ProcessingState,
+):
+    rng = np.random.default_rng(seed)
+    x = rng.integers(3, size=(30, 8))
+    y = (x[:, 0] + x[:, 3]) % 2
+    x, x_counts, y, y_count, state_fixture = prepare_test_data_and_setup_state(
+        x=x,
+        y=y,
+        state=state_fixture,
+    )
+    state_fixture.set_config_disorder_fun(disorder_fun)
+    if result_objs is not None:
+        state_fixture.set_values_result_objs(result_objs)
+        x = x[result_objs]
+        y = y[result_objs]
+    result_attrs = list(rng.permutation(8))
+    threshold = GroupIndex.from_data(x, x_counts, [0, 3]).get_disorder_score(
+        y, y_count, disorder_fun
+    )
+    state_fixture.set_values_disorder_score_approx_threshold(threshold)
+    elements = result_attrs[::-1]
+
+    state_fixture.set_values_result_attrs(list(result_attrs))
+    remaining = list(elements)
+    while len(remaining) > 0:
+        remaining = inner_process_hook_discard_first_attr_approx_threshold(
+            state_fixture, remaining
+        )
+    expected = state_fixture.get_values_result_attrs()
+
+    state_fixture.set_values_result_attrs(list(result_attrs))
+    assert (
+        inner_process_hook_discard_attrs_approx_threshold(state_fixture, elements) == []
+    )
+    assert state_fixture.get_values_result_attrs() == expected
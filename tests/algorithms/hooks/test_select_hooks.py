@@ -3,10 +3,15 @@
 import numpy as np
 import pytest
 
-from skrough.algorithms.hooks.select_hooks import select_hook_attrs_disorder_score_based
+from skrough.algorithms.hooks.select_hooks import (
+    select_hook_attrs_disorder_score_based,
+    select_hook_attrs_disorder_score_based_early_abort,
+    select_hook_attrs_disorder_score_based_lazy,
+    select_hook_attrs_disorder_score_based_successive_halving,
+)
 from skrough.disorder_measures import conflicts_count, entropy, gini_impurity
 from skrough.disorder_score import get_disorder_score_for_data
-from skrough.structs.group_index import GroupIndex
+from skrough.structs.group_index import GROUP_INDEX_BY_NAME, GroupIndex
 from skrough.structs.state import ProcessingState
 from tests.algorithms.hooks.helpers import prepare_test_data_and_setup_state
 from tests.helpers import generate_data
@@ -79,6 +84,207 @@ def test_select_hook_disorder_score_based(
                 attrs=start_attrs + [i],
             )
         )
-    expected_idx = np.argsort(scores)[:expected_count]
+    expected_idx = np.argsort(scores, kind="stable")[:expected_count]
     expected = np.arange(n_attrs)[expected_idx]
     assert np.array_equal(result, expected)
+
+
+@pytest.mark.parametrize("group_index_class", GROUP_INDEX_BY_NAME.values())
+@pytest.mark.parametrize("count", [0, 1, 2, 10])
+@pytest.mark.parametrize("disorder_fun", [conflicts_count, gini_impurity, entropy])
+def test_select_hook_disorder_score_based_early_abort(
+    group_index_class,
+    count,
+    disorder_fun,
+    state_fixture: ProcessingState,
+):
+    state_fixture.set_config_select_attrs_disorder_score_based_max_count(count)
+    state_fixture.set_config_disorder_fun(disorder_fun)
+    x, x_counts, _, _, state_fixture = prepare_test_data_and_setup_state(
+        x=generate_data(size=(30, 8), values_max=3),
+        y=generate_data(size=30, values_max=2),
+        state=state_fixture,
+    )
+    group_index = group_index_class.from_data(x, x_counts, [0])
+    state_fixture.set_values_group_index(group_index)
+    expected = select_hook_attrs_disorder_score_based(state_fixture, range(8))
+    result = select_hook_attrs_disorder_score_based_early_abort(state_fixture, range(8))
+    assert len(result) == len(expected)
+    # candidates are scored one by one rather than in a batch, which may differ in
+    # the last bits and therefore break exact ties differently
+    scores = np.asarray(
+        [
+            group_index.get_disorder_score_after_split(
+                split_values=x[:, attr],
+                split_values_count=int(x_counts[attr]),
+                values=state_fixture.get_values_y(),
+                values_count=state_fixture.get_values_y_count(),
+                disorder_fun=disorder_fun,
+            )
+            for attr in range(8)
+        ]
+    )
+    assert np.allclose(scores[result], scores[expected])
+
+
+def test_select_hook_disorder_score_based_early_abort_count(
+    state_fixture: ProcessingState,
+):
+    state_fixture.set_config_select_attrs_disorder_score_based_max_count(1)
+    state_fixture.set_config_disorder_fun(conflicts_count)
+    x, x_counts, _, _, state_fixture = prepare_test_data_and_setup_state(
+        x=[[0, 0, 0], [0, 1, 0], [1, 0, 1], [1, 1, 1]],
+        y=[0, 0, 1, 1],
+        state=state_fixture,
+    )
+    state_fixture.set_values_group_index(GroupIndex.from_data(x, x_counts, []))
+    # attr 0 leaves no conflicts, so attr 1 exceeds the bound, while attr 2 ties
+    # with attr 0 and loses by the order of candidates
+    result = select_hook_attrs_disorder_score_based_early_abort(
+        state_fixture, [0, 1, 2]
+    )
+    assert np.array_equal(result, [0])
+    assert state_fixture.get_values_aborted_evaluations_count() == 1
+    select_hook_attrs_disorder_score_based_early_abort(state_fixture, [0, 1, 2])
+    assert state_fixture.get_values_aborted_evaluations_count() == 2
+
+
+@pytest.mark.parametrize("count", [1, 2, 10])
+@pytest.mark.parametrize("disorder_fun", [conflicts_count, gini_impurity, entropy])
+def test_select_hook_disorder_score_based_lazy_fresh(
+    count,
+    disorder_fun,
+    state_fixture: ProcessingState,
+):
+    state_fixture.set_config_select_attrs_disorder_score_based_max_count(count)
+    state_fixture.set_config_disorder_fun(disorder_fun)
+    x, x_counts, _, _, state_fixture = prepare_test_data_and_setup_state(
+        x=generate_data(size=(30, 6), values_max=3),
+        y=generate_data(size=30, values_max=2),
+        state=state_fixture,
+    )
+    state_fixture.set_values_group_index(GroupIndex.from_data(x, x_counts, [0]))
+    expected = select_hook_attrs_disorder_score_based(state_fixture, range(6))
+    result = select_hook_attrs_disorder_score_based_lazy(state_fixture, range(6))
+    assert np.array_equal(result, expected)
+    assert len(state_fixture.get_values_lazy_greedy_gains()) == 6
+    assert state_fixture.get_values_lazy_greedy_saved_evaluations_count() == 0
+
+
+def test_select_hook_disorder_score_based_lazy_skips_stale(
+    state_fixture: ProcessingState,
+):
+    state_fixture.set_config_select_attrs_disorder_score_based_max_count(1)
+    state_fixture.set_config_disorder_fun(conflicts_count)
+    x, x_counts, _, _, state_fixture = prepare_test_data_and_setup_state(
+        x=[[0, 0, 0], [0, 1, 0], [1, 0, 1], [1, 1, 1]],
+        y=[0, 0, 1, 1],
+        state=state_fixture,
+    )
+    state_fixture.set_values_group_index(GroupIndex.from_data(x, x_counts, []))
+    # attr 0 is the best one and its gain from a previous iteration is still
+    # valid; attrs 1 and 2 have lower gain bounds, so they are not evaluated
+    state_fixture.set_values_lazy_greedy_gains({0: 4.0, 1: 1.0, 2: 3.0})
+    result = select_hook_attrs_disorder_score_based_lazy(state_fixture, [1, 2, 0])
+    assert np.array_equal(result, [0])
+    assert state_fixture.get_values_lazy_greedy_saved_evaluations_count() == 2
+    assert state_fixture.get_values_lazy_greedy_gains() == {0: 4.0, 1: 1.0, 2: 3.0}
+
+
+@pytest.mark.parametrize("count", [0, 1, 2, 10])
+@pytest.mark.parametrize("start_attrs", [[], [0]])
+def test_select_hook_disorder_score_based_successive_halving_full_sample(
+    count,
+    start_attrs,
+    state_fixture: ProcessingState,
+):
+    state_fixture.set_config_select_attrs_disorder_score_based_max_count(count)
+    state_fixture.set_config_disorder_fun(gini_impurity)
+    state_fixture.set_config_successive_halving_initial_sample_size(30)
+    x, x_counts, _, _, state_fixture = prepare_test_data_and_setup_state(
+        x=generate_data(size=(30, 8), values_max=3),
+        y=generate_data(size=30, values_max=2),
+        state=state_fixture,
+    )
+    state_fixture.set_values_group_index(GroupIndex.from_data(x, x_counts, start_attrs))
+    expected = select_hook_attrs_disorder_score_based(state_fixture, range(8))
+    result = select_hook_attrs_disorder_score_based_successive_halving(
+        state_fixture, range(8)
+    )
+    assert np.array_equal(result, expected)
+    # the whole data is scored at once, so no samples are drawn
+    assert not state_fixture.is_set_values_successive_halving_order()
+
+
+@pytest.mark.parametrize("keep_fraction", [None, 0.25, 0.75])
+def test_select_hook_disorder_score_based_successive_halving(
+    keep_fraction,
+    state_fixture: ProcessingState,
+):
+    state_fixture.set_config_select_attrs_disorder_score_based_max_count(2)
+    state_fixture.set_config_disorder_fun(gini_impurity)
+    state_fixture.set_config_successive_halving_initial_sample_size(50)
+    state_fixture.set_config_successive_halving_keep_fraction(keep_fraction)
+    state_fixture.rng = np.random.default_rng(0)
+    rng = np.random.default_rng(0)
+    x = rng.integers(3, size=(1000, 20))
+    y = (x[:, 3] + x[:, 7] >= 3).astype(int)
+    x, _, _, _, state_fixture = prepare_test_data_and_setup_state(
+        x=x,
+        y=y,
+        state=state_fixture,
+    )
+    group_index = GroupIndex.create_uniform(1000)
+    state_fixture.set_values_group_index(group_index)
+    expected = select_hook_attrs_disorder_score_based(state_fixture, range(20))
+    result = select_hook_attrs_disorder_score_based_successive_halving(
+        state_fixture, range(20)
+    )
+    assert np.array_equal(result, expected)
+    samples = state_fixture.get_values_successive_halving_samples()
+    assert min(samples) == 50
+    assert state_fixture.get_values_successive_halving_group_index() is group_index
+    for sample_size, (objs, sample_group_index) in samples.items():
+        assert len(objs) == sample_size
+        assert sample_group_index.n_objs == sample_size
+    # nested prefixes of the stratified permutation
+    order = state_fixture.get_values_successive_halving_order()
+    for sample_size, (objs, _) in samples.items():
+        assert np.array_equal(objs, order[:sample_size])
+
+    # the restricted group indices are reused while the group index is the same
+    cached = {size: sample[1] for size, sample in samples.items()}
+    select_hook_attrs_disorder_score_based_successive_halving(state_fixture, range(20))
+    samples = state_fixture.get_values_successive_halving_samples()
+    assert all(samples[size][1] is cached[size] for size in cached)
+
+
+@pytest.mark.parametrize(
+    "sample_size, keep_fraction",
+    [
+        (0, None),
+        (-1, None),
+        (10, 0.0),
+        (10, 1.0),
+        (10, 1.5),
+    ],
+)
+def test_select_hook_disorder_score_based_successive_halving_wrong_args(
+    sample_size,
+    keep_fraction,
+    state_fixture: ProcessingState,
+):
+    state_fixture.set_config_select_attrs_disorder_score_based_max_count(1)
+    state_fixture.set_config_disorder_fun(gini_impurity)
+    state_fixture.set_config_successive_halving_initial_sample_size(sample_size)
+    state_fixture.set_config_successive_halving_keep_fraction(keep_fraction)
+    x, x_counts, _, _, state_fixture = prepare_test_data_and_setup_state(
+        x=generate_data(size=(30, 4), values_max=3),
+        y=generate_data(size=30, values_max=2),
+        state=state_fixture,
+    )
+    state_fixture.set_values_group_index(GroupIndex.from_data(x, x_counts, []))
+    with pytest.raises(ValueError):
+        select_hook_attrs_disorder_score_based_successive_halving(
+            state_fixture, range(4)
+        )
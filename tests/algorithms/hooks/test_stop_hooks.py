@@ -1,10 +1,12 @@
 import numpy as np
 import pytest
 
+from skrough.algorithms.hooks.helpers import shrink_to_impure_groups
 from skrough.algorithms.hooks.stop_hooks import (
     stop_hook_approx_threshold,
     stop_hook_attrs_count,
     stop_hook_empty_iterations,
+    stop_hook_epsilon_path_approx_thresholds,
 )
 from skrough.dataprep import prepare_factorized_array, prepare_factorized_vector
 from skrough.disorder_measures import conflicts_count, entropy, gini_impurity
@@ -58,11 +60,83 @@ def test_stop_hook_approx_threshold(
     state_fixture.set_values_disorder_score_approx_threshold(disorder_score)
     assert stop_hook_approx_threshold(state_fixture) is True
 
+
+@pytest.mark.parametrize(
+    "disorder_fun",
+    [
+        conflicts_count,
+        gini_impurity,
+        entropy,
+    ],
+)
+@pytest.mark.parametrize("start_attrs", [[], [0], [0, 1], [0, 1, 2]])
+def test_stop_hook_approx_threshold_active_objs(
+    start_attrs,
+    disorder_fun,
+    state_fixture: ProcessingState,
+):
+    x, x_counts = prepare_factorized_array(generate_data(size=(30, 4), values_max=3))
+    y, y_count = prepare_factorized_vector(generate_data(size=30, values_max=3))
+    group_index = GroupIndex.from_data(x=x, x_counts=x_counts, attrs=start_attrs)
+    disorder_score = group_index.get_disorder_score(
+        values=y,
+        values_count=y_count,
+        disorder_fun=disorder_fun,
+    )
+    state_fixture.set_config_disorder_fun(disorder_fun)
+    state_fixture.set_values_y(y)
+    state_fixture.set_values_y_count(y_count)
+    shrink_to_impure_groups(state_fixture, group_index, np.arange(len(y)))
+
+    state_fixture.set_values_disorder_score_approx_threshold(
+        disorder_score * (1 + 1e-9)
+    )
+    assert stop_hook_approx_threshold(state_fixture) is True
+    if disorder_score > 0:
+        state_fixture.set_values_disorder_score_approx_threshold(
+            disorder_score * (1 - 1e-9)
+        )
+        assert stop_hook_approx_threshold(state_fixture) is False
+
     approx_threshold_less = np.nextafter(disorder_score, -np.inf)
     state_fixture.set_values_disorder_score_approx_threshold(approx_threshold_less)
     assert stop_hook_approx_threshold(state_fixture) is False
 
 
+def test_stop_hook_epsilon_path_approx_thresholds(state_fixture: ProcessingState):
+    x, x_counts = prepare_factorized_array(generate_data(size=(30, 4), values_max=3))
+    y, y_count = prepare_factorized_vector(generate_data(size=30, values_max=3))
+    state_fixture.set_config_disorder_fun(entropy)
+    state_fixture.set_values_y(y)
+    state_fixture.set_values_y_count(y_count)
+    scores = [
+        GroupIndex.from_data(x=x, x_counts=x_counts, attrs=attrs).get_disorder_score(
+            values=y,
+            values_count=y_count,
+            disorder_fun=entropy,
+        )
+        for attrs in [[], [0], [0, 1]]
+    ]
+    approx_thresholds = [scores[1], scores[0], np.nextafter(scores[2], -np.inf)]
+    state_fixture.set_values_epsilon_path_approx_thresholds(approx_thresholds)
+    state_fixture.set_values_epsilon_path_cuts([None] * 3)
+    for result_attrs, expected_cuts in [
+        ([], [None, 0, None]),
+        ([0], [1, 0, None]),
+        ([0, 1], [1, 0, None]),
+    ]:
+        state_fixture.set_values_result_attrs(result_attrs)
+        state_fixture.set_values_group_index(
+            GroupIndex.from_data(x=x, x_counts=x_counts, attrs=result_attrs)
+        )
+        assert stop_hook_epsilon_path_approx_thresholds(state_fixture) is False
+        assert state_fixture.get_values_epsilon_path_cuts() == expected_cuts
+
+    state_fixture.set_values_epsilon_path_approx_thresholds(approx_thresholds[:2])
+    state_fixture.set_values_epsilon_path_cuts([1, 0])
+    assert stop_hook_epsilon_path_approx_thresholds(state_fixture) is True
+
+
 @pytest.mark.parametrize(
     "attrs, attrs_max_count",
     [
@@ -1,9 +1,11 @@
 from contextlib import nullcontext as does_not_raise
 from unittest.mock import MagicMock
 
+import joblib
+import numpy as np
 import pytest
 
-from skrough.algorithms.meta.helpers import normalize_sequence
+from skrough.algorithms.meta.helpers import get_parallel, normalize_sequence
 
 norm_mock = MagicMock()
 
@@ -47,3 +49,18 @@ def test_normalize_hook_sequence(hooks, optional, expected, exception_raise):
     with exception_raise:
         result = normalize_sequence(items=hooks, optional=optional)
         assert result == expected
+
+
+@pytest.mark.parametrize(
+    "share_data, expected_type",
+    [
+        (False, np.ndarray),
+        (True, np.memmap),
+    ],
+)
+def test_get_parallel_share_data(share_data, expected_type):
+    array = np.zeros(shape=(10, 3), dtype=np.int64)
+    result = get_parallel(n_jobs=2, backend=None, share_data=share_data)(
+        joblib.delayed(lambda a: (type(a), a.sum()))(array) for _ in range(2)
+    )
+    assert result == [(expected_type, 0), (expected_type, 0)]
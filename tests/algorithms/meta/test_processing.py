@@ -1,7 +1,14 @@
+import time
 from dataclasses import replace
 from unittest.mock import MagicMock
 
-from skrough.algorithms.meta.processing import ProcessingMultiStage
+import pytest
+
+import skrough.algorithms.meta.processing as processing_module
+from skrough.algorithms.meta.processing import (
+    ProcessingMultiStage,
+    get_auto_batch_size,
+)
 from skrough.structs.state import ProcessingState
 from tests.algorithms.meta.helpers import DUMMY_NODE, LEAF_VALUE, get_describe_dict
 
@@ -82,3 +89,125 @@ def test_get_description_graph():
         multi_stage_dict[DESCRIBE_PREPARE_RESULT_NODE_NAME][LEAF_VALUE]
         == prepare_result_node
     )
+
+
+def test_processing_multi_stage_shared_init(
+    state_fixture: ProcessingState,
+):
+    shared_init_hook = MagicMock()
+    init_multi_stage_hook = MagicMock()
+    prepare_result_fun = MagicMock(side_effect=lambda state: state)
+
+    processing = ProcessingMultiStage.from_hooks(
+        shared_init_hooks=[shared_init_hook],
+        init_multi_stage_hooks=[init_multi_stage_hook],
+        prepare_result_fun=prepare_result_fun,
+    )
+    assert processing.shared_init_agg.normalized_hooks[0] == shared_init_hook
+
+    processing(state=state_fixture)
+    assert shared_init_hook.call_count == 1
+    assert init_multi_stage_hook.call_count == 1
+
+    shared_init_hook.reset_mock()
+    init_multi_stage_hook.reset_mock()
+    result = processing.call_parallel(n_times=3, state=state_fixture, seed=0)
+    assert shared_init_hook.call_count == 1
+    assert init_multi_stage_hook.call_count == 3
+    # every run works on its own copy of the state
+    assert len({id(state) for state in result}) == 3
+    assert all(state is not state_fixture for state in result)
+
+
+@pytest.mark.parametrize(
+    "run_seconds, n_runs, n_jobs, expected",
+    [
+        (1.0, 100, 1, 1),
+        (0.01, 100, 1, 20),
+        (0.01, 100, 10, 10),
+        (0.01, 5, 2, 3),
+        (0.0, 0, 1, 1),
+        (0.0, 7, 1, 7),
+    ],
+)
+def test_get_auto_batch_size(run_seconds, n_runs, n_jobs, expected):
+    assert get_auto_batch_size(run_seconds, n_runs, n_jobs) == expected
+
+
+@pytest.mark.parametrize("n_times", [0, 1, 5, 8])
+@pytest.mark.parametrize("batch_size", [1, 2, 3, 100, "auto"])
+def test_call_parallel_batch_size(n_times, batch_size):
+    state = ProcessingState.from_optional(processing_fun=None)
+    processing = ProcessingMultiStage.from_hooks(
+        prepare_result_fun=lambda state: state.get_rng().integers(1000),
+    )
+    expected = processing.call_parallel(n_times=n_times, state=state, seed=0)
+    result = processing.call_parallel(
+        n_times=n_times,
+        state=state,
+        seed=0,
+        batch_size=batch_size,
+    )
+    assert len(result) == n_times
+    assert result == expected
+
+
+def test_call_parallel_batch_size_invalid(state_fixture: ProcessingState):
+    shared_init_hook = MagicMock()
+    processing = ProcessingMultiStage.from_hooks(
+        shared_init_hooks=[shared_init_hook],
+        prepare_result_fun=MagicMock(),
+    )
+    with pytest.raises(ValueError, match="Batch size"):
+        processing.call_parallel(n_times=3, state=state_fixture, batch_size=0)
+    # the batch size is validated before any work is done
+    shared_init_hook.assert_not_called()
+
+
+def test_call_parallel_auto_batch_size_times_warm_run(monkeypatch):
+    # the first run is slow, as if the compiled kernels were being compiled
+    durations = iter([0.5])
+
+    def _prepare_result(state: ProcessingState):
+        time.sleep(next(durations, 0.0))
+        return state.get_rng().integers(1000)
+
+    recorded_run_seconds = []
+
+    def _get_auto_batch_size(run_seconds, n_runs, n_jobs):
+        recorded_run_seconds.append(run_seconds)
+        return get_auto_batch_size(run_seconds, n_runs, n_jobs)
+
+    monkeypatch.setattr(processing_module, "get_auto_batch_size", _get_auto_batch_size)
+    state = ProcessingState.from_optional(processing_fun=None)
+    processing = ProcessingMultiStage.from_hooks(prepare_result_fun=_prepare_result)
+    result = processing.call_parallel(n_times=5, state=state, seed=0, batch_size="auto")
+    assert len(result) == 5
+    assert len(recorded_run_seconds) == 1
+    assert recorded_run_seconds[0] < 0.5
+
+
+@pytest.mark.parametrize("batch_size", [None, 2])
+def test_call_parallel_threading_result_lists_not_shared(batch_size):
+    state = ProcessingState.from_optional(processing_fun=None)
+    state.set_values_result_attrs([0])
+
+    def _append(state: ProcessingState):
+        state.get_values_result_attrs().append(int(state.get_rng().integers(1000)))
+
+    processing = ProcessingMultiStage.from_hooks(
+        init_hooks=[_append],
+        prepare_result_fun=lambda state: state.get_values_result_attrs(),
+    )
+    expected = processing.call_parallel(n_times=4, state=state, seed=0)
+    result = processing.call_parallel(
+        n_times=4,
+        state=state,
+        seed=0,
+        n_jobs=2,
+        batch_size=batch_size,
+        backend="threading",
+    )
+    assert all(len(attrs) == 2 for attrs in result)
+    assert result == expected
+    assert state.get_values_result_attrs() == [0]
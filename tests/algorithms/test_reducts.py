@@ -0,0 +1,551 @@
+import numpy as np
+import pytest
+
+from skrough.algorithms.bireducts import (
+    get_bireduct_daar_heuristic,
+    get_bireduct_greedy_heuristic,
+)
+from skrough.algorithms.reducts import (
+    get_approx_reduct_daar_heuristic,
+    get_approx_reduct_greedy_heuristic,
+    get_approx_reducts_greedy_heuristic_epsilon_path,
+)
+from skrough.checks import check_if_approx_reduct
+from skrough.dataprep import prepare_factorized_array, prepare_factorized_vector
+from skrough.disorder_measures import conflicts_count, entropy, gini_impurity
+from skrough.structs.decision_table import DecisionTable
+from skrough.structs.group_index import GROUP_INDEX_BY_NAME
+from tests.helpers import generate_data
+
+
+@pytest.mark.parametrize("disorder_fun", [conflicts_count, entropy, gini_impurity])
+@pytest.mark.parametrize("epsilon", [0.0, 0.1, 0.5])
+@pytest.mark.parametrize("seed", range(5))
+def test_approx_reduct_greedy_shrink_pure_groups(disorder_fun, epsilon, seed):
+    rng = np.random.default_rng(seed)
+    x = rng.integers(3, size=(60, 8))
+    y = (x[:, 0] + x[:, 1] * rng.integers(2, size=60)) % 3
+    kwargs = {
+        "x": x,
+        "y": y,
+        "disorder_fun": disorder_fun,
+        "epsilon": epsilon,
+        "candidates_count": 4,
+        "n_reducts": 3,
+        "seed": seed,
+    }
+    expected = get_approx_reduct_greedy_heuristic(**kwargs)
+    result = get_approx_reduct_greedy_heuristic(**kwargs, shrink_pure_groups=True)
+    assert result == expected
+
+    x, x_counts = prepare_factorized_array(x)
+    y, y_count = prepare_factorized_vector(y)
+    for reduct in result:
+        assert check_if_approx_reduct(
+            x, x_counts, y, y_count, reduct.attrs, disorder_fun, epsilon
+        )
+
+
+def _python_conflicts_count(distribution: np.ndarray, n_elements: int) -> float:
+    # a disorder measure which is not compiled with numba
+    group_counts = distribution.sum(axis=1)
+    return float(np.sum(group_counts**2 - np.sum(distribution**2, axis=1)) / 2)
+
+
+@pytest.mark.parametrize("group_index_class", list(GROUP_INDEX_BY_NAME))
+@pytest.mark.parametrize("epsilon", [0.0, 0.1])
+def test_approx_reduct_greedy_python_disorder_fun(group_index_class, epsilon):
+    rng = np.random.default_rng(0)
+    x = rng.integers(3, size=(60, 8))
+    y = (x[:, 0] + x[:, 1] * rng.integers(2, size=60)) % 3
+    kwargs = {
+        "x": x,
+        "y": y,
+        "epsilon": epsilon,
+        "n_reducts": 3,
+        "seed": 0,
+        "group_index_class": group_index_class,
+    }
+    expected = get_approx_reduct_greedy_heuristic(
+        **kwargs, disorder_fun=conflicts_count
+    )
+    result = get_approx_reduct_greedy_heuristic(
+        **kwargs, disorder_fun=_python_conflicts_count
+    )
+    assert result == expected
+
+
+@pytest.mark.parametrize("disorder_fun", [conflicts_count, entropy, gini_impurity])
+@pytest.mark.parametrize("epsilon", [0.0, 0.1, 0.5])
+@pytest.mark.parametrize("candidates_count", [None, 3])
+@pytest.mark.parametrize("seed", range(3))
+def test_approx_reduct_greedy_compiled_engine(
+    disorder_fun, epsilon, candidates_count, seed
+):
+    rng = np.random.default_rng(seed)
+    x = rng.integers(3, size=(80, 10))
+    y = (x[:, 0] + x[:, 1] * rng.integers(2, size=80)) % 3
+    kwargs = {
+        "x": x,
+        "y": y,
+        "disorder_fun": disorder_fun,
+        "epsilon": epsilon,
+        "candidates_count": candidates_count,
+        "n_reducts": 3,
+        "seed": seed,
+    }
+    result = get_approx_reduct_greedy_heuristic(**kwargs, engine="compiled")
+    assert len(result) == 3
+    assert get_approx_reduct_greedy_heuristic(**kwargs, engine="compiled") == result
+    x, x_counts = prepare_factorized_array(x)
+    y, y_count = prepare_factorized_vector(y)
+    for reduct in result:
+        assert check_if_approx_reduct(
+            x, x_counts, y, y_count, reduct.attrs, disorder_fun, epsilon
+        )
+
+
+def test_approx_reduct_greedy_compiled_engine_empty_data():
+    kwargs = {"disorder_fun": entropy, "epsilon": 0.1, "seed": 0}
+    x = np.empty(shape=(0, 3), dtype=np.int64)
+    y = np.empty(shape=0, dtype=np.int64)
+    expected = get_approx_reduct_greedy_heuristic(x, y, **kwargs)
+    result = get_approx_reduct_greedy_heuristic(x, y, **kwargs, engine="compiled")
+    assert result == expected
+
+
+@pytest.mark.parametrize("disorder_fun", [conflicts_count, entropy, gini_impurity])
+@pytest.mark.parametrize("shrink_pure_groups", [False, True])
+@pytest.mark.parametrize("seed", range(3))
+def test_approx_reduct_greedy_lazy(disorder_fun, shrink_pure_groups, seed):
+    rng = np.random.default_rng(seed)
+    x = rng.integers(3, size=(80, 10))
+    y = (x[:, 0] + x[:, 1] * rng.integers(2, size=80)) % 3
+    epsilon = 0.1
+    result = get_approx_reduct_greedy_heuristic(
+        x,
+        y,
+        disorder_fun=disorder_fun,
+        epsilon=epsilon,
+        n_reducts=3,
+        seed=seed,
+        shrink_pure_groups=shrink_pure_groups,
+        lazy=True,
+    )
+    x, x_counts = prepare_factorized_array(x)
+    y, y_count = prepare_factorized_vector(y)
+    for reduct in result:
+        assert check_if_approx_reduct(
+            x, x_counts, y, y_count, reduct.attrs, disorder_fun, epsilon
+        )
+
+
+def test_approx_reduct_greedy_lazy_compiled_engine():
+    with pytest.raises(ValueError, match="not supported"):
+        get_approx_reduct_greedy_heuristic(
+            [[0]], [0], disorder_fun=entropy, epsilon=0.1, engine="compiled", lazy=True
+        )
+
+
+@pytest.mark.parametrize("disorder_fun", [conflicts_count, entropy, gini_impurity])
+@pytest.mark.parametrize("group_index_class", ["numba", "csr", "dict_numba"])
+@pytest.mark.parametrize("seed", range(3))
+def test_approx_reduct_greedy_early_abort(disorder_fun, group_index_class, seed):
+    rng = np.random.default_rng(seed)
+    x = rng.integers(3, size=(80, 10))
+    y = (x[:, 0] + x[:, 1] * rng.integers(2, size=80)) % 3
+    kwargs = {
+        "x": x,
+        "y": y,
+        "disorder_fun": disorder_fun,
+        "epsilon": 0.1,
+        "candidates_count": 5,
+        "n_reducts": 3,
+        "seed": seed,
+        "group_index_class": group_index_class,
+    }
+    expected = get_approx_reduct_greedy_heuristic(**kwargs)
+    result = get_approx_reduct_greedy_heuristic(**kwargs, early_abort=True)
+    assert result == expected
+
+
+@pytest.mark.parametrize("shrink_pure_groups", [False, True])
+@pytest.mark.parametrize("seed", range(3))
+def test_approx_reduct_greedy_successive_halving(shrink_pure_groups, seed):
+    rng = np.random.default_rng(seed)
+    x = rng.integers(3, size=(400, 12))
+    y = (x[:, 0] + x[:, 1] * rng.integers(2, size=400)) % 3
+    kwargs = {
+        "x": x,
+        "y": y,
+        "disorder_fun": gini_impurity,
+        "epsilon": 0.1,
+        "n_reducts": 3,
+        "seed": seed,
+        "shrink_pure_groups": shrink_pure_groups,
+    }
+    result = get_approx_reduct_greedy_heuristic(
+        **kwargs, successive_halving_sample_size=25
+    )
+    x, x_counts = prepare_factorized_array(x)
+    y, y_count = prepare_factorized_vector(y)
+    for reduct in result:
+        assert check_if_approx_reduct(
+            x, x_counts, y, y_count, reduct.attrs, gini_impurity, 0.1
+        )
+
+    # samples never smaller than the data set reduce to the default selection
+    expected = get_approx_reduct_greedy_heuristic(**kwargs)
+    result = get_approx_reduct_greedy_heuristic(
+        **kwargs, successive_halving_sample_size=400
+    )
+    assert result == expected
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_approx_reduct_daar_successive_halving(seed):
+    rng = np.random.default_rng(seed)
+    x = rng.integers(3, size=(200, 8))
+    y = (x[:, 0] + x[:, 1] * rng.integers(2, size=200)) % 3
+    kwargs = {
+        "x": x,
+        "y": y,
+        "disorder_fun": gini_impurity,
+        "candidates_count": 4,
+        "probes_count": 20,
+        "n_reducts": 2,
+        "seed": seed,
+    }
+    result = get_approx_reduct_daar_heuristic(
+        **kwargs, successive_halving_sample_size=25
+    )
+    assert len(result) == 2
+
+    expected = get_approx_reduct_daar_heuristic(**kwargs)
+    result = get_approx_reduct_daar_heuristic(
+        **kwargs, successive_halving_sample_size=200
+    )
+    assert result == expected
+
+
+@pytest.mark.parametrize("group_index_class", list(GROUP_INDEX_BY_NAME))
+def test_approx_reduct_daar_group_index_class(group_index_class):
+    rng = np.random.default_rng(0)
+    x = rng.integers(3, size=(60, 4))
+    y = (x[:, 0] + (x[:, 1] > 0)) % 3
+    kwargs = {
+        "x": x,
+        "y": y,
+        "disorder_fun": gini_impurity,
+        "n_reducts": 2,
+        "seed": 0,
+    }
+    expected = get_approx_reduct_daar_heuristic(**kwargs)
+    result = get_approx_reduct_daar_heuristic(
+        **kwargs, group_index_class=group_index_class
+    )
+    assert result == expected
+
+
+@pytest.mark.parametrize("disorder_fun", [conflicts_count, entropy])
+@pytest.mark.parametrize("shrink_pure_groups", [False, True])
+@pytest.mark.parametrize("candidates_count", [None, 3])
+def test_approx_reducts_greedy_epsilon_path(
+    disorder_fun, shrink_pure_groups, candidates_count
+):
+    rng = np.random.default_rng(0)
+    x = rng.integers(3, size=(200, 10))
+    y = (x[:, 0] + x[:, 1] * rng.integers(2, size=200)) % 3
+    kwargs = {
+        "x": x,
+        "y": y,
+        "disorder_fun": disorder_fun,
+        "candidates_count": candidates_count,
+        "n_reducts": 3,
+        "seed": 0,
+        "shrink_pure_groups": shrink_pure_groups,
+    }
+    epsilons = [0.2, 0.0, 0.5, 0.05, 1.0]
+    result = get_approx_reducts_greedy_heuristic_epsilon_path(
+        **kwargs, epsilons=epsilons
+    )
+    assert len(result) == 3
+    for i, epsilon in enumerate(epsilons):
+        expected = get_approx_reduct_greedy_heuristic(**kwargs, epsilon=epsilon)
+        assert [reducts[i] for reducts in result] == expected
+
+
+def test_approx_reducts_greedy_epsilon_path_no_epsilons():
+    with pytest.raises(ValueError, match="At least one epsilon"):
+        get_approx_reducts_greedy_heuristic_epsilon_path(
+            np.asarray([[0]]), np.asarray([0]), disorder_fun=entropy, epsilons=[]
+        )
+
+
+@pytest.mark.parametrize(
+    "fun, kwargs",
+    [
+        (get_approx_reduct_greedy_heuristic, {"epsilon": 0.1}),
+        (get_approx_reduct_greedy_heuristic, {"epsilon": 0.1, "engine": "compiled"}),
+        (get_approx_reducts_greedy_heuristic_epsilon_path, {"epsilons": [0.0, 0.1]}),
+        (get_approx_reduct_daar_heuristic, {"probes_count": 20}),
+        (get_bireduct_greedy_heuristic, {"epsilon": 0.1}),
+        (get_bireduct_daar_heuristic, {"epsilon": 0.1, "probes_count": 20}),
+    ],
+)
+def test_decision_table(fun, kwargs):
+    rng = np.random.default_rng(0)
+    x = rng.integers(3, size=(100, 6))
+    y = (x[:, 0] + x[:, 1] * rng.integers(2, size=100)) % 3
+    kwargs = {"disorder_fun": entropy, "seed": 0, **kwargs}
+    expected = fun(x, y, **kwargs)
+    table = DecisionTable.from_data(x, y)
+    assert fun(table, None, **kwargs) == expected
+    # the cached disorder score stats are reused by consecutive calls
+    assert fun(table, None, **kwargs) == expected
+
+
+@pytest.mark.parametrize("partition_cache_max_bytes", [0, 10**6])
+@pytest.mark.parametrize(
+    "fun, kwargs",
+    [
+        (get_approx_reduct_greedy_heuristic, {"epsilon": 0.1}),
+        (get_approx_reducts_greedy_heuristic_epsilon_path, {"epsilons": [0.0, 0.1]}),
+        (get_approx_reduct_daar_heuristic, {"probes_count": 20}),
+        (get_bireduct_greedy_heuristic, {"epsilon": 0.1}),
+        (get_bireduct_daar_heuristic, {"epsilon": 0.1, "probes_count": 20}),
+    ],
+)
+def test_partition_cache(fun, kwargs, partition_cache_max_bytes):
+    rng = np.random.default_rng(0)
+    x = rng.integers(3, size=(100, 6))
+    y = (x[:, 0] + x[:, 1] * rng.integers(2, size=100)) % 3
+    kwargs = {"disorder_fun": entropy, "seed": 0, "n_reducts": 3, **kwargs}
+    if fun in (get_bireduct_greedy_heuristic, get_bireduct_daar_heuristic):
+        kwargs["n_bireducts"] = kwargs.pop("n_reducts")
+    expected = fun(x, y, **kwargs)
+    result = fun(x, y, partition_cache_max_bytes=partition_cache_max_bytes, **kwargs)
+    assert result == expected
+
+
+def _get_data_with_duplicates(seed):
+    rng = np.random.default_rng(seed)
+    x = rng.integers(2, size=(200, 5))
+    y = (x[:, 0] + x[:, 1] * rng.integers(2, size=200)) % 3
+    return x, y
+
+
+@pytest.mark.parametrize("shrink_pure_groups", [False, True])
+@pytest.mark.parametrize("seed", range(3))
+def test_approx_reduct_greedy_deduplicate(shrink_pure_groups, seed):
+    x, y = _get_data_with_duplicates(seed)
+    kwargs = {
+        "disorder_fun": conflicts_count,
+        "epsilon": 0.1,
+        "n_reducts": 3,
+        "seed": seed,
+        "shrink_pure_groups": shrink_pure_groups,
+    }
+    # weighted scores of unique rows equal the scores of the rows with duplicates
+    expected = get_approx_reduct_greedy_heuristic(x, y, **kwargs)
+    result = get_approx_reduct_greedy_heuristic(x, y, deduplicate=True, **kwargs)
+    assert result == expected
+    kwargs["epsilons"] = [0.0, kwargs.pop("epsilon")]
+    expected = get_approx_reducts_greedy_heuristic_epsilon_path(x, y, **kwargs)
+    result = get_approx_reducts_greedy_heuristic_epsilon_path(
+        x, y, deduplicate=True, **kwargs
+    )
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    "fun, kwargs",
+    [
+        (get_bireduct_greedy_heuristic, {"epsilon": 0.1}),
+        (get_bireduct_daar_heuristic, {"epsilon": 0.1, "probes_count": 20}),
+    ],
+)
+def test_bireduct_deduplicate(fun, kwargs):
+    x, y = _get_data_with_duplicates(0)
+    table = DecisionTable.from_data(x, y, deduplicate=True)
+    assert table.objs_inverse is not None
+    kwargs = {"disorder_fun": entropy, "n_bireducts": 3, "seed": 0, **kwargs}
+    result = fun(x, y, deduplicate=True, **kwargs)
+    assert result == fun(table, None, **kwargs)
+    for bireduct in result:
+        objs = np.asarray(bireduct.objs, dtype=np.int64)
+        assert np.all((objs >= 0) & (objs < len(y)))
+        assert len(np.unique(objs)) == len(objs)
+        # duplicated rows are taken together
+        chosen = np.isin(table.objs_inverse, table.objs_inverse[objs])
+        assert np.array_equal(np.flatnonzero(chosen), np.sort(objs))
+
+
+def test_approx_reduct_daar_deduplicate():
+    x, y = _get_data_with_duplicates(0)
+    result = get_approx_reduct_daar_heuristic(
+        x,
+        y,
+        disorder_fun=entropy,
+        probes_count=20,
+        n_reducts=3,
+        seed=0,
+        deduplicate=True,
+    )
+    assert len(result) == 3
+    for reduct in result:
+        assert set(reduct.attrs) <= set(range(x.shape[1]))
+
+
+@pytest.mark.parametrize(
+    "fun, kwargs",
+    [
+        (get_approx_reduct_greedy_heuristic, {"epsilon": 0.1, "engine": "compiled"}),
+        (get_approx_reduct_greedy_heuristic, {"epsilon": 0.1, "lazy": True}),
+        (get_approx_reduct_greedy_heuristic, {"epsilon": 0.1, "early_abort": True}),
+        (
+            get_approx_reduct_greedy_heuristic,
+            {"epsilon": 0.1, "successive_halving_sample_size": 10},
+        ),
+        (get_approx_reduct_daar_heuristic, {"successive_halving_sample_size": 10}),
+    ],
+)
+def test_deduplicate_unsupported(fun, kwargs):
+    with pytest.raises(ValueError, match="Weighted objects"):
+        fun(
+            np.array([[0], [0]]),
+            np.array([0, 0]),
+            disorder_fun=entropy,
+            deduplicate=True,
+            **kwargs,
+        )
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"engine": "compiled", "successive_halving_sample_size": 10},
+        {"lazy": True, "successive_halving_sample_size": 10},
+        {"early_abort": True, "successive_halving_sample_size": 10},
+    ],
+)
+def test_approx_reduct_greedy_successive_halving_unsupported(kwargs):
+    with pytest.raises(ValueError, match="Successive halving"):
+        get_approx_reduct_greedy_heuristic(
+            [[0]], [0], disorder_fun=entropy, epsilon=0.1, **kwargs
+        )
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"engine": "compiled", "early_abort": True},
+        {"lazy": True, "early_abort": True},
+    ],
+)
+def test_approx_reduct_greedy_early_abort_unsupported(kwargs):
+    with pytest.raises(ValueError, match="Early abort"):
+        get_approx_reduct_greedy_heuristic(
+            [[0]], [0], disorder_fun=entropy, epsilon=0.1, **kwargs
+        )
+
+
+def test_approx_reduct_greedy_unknown_engine():
+    with pytest.raises(ValueError, match="Unknown engine"):
+        get_approx_reduct_greedy_heuristic(
+            [[0]], [0], disorder_fun=entropy, epsilon=0.1, engine="unknown"
+        )
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_bireduct_greedy_shrink_pure_groups(seed):
+    # fixed data, as ties between candidates of random data may be broken
+    # differently when scores are computed over the shrunk objects
+    rng = np.random.default_rng(0)
+    x = rng.integers(3, size=(40, 6))
+    y = rng.integers(2, size=40)
+    kwargs = {
+        "x": x,
+        "y": y,
+        "disorder_fun": entropy,
+        "epsilon": 0.2,
+        "n_bireducts": 3,
+        "seed": seed,
+    }
+    expected = get_bireduct_greedy_heuristic(**kwargs)
+    result = get_bireduct_greedy_heuristic(**kwargs, shrink_pure_groups=True)
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    "fun, kwargs",
+    [
+        (get_approx_reduct_greedy_heuristic, {"epsilon": 0.1, "n_reducts": 4}),
+        (get_bireduct_greedy_heuristic, {"epsilon": 0.1, "n_bireducts": 4}),
+    ],
+)
+def test_call_parallel_runs_are_independent(fun, kwargs):
+    x = generate_data(size=(40, 6), values_max=3)
+    y = generate_data(size=40, values_max=2)
+    sequential = fun(x, y, disorder_fun=entropy, seed=7, **kwargs)
+    parallel = fun(x, y, disorder_fun=entropy, seed=7, n_jobs=2, **kwargs)
+    assert sequential == parallel
+    threading = fun(
+        x, y, disorder_fun=entropy, seed=7, n_jobs=2, backend="threading", **kwargs
+    )
+    assert sequential == threading
+
+
+@pytest.mark.parametrize("batch_size", [2, "auto"])
+def test_approx_reduct_greedy_batch_size(batch_size):
+    x = generate_data(size=(40, 6), values_max=3)
+    y = generate_data(size=40, values_max=2)
+    kwargs = {"disorder_fun": entropy, "epsilon": 0.1, "n_reducts": 5, "seed": 3}
+    expected = get_approx_reduct_greedy_heuristic(x, y, **kwargs)
+    result = get_approx_reduct_greedy_heuristic(
+        x, y, n_jobs=2, batch_size=batch_size, **kwargs
+    )
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    "fun, kwargs",
+    [
+        (get_approx_reduct_daar_heuristic, {"n_reducts": 3}),
+        (get_bireduct_daar_heuristic, {"epsilon": 0.1, "n_bireducts": 3}),
+    ],
+)
+def test_daar_permutations_bank(fun, kwargs):
+    x = generate_data(size=(40, 6), values_max=3)
+    y = generate_data(size=40, values_max=2)
+    result = fun(x, y, disorder_fun=entropy, seed=5, permutations_bank_size=8, **kwargs)
+    assert len(result) == 3
+    assert result == fun(
+        x, y, disorder_fun=entropy, seed=5, permutations_bank_size=8, **kwargs
+    )
+
+
+@pytest.mark.parametrize(
+    "fun, kwargs",
+    [
+        (get_approx_reduct_daar_heuristic, {"n_reducts": 2}),
+        (
+            get_bireduct_daar_heuristic,
+            {"epsilon": 0.1, "n_bireducts": 2, "selected_count": 4},
+        ),
+    ],
+)
+def test_daar_speculative_count(fun, kwargs):
+    x = generate_data(size=(40, 8), values_max=3)
+    y = generate_data(size=40, values_max=2)
+    expected = fun(x, y, disorder_fun=entropy, seed=11, speculative_count=1, **kwargs)
+    for speculative_count in [3, 4]:
+        result = fun(
+            x,
+            y,
+            disorder_fun=entropy,
+            seed=11,
+            speculative_count=speculative_count,
+            **kwargs,
+        )
+        assert result == expected
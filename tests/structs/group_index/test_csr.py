@@ -0,0 +1,107 @@
+import numpy as np
+import pytest
+
+from skrough.dataprep import prepare_factorized_vector
+from skrough.disorder_measures import conflicts_count
+from skrough.structs.group_index import GroupIndex, GroupIndexCSR
+from skrough.structs.group_index._csr import _get_disorder_score_after_split
+from tests.structs.group_index.helpers import _assert_group_index
+
+
+def _assert_layout(group_index: GroupIndexCSR):
+    perm, offsets = group_index._get_layout()  # pylint: disable=protected-access
+    assert len(offsets) == group_index.n_groups + 1
+    assert offsets[0] == 0
+    assert offsets[-1] == group_index.n_objs
+    assert np.array_equal(np.sort(perm), np.arange(group_index.n_objs))
+    for group in range(group_index.n_groups):
+        members = perm[offsets[group] : offsets[group + 1]]
+        assert np.all(group_index.index[members] == group)
+        # objects keep their relative order within groups
+        assert np.all(np.diff(members) > 0)
+
+
+@pytest.mark.parametrize(
+    "input_index, values, expected_index, expected_n_groups",
+    [
+        ([], [], [], 0),
+        ([0, 0, 0, 0], [0, 0, 0, 42], [0, 0, 0, 1], 2),
+        ([0, 1, 1, 1], [0, 1, 0, 1], [0, 1, 2, 1], 3),
+        ([0, 1, 0, 1], [0, 0, 1, 1], [0, 2, 1, 3], 4),
+        ([5, 4, 3, 2, 1, 0], [0, 1, 0, 1, 0, 1], [5, 4, 3, 2, 1, 0], 6),
+        ([0, 2, 0, 3], [0, 1, 2, 3], [0, 2, 1, 3], 4),
+        ([1, 1, 0, 0], [1, 0, 1, 0], [2, 3, 0, 1], 4),
+    ],
+)
+@pytest.mark.parametrize("compress", [False, True])
+def test_split(input_index, values, expected_index, expected_n_groups, compress):
+    group_index = GroupIndexCSR.from_index(input_index)
+    values, values_count = prepare_factorized_vector(np.asarray(values))
+    result = group_index.split(values, values_count, compress=compress)
+    _assert_group_index(result, expected_index, expected_n_groups)
+    _assert_layout(result)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_split_chain_matches_default(seed):
+    rng = np.random.default_rng(seed)
+    x = rng.integers(0, 3, size=(100, 5))
+    result = GroupIndexCSR.create_uniform(len(x))
+    expected = GroupIndex.create_uniform(len(x))
+    for attr in range(x.shape[1]):
+        result = result.split(x[:, attr], 3)
+        expected = expected.split(x[:, attr], 3, compress=True)
+        _assert_layout(result)
+        assert result.n_groups == expected.n_groups
+        # same partition, possibly with different group labels
+        pairs = np.unique(np.stack([result.index, expected.index]), axis=1)
+        assert pairs.shape[1] == expected.n_groups
+
+
+@pytest.mark.parametrize(
+    "index",
+    [
+        [],
+        [0, 0, 0],
+        [2, 0, 2, 5],
+        [3, 2, 1, 0],
+    ],
+)
+def test_layout_from_index(index):
+    _assert_layout(GroupIndexCSR.from_index(index))
+    _assert_layout(GroupIndexCSR.from_index(index, compress=True))
+
+
+@pytest.mark.parametrize(
+    "abort_above, expected_score, expected_scanned",
+    [
+        (np.inf, 8, 12),
+        (8.0, 8, 12),
+        (4.0, 8, 8),
+        (3.0, 4, 4),
+        (0.0, 4, 4),
+    ],
+)
+def test_disorder_score_after_split_abort_above(
+    abort_above,
+    expected_score,
+    expected_scanned,
+):
+    # three groups of four objects, the split does not break the first two of
+    # them, which contribute 4 conflicts each, while the last one becomes homogeneous
+    group_index = GroupIndexCSR.from_index([0] * 4 + [1] * 4 + [2] * 4)
+    split_values = np.array([0] * 8 + [0, 0, 1, 1], dtype=np.int64)
+    values = np.array([0, 0, 1, 1] * 3, dtype=np.int64)
+    perm, offsets = group_index._get_layout()  # pylint: disable=protected-access
+    score, scanned = _get_disorder_score_after_split(
+        perm,
+        offsets,
+        split_values,
+        2,
+        values,
+        2,
+        conflicts_count,
+        abort_above,
+    )
+    assert score == pytest.approx(expected_score)
+    assert scanned == expected_scanned
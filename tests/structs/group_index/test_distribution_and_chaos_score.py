@@ -4,7 +4,12 @@ import pytest
 from skrough.dataprep import prepare_factorized_array, prepare_factorized_vector
 from skrough.disorder_measures import conflicts_count, entropy, gini_impurity
 from skrough.disorder_score import get_disorder_score_for_data
-from skrough.structs.group_index import GroupIndex
+from skrough.structs.group_index import (
+    GROUP_INDEX_BY_NAME,
+    GroupIndex,
+    GroupIndexNumba,
+    GroupIndexPure,
+)
 from tests.helpers import generate_data
 
 
@@ -169,3 +174,80 @@ def test_get_disorder_score_after_split(data):
         )
 
         assert result_disorder_score == expected_disorder_score
+
+
+@pytest.mark.parametrize("gi_class", [GroupIndexNumba, GroupIndexPure])
+@pytest.mark.parametrize("disorder_measure", [conflicts_count, entropy, gini_impurity])
+@pytest.mark.parametrize(
+    "input_index, split_values, split_values_count, values",
+    [
+        ([], [], 3, []),
+        ([0, 0, 0, 0], [0, 1, 0, 1], 2, [0, 1, 1, 1]),
+        ([0, 1, 1, 0, 1], [1, 0, 1, 1, 1], 2, [0, 0, 1, 1, 0]),
+        # sparse key space, far larger than the number of objects
+        ([0, 1000, 5, 1000], [3, 7, 7, 7], 10, [0, 1, 1, 0]),
+        ([999_999, 0, 999_999, 0, 5], [0, 0, 0, 0, 1], 1000, [1, 0, 0, 1, 1]),
+    ],
+)
+def test_get_disorder_score_after_split_fused(
+    gi_class,
+    disorder_measure,
+    input_index,
+    split_values,
+    split_values_count,
+    values,
+):
+    group_index = gi_class.from_index(input_index)
+    split_values = np.asarray(split_values, dtype=np.int64)
+    values = np.asarray(values, dtype=np.int64)
+    values_count = 2
+
+    result = group_index.get_disorder_score_after_split(
+        split_values=split_values,
+        split_values_count=split_values_count,
+        values=values,
+        values_count=values_count,
+        disorder_fun=disorder_measure,
+    )
+
+    expected = group_index.split(
+        split_values, split_values_count, compress=True
+    ).get_disorder_score(values, values_count, disorder_measure)
+    assert result == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("gi_class", list(GROUP_INDEX_BY_NAME.values()))
+@pytest.mark.parametrize("disorder_measure", [conflicts_count, entropy, gini_impurity])
+@pytest.mark.parametrize(
+    "data",
+    [
+        np.zeros(shape=(4, 3), dtype=np.int64),
+        np.eye(5, dtype=np.int64),
+        generate_data(size=(20, 4), values_max=3),
+    ],
+)
+def test_get_distribution_and_disorder_score_weighted(gi_class, disorder_measure, data):
+    x, x_counts = prepare_factorized_array(data[:, :-1])
+    y, y_count = prepare_factorized_vector(data[:, -1])
+    weights = np.arange(len(y), dtype=np.int64) % 3 + 1
+    group_index = gi_class.from_data(x, x_counts)
+    # weighted objects count as their repeated copies
+    repeated = np.repeat(np.arange(len(y)), weights)
+    expected_group_index = gi_class.from_data(x[repeated], x_counts)
+    result_distribution = group_index.get_distribution(y, y_count, weights=weights)
+    expected_distribution = expected_group_index.get_distribution(y[repeated], y_count)
+    # the groups may be numbered differently, empty ones are skipped
+    assert sorted(map(tuple, result_distribution[result_distribution.any(axis=1)])) == (
+        sorted(map(tuple, expected_distribution[expected_distribution.any(axis=1)]))
+    )
+    result_disorder_score = group_index.get_disorder_score(
+        y, y_count, disorder_measure, weights=weights
+    )
+    expected_disorder_score = expected_group_index.get_disorder_score(
+        y[repeated], y_count, disorder_measure
+    )
+    assert np.isclose(result_disorder_score, expected_disorder_score)
+    with pytest.raises(ValueError, match="length does not match the group index"):
+        group_index.get_distribution(y, y_count, weights=weights[:-1])
+    with pytest.raises(ValueError, match="should be integers"):
+        group_index.get_distribution(y, y_count, weights=weights + 0.5)
@@ -148,3 +148,138 @@ def test_split_chain_consistency(n_objs):
         ref = scores.pop("reference")
         for name, score in scores.items():
             assert score == ref, f"{name} score {score} != reference {ref}"
+
+
+@pytest.mark.parametrize("gi_class", ALL_IMPLEMENTATIONS)
+@pytest.mark.parametrize("disorder_measure", [conflicts_count, entropy, gini_impurity])
+@pytest.mark.parametrize("data", DATASETS)
+@pytest.mark.parametrize("abort_above_factor", [0.0, 0.5, 1.0, 2.0])
+def test_get_disorder_score_after_split_abort_above(
+    gi_class,
+    disorder_measure,
+    data,
+    abort_above_factor,
+):
+    data = np.asarray(data)
+    x, x_counts = prepare_factorized_array(data[:, 0:-2])
+    split_values, split_values_count = prepare_factorized_vector(data[:, -2])
+    y, y_count = prepare_factorized_vector(data[:, -1])
+
+    group_index = gi_class.from_data(x, x_counts)
+    kwargs = {
+        "split_values": split_values,
+        "split_values_count": split_values_count,
+        "values": y,
+        "values_count": y_count,
+        "disorder_fun": disorder_measure,
+    }
+    exact = group_index.get_disorder_score_after_split(**kwargs)
+    abort_above = exact * abort_above_factor
+    score = group_index.get_disorder_score_after_split(
+        **kwargs, abort_above=abort_above
+    )
+    if exact <= abort_above:
+        assert score == exact
+    else:
+        assert abort_above < score <= exact
+
+
+@pytest.mark.parametrize("gi_class", ALL_IMPLEMENTATIONS)
+@pytest.mark.parametrize("disorder_measure", [conflicts_count, entropy, gini_impurity])
+@pytest.mark.parametrize("data", DATASETS)
+@pytest.mark.parametrize("start_attrs", [[], [0]])
+def test_get_disorder_scores_after_splits_consistency(
+    gi_class,
+    disorder_measure,
+    data,
+    start_attrs,
+):
+    data = np.asarray(data)
+    x, x_counts = prepare_factorized_array(data[:, 0:-1])
+    y, y_count = prepare_factorized_vector(data[:, -1])
+    attrs = list(reversed(range(x.shape[1])))
+
+    group_index = gi_class.from_data(x, x_counts, attrs=start_attrs)
+    scores = group_index.get_disorder_scores_after_splits(
+        x=x,
+        x_counts=x_counts,
+        attrs=attrs,
+        values=y,
+        values_count=y_count,
+        disorder_fun=disorder_measure,
+    )
+    reference = GroupIndex.from_data(x, x_counts, attrs=start_attrs)
+    expected = [
+        reference.get_disorder_score_after_split(
+            split_values=x[:, attr],
+            split_values_count=x_counts[attr],
+            values=y,
+            values_count=y_count,
+            disorder_fun=disorder_measure,
+        )
+        for attr in attrs
+    ]
+    assert scores.dtype == np.float64
+    assert np.allclose(scores, expected)
+
+
+@pytest.mark.parametrize("gi_class", ALL_IMPLEMENTATIONS)
+@pytest.mark.parametrize("disorder_measure", [conflicts_count, entropy, gini_impurity])
+@pytest.mark.parametrize("data", DATASETS)
+@pytest.mark.parametrize("start_attrs", [[], [0]])
+def test_get_disorder_scores_after_splits_weighted_consistency(
+    gi_class,
+    disorder_measure,
+    data,
+    start_attrs,
+):
+    data = np.asarray(data)
+    x, x_counts = prepare_factorized_array(data[:, 0:-1])
+    y, y_count = prepare_factorized_vector(data[:, -1])
+    weights = np.arange(len(y), dtype=np.int64) % 3 + 1
+    attrs = list(reversed(range(x.shape[1])))
+
+    group_index = gi_class.from_data(x, x_counts, attrs=start_attrs)
+    scores = group_index.get_disorder_scores_after_splits(
+        x=x,
+        x_counts=x_counts,
+        attrs=attrs,
+        values=y,
+        values_count=y_count,
+        disorder_fun=disorder_measure,
+        weights=weights,
+    )
+    # weighted objects count as their repeated copies
+    repeated = np.repeat(np.arange(len(y)), weights)
+    reference = GroupIndex.from_data(x[repeated], x_counts, attrs=start_attrs)
+    expected = [
+        reference.get_disorder_score_after_split(
+            split_values=x[repeated, attr],
+            split_values_count=x_counts[attr],
+            values=y[repeated],
+            values_count=y_count,
+            disorder_fun=disorder_measure,
+        )
+        for attr in attrs
+    ]
+    assert scores.dtype == np.float64
+    assert np.allclose(scores, expected)
+
+
+@pytest.mark.parametrize("gi_class", ALL_IMPLEMENTATIONS)
+def test_get_disorder_scores_after_splits_empty(gi_class):
+    x, x_counts = prepare_factorized_array(generate_data(size=(5, 3)))
+    y, y_count = prepare_factorized_vector(np.asarray([0, 1, 1, 0, 1]))
+    group_index = gi_class.from_data(x, x_counts, attrs=[0])
+    scores = group_index.get_disorder_scores_after_splits(
+        x, x_counts, [], y, y_count, entropy
+    )
+    assert len(scores) == 0
+
+    x, x_counts = prepare_factorized_array(np.zeros(shape=(0, 3), dtype=np.int64))
+    y, y_count = prepare_factorized_vector(np.zeros(shape=0, dtype=np.int64))
+    group_index = gi_class.create_empty()
+    scores = group_index.get_disorder_scores_after_splits(
+        x, x_counts, [0, 2], y, y_count, entropy
+    )
+    assert np.array_equal(scores, [0.0, 0.0])
@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from skrough.dataprep import prepare_factorized_array, prepare_factorized_vector
+from skrough.disorder_measures import conflicts_count, entropy, gini_impurity
+from skrough.structs.group_index import GROUP_INDEX_BY_NAME
+from tests.helpers import generate_data
+
+ALL_IMPLEMENTATIONS = list(GROUP_INDEX_BY_NAME.values())
+
+
+@pytest.mark.parametrize("gi_class", ALL_IMPLEMENTATIONS)
+@pytest.mark.parametrize("disorder_fun", [conflicts_count, entropy, gini_impurity])
+@pytest.mark.parametrize("compress", [False, True])
+@pytest.mark.parametrize(
+    "data",
+    [
+        np.zeros(shape=(4, 3), dtype=np.int64),
+        np.eye(5, dtype=np.int64),
+        generate_data(size=(20, 6), values_max=3),
+        generate_data(size=(100, 8), values_max=4),
+    ],
+)
+def test_track_disorder_across_splits(gi_class, disorder_fun, compress, data):
+    x, x_counts = prepare_factorized_array(data[:, :-1])
+    y, y_count = prepare_factorized_vector(data[:, -1])
+    group_index = gi_class.create_uniform(len(x))
+    group_index.track_disorder(y, y_count, disorder_fun)
+    for attr in range(x.shape[1]):
+        group_index = group_index.split(x[:, attr], x_counts[attr], compress=compress)
+        expected = group_index.get_disorder_score(y, y_count, disorder_fun)
+        tracked = group_index.get_tracked_disorder_score(y, y_count, disorder_fun)
+        assert np.isclose(tracked, expected)
+        tracker = group_index._disorder_tracker  # pylint: disable=protected-access
+        assert tracker is not None
+        assert len(tracker.contributions) == len(np.unique(tracker.group_ids))
+        assert tracker.n_impure == np.count_nonzero(tracker.contributions)
+        if expected == 0:
+            assert tracked == 0
+
+
+@pytest.mark.parametrize("gi_class", ALL_IMPLEMENTATIONS)
+def test_track_disorder_empty(gi_class):
+    y = np.empty(shape=0, dtype=np.int64)
+    group_index = gi_class.create_empty()
+    group_index.track_disorder(y, 1, entropy)
+    group_index = group_index.split(y, 1)
+    assert group_index.get_tracked_disorder_score(y, 1, entropy) == 0
+
+
+@pytest.mark.parametrize("gi_class", ALL_IMPLEMENTATIONS)
+def test_get_tracked_disorder_score_fallback(gi_class):
+    y = np.asarray([0, 1, 0, 1])
+    x = np.asarray([0, 0, 1, 1])
+    group_index = gi_class.create_uniform(len(y))
+    assert group_index.get_tracked_disorder_score(y, 2, conflicts_count) == 4
+
+    group_index.track_disorder(y, 2, conflicts_count)
+    group_index = group_index.split(x, 2)
+    assert group_index.get_tracked_disorder_score(y, 2, conflicts_count) == 2
+    # other values, values count or disorder function - computed from scratch
+    other_y = np.asarray([0, 0, 1, 1])
+    assert group_index.get_tracked_disorder_score(other_y, 2, conflicts_count) == 0
+    assert group_index.get_tracked_disorder_score(y.copy(), 2, conflicts_count) == 2
+    assert group_index.get_tracked_disorder_score(y, 2, gini_impurity) == 0.5
+    # group indices created from scratch do not track
+    assert group_index.compress()._disorder_tracker is None  # pylint: disable=W0212
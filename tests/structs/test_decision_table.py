@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+
+from skrough.dataprep import prepare_factorized_array, prepare_factorized_vector
+from skrough.disorder_measures import entropy, gini_impurity
+from skrough.disorder_score import get_disorder_score_stats
+from skrough.structs.decision_table import DecisionTable
+from skrough.structs.group_index import GroupIndexCSR
+from tests.helpers import generate_data
+
+
+@pytest.mark.parametrize(
+    "x, y",
+    [
+        (generate_data(size=(0, 0)), generate_data(size=0)),
+        (generate_data(size=(5, 0)), generate_data(size=5)),
+        (np.asarray([[5, 3], [9, 3], [5, 2]]), np.asarray(["b", "a", "b"])),
+        (generate_data(size=(20, 4)), generate_data(size=20)),
+    ],
+)
+def test_decision_table_from_data(x, y):
+    table = DecisionTable.from_data(x, y)
+    expected_x, expected_x_counts = prepare_factorized_array(x)
+    expected_y, expected_y_count = prepare_factorized_vector(y)
+    assert np.array_equal(table.x, expected_x)
+    assert np.array_equal(table.x_counts, expected_x_counts)
+    assert np.array_equal(table.y, expected_y)
+    assert table.y_count == expected_y_count
+    for i, uniques in enumerate(table.x_uniques):
+        assert np.array_equal(uniques[table.x[:, i]], x[:, i])
+    assert np.array_equal(table.y_uniques[table.y], y)
+
+
+def test_decision_table_from_data_like():
+    x = generate_data(size=(5, 3))
+    y = generate_data(size=5)
+    table = DecisionTable.from_data_like(x, y)
+    assert DecisionTable.from_data_like(table) is table
+    with pytest.raises(ValueError, match="cannot be given with decision table"):
+        DecisionTable.from_data_like(table, y)
+    with pytest.raises(ValueError, match="should be given"):
+        DecisionTable.from_data_like(x)
+    with pytest.raises(ValueError, match="should be deduplicated"):
+        DecisionTable.from_data_like(table, deduplicate=True)
+    deduplicated_table = DecisionTable.from_data_like(x, y, deduplicate=True)
+    assert (
+        DecisionTable.from_data_like(deduplicated_table, deduplicate=True)
+        is deduplicated_table
+    )
+
+
+@pytest.mark.parametrize("disorder_fun", [entropy, gini_impurity])
+@pytest.mark.parametrize("group_index_class", [None, GroupIndexCSR])
+def test_decision_table_get_disorder_score_stats(disorder_fun, group_index_class):
+    table = DecisionTable.from_data(generate_data(size=(20, 4)), generate_data(size=20))
+    result = table.get_disorder_score_stats(disorder_fun, group_index_class)
+    expected = get_disorder_score_stats(
+        table.x,
+        table.x_counts,
+        table.y,
+        table.y_count,
+        disorder_fun=disorder_fun,
+        group_index_class=group_index_class,
+    )
+    assert result == expected
+    # the stats are cached
+    assert table.get_disorder_score_stats(disorder_fun, group_index_class) is result
+
+
+def test_decision_table_deduplicate():
+    x = np.asarray([[5, 3], [9, 3], [5, 3], [5, 2], [5, 3]])
+    y = np.asarray(["b", "a", "b", "b", "a"])
+    table = DecisionTable.from_data_like(x, y, deduplicate=True)
+    assert table.weights is not None
+    assert table.objs_inverse is not None
+    assert len(table.x) == 4
+    assert np.array_equal(table.weights, [2, 1, 1, 1])
+    assert np.array_equal(table.objs_inverse, [0, 1, 0, 2, 3])
+    assert table.get_original_objs([0, 3]) == [0, 2, 4]
+    assert table.get_original_objs([]) == []
+    # the weighted stats equal the ones of the table with duplicates
+    disorder_fun = entropy
+    expected = DecisionTable.from_data(x, y).get_disorder_score_stats(disorder_fun)
+    result = table.get_disorder_score_stats(disorder_fun)
+    assert np.isclose(result.base, expected.base)
+    assert np.isclose(result.total, expected.total)
+    # a table with no duplicates maps objects to themselves
+    table = DecisionTable.from_data(x, y)
+    assert table.weights is None
+    assert table.get_original_objs([1, 3]) == [1, 3]
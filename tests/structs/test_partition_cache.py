@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+from skrough.structs.group_index import GroupIndex, GroupIndexCSR
+from skrough.structs.partition_cache import PartitionCache, get_objs_fingerprint
+from tests.helpers import generate_data
+
+
+def _prepare_data():
+    x = generate_data(size=(20, 4))
+    x_counts = np.max(x, axis=0) + 1
+    return x, x_counts
+
+
+@pytest.mark.parametrize("group_index_class", [GroupIndex, GroupIndexCSR])
+def test_partition_cache_hits_and_misses(group_index_class):
+    x, x_counts = _prepare_data()
+    cache = PartitionCache(max_bytes=10**6)
+    result = cache.get_group_index(group_index_class, x, x_counts, [0, 2])
+    expected = group_index_class.from_data(x, x_counts, [0, 2])
+    assert np.array_equal(result.index, expected.index)
+    assert (cache.stats.hits, cache.stats.misses) == (0, 1)
+    # the order of attributes is irrelevant
+    assert cache.get_group_index(group_index_class, x, x_counts, [2, 0]) is result
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+    cache.get_group_index(group_index_class, x, x_counts, [1])
+    assert (cache.stats.hits, cache.stats.misses) == (1, 2)
+    assert len(cache) == 2
+
+
+def test_partition_cache_objs_fingerprint():
+    x, x_counts = _prepare_data()
+    objs = [1, 3, 5, 7]
+    cache = PartitionCache(max_bytes=10**6)
+    result_all = cache.get_group_index(GroupIndex, x, x_counts, [0])
+    result_objs = cache.get_group_index(
+        GroupIndex, x[objs], x_counts, [0], objs_fingerprint=get_objs_fingerprint(objs)
+    )
+    assert result_objs is not result_all
+    assert result_objs.n_objs == len(objs)
+    assert (
+        cache.get_group_index(
+            GroupIndex,
+            x[objs],
+            x_counts,
+            [0],
+            objs_fingerprint=get_objs_fingerprint(np.asarray(objs)),
+        )
+        is result_objs
+    )
+    assert cache.stats.hits == 1
+    assert get_objs_fingerprint([1, 2]) != get_objs_fingerprint([2, 1])
+
+
+def test_partition_cache_evictions():
+    x, x_counts = _prepare_data()
+    nbytes = GroupIndex.from_data(x, x_counts, [0]).index.nbytes
+    cache = PartitionCache(max_bytes=2 * nbytes)
+    first = cache.get_group_index(GroupIndex, x, x_counts, [0])
+    cache.get_group_index(GroupIndex, x, x_counts, [1])
+    # use the first one so that the second one is the least recently used
+    assert cache.get_group_index(GroupIndex, x, x_counts, [0]) is first
+    cache.get_group_index(GroupIndex, x, x_counts, [2])
+    assert cache.stats.evictions == 1
+    assert cache.nbytes <= cache.max_bytes
+    assert cache.get_group_index(GroupIndex, x, x_counts, [0]) is first
+    cache.get_group_index(GroupIndex, x, x_counts, [1])
+    assert cache.stats.misses == 4
+
+
+def test_partition_cache_no_budget():
+    x, x_counts = _prepare_data()
+    cache = PartitionCache(max_bytes=0)
+    cache.get_group_index(GroupIndex, x, x_counts, [0])
+    cache.get_group_index(GroupIndex, x, x_counts, [0])
+    assert len(cache) == 0
+    assert (cache.stats.hits, cache.stats.misses) == (0, 2)
+
+
+def test_partition_cache_invalid():
+    with pytest.raises(ValueError, match="non-negative"):
+        PartitionCache(max_bytes=-1)
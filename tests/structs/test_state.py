@@ -1,3 +1,5 @@
+import pickle
+
 import numpy as np
 import pytest
 
@@ -31,3 +33,55 @@ def test_state_from_optional(rng_seed):
         assert not state.is_set_rng()
     else:
         assert isinstance(state.get_rng(), np.random.Generator)
+
+
+def test_state_is_slotted():
+    state = ProcessingState.from_optional(processing_fun=dummy_processing_fun)
+    assert not hasattr(state, "__dict__")
+    with pytest.raises(AttributeError):
+        state.unknown_attribute = 1  # type: ignore[attr-defined]
+
+
+def test_state_fork_shares_inputs_until_written():
+    x = np.array([[0, 1], [1, 0]])
+    state = ProcessingState.from_optional(processing_fun=dummy_processing_fun)
+    state.set_input_data_x(x)
+    state.set_config_epsilon(0.1)
+    state.set_values_result_attrs([0])
+
+    forked = state.fork()
+    assert forked.get_input_data_x() is x
+    assert forked._inputs is state._inputs  # pylint: disable=protected-access
+
+    forked.set_config_epsilon(0.2)
+    assert forked.get_config_epsilon() == 0.2
+    assert state.get_config_epsilon() == 0.1
+    assert forked.get_input_data_x() is x
+
+    state.set_config_epsilon(0.3)
+    assert state.get_config_epsilon() == 0.3
+    assert forked.get_config_epsilon() == 0.2
+
+
+def test_state_fork_copies_result_lists():
+    state = ProcessingState.from_optional(processing_fun=dummy_processing_fun)
+    state.set_values_result_objs([0])
+    state.set_values_result_attrs([1])
+    forked = state.fork()
+    forked.get_values_result_objs().append(2)
+    forked.get_values_result_attrs().append(3)
+    assert state.get_values_result_objs() == [0]
+    assert state.get_values_result_attrs() == [1]
+    assert forked.get_values_result_objs() == [0, 2]
+    assert forked.get_values_result_attrs() == [1, 3]
+
+
+def test_state_fork_pickle_roundtrip():
+    state = ProcessingState.from_optional(processing_fun=dummy_processing_fun)
+    state.set_input_data_y(np.array([0, 1]))
+    state.set_config_epsilon(0.1)
+    restored = pickle.loads(pickle.dumps(state.fork()))
+    assert np.array_equal(restored.get_input_data_y(), [0, 1])
+    restored.set_config_epsilon(0.2)
+    assert restored.get_config_epsilon() == 0.2
+    assert state.get_config_epsilon() == 0.1
@@ -4,7 +4,7 @@ import pytest
 from skrough.attrs_checks import check_if_attr_better_than_shuffled
 from skrough.dataprep import prepare_factorized_vector
 from skrough.disorder_measures import conflicts_count, entropy, gini_impurity
-from skrough.structs.group_index import GroupIndex
+from skrough.structs.group_index import GROUP_INDEX_BY_NAME, GroupIndex
 
 TEST_SMOOTHING_PARAMETER = 1
 TEST_FAST = False
@@ -106,3 +106,182 @@ def test_check_if_attr_better_than_shuffled(
         rng=np.random.default_rng(),
     )
     assert result is expected
+
+
+def _check_if_attr_better_than_shuffled_one_by_one(
+    group_index,
+    attr_values,
+    attr_values_count,
+    values,
+    values_count,
+    allowed_randomness,
+    probes_count,
+    smoothing_parameter,
+    fast,
+    disorder_fun,
+    rng,
+):
+    threshold = (1 - allowed_randomness) * (
+        probes_count + smoothing_parameter * 2
+    ) - smoothing_parameter
+    attr_disorder_score = group_index.get_disorder_score_after_split(
+        attr_values, attr_values_count, values, values_count, disorder_fun
+    )
+    shuffled = np.array(attr_values)
+    permutation = rng.permutation(len(shuffled)) if fast else None
+    better = 0
+    for iterations in range(1, probes_count + 1):
+        if fast:
+            shuffled = shuffled[permutation]
+        else:
+            rng.shuffle(shuffled)
+        shuffled_disorder_score = group_index.get_disorder_score_after_split(
+            shuffled, attr_values_count, values, values_count, disorder_fun
+        )
+        if attr_disorder_score < shuffled_disorder_score:
+            better += 1
+        if better >= threshold:
+            return True
+        if iterations - better > probes_count - threshold:
+            return False
+    return True
+
+
+@pytest.mark.parametrize("fast", [False, True])
+@pytest.mark.parametrize("allowed_randomness", [0.0, 0.05, 0.3, 0.9])
+@pytest.mark.parametrize("probes_count", [0, 1, 7, 100])
+@pytest.mark.parametrize("block_max_elements", [1, 50, 2**22])
+@pytest.mark.parametrize("seed", range(3))
+def test_check_if_attr_better_than_shuffled_blocks(
+    fast, allowed_randomness, probes_count, block_max_elements, seed, monkeypatch
+):
+    monkeypatch.setattr(
+        "skrough.attrs_checks.PROBES_BLOCK_MAX_ELEMENTS", block_max_elements
+    )
+    data_rng = np.random.default_rng(seed)
+    group_index = GroupIndex.from_index(data_rng.integers(3, size=30))
+    y, y_count = prepare_factorized_vector(data_rng.integers(2, size=30))
+    attr_values, attr_values_count = prepare_factorized_vector(
+        np.where(data_rng.random(30) < 0.7, y, data_rng.integers(2, size=30))
+    )
+    kwargs = {
+        "group_index": group_index,
+        "attr_values": attr_values,
+        "attr_values_count": attr_values_count,
+        "values": y,
+        "values_count": y_count,
+        "allowed_randomness": allowed_randomness,
+        "probes_count": probes_count,
+        "smoothing_parameter": TEST_SMOOTHING_PARAMETER,
+        "fast": fast,
+        "disorder_fun": entropy,
+    }
+    rng = np.random.default_rng(seed)
+    expected_rng = np.random.default_rng(seed)
+    result = check_if_attr_better_than_shuffled(**kwargs, rng=rng)
+    expected = _check_if_attr_better_than_shuffled_one_by_one(
+        **kwargs, rng=expected_rng
+    )
+    assert result is expected
+    # the same number of random draws is made
+    assert rng.integers(2**32) == expected_rng.integers(2**32)
+
+
+def _python_entropy(distribution, n):
+    return entropy(np.asarray(distribution), n)
+
+
+def _get_check_kwargs(seed, group_index_cls=GroupIndex):
+    data_rng = np.random.default_rng(seed)
+    group_index = group_index_cls.from_index(data_rng.integers(3, size=30))
+    y, y_count = prepare_factorized_vector(data_rng.integers(2, size=30))
+    attr_values, attr_values_count = prepare_factorized_vector(
+        np.where(data_rng.random(30) < 0.7, y, data_rng.integers(2, size=30))
+    )
+    return {
+        "group_index": group_index,
+        "attr_values": attr_values,
+        "attr_values_count": attr_values_count,
+        "values": y,
+        "values_count": y_count,
+        "allowed_randomness": 0.1,
+        "probes_count": 50,
+        "smoothing_parameter": TEST_SMOOTHING_PARAMETER,
+        "fast": False,
+    }
+
+
+@pytest.mark.parametrize("disorder_fun", [entropy, _python_entropy])
+@pytest.mark.parametrize("group_index_name", list(GROUP_INDEX_BY_NAME))
+@pytest.mark.parametrize("seed", range(3))
+def test_check_if_attr_better_than_shuffled_group_index_classes(
+    disorder_fun, group_index_name, seed
+):
+    kwargs = _get_check_kwargs(seed, GROUP_INDEX_BY_NAME[group_index_name])
+    rng = np.random.default_rng(seed)
+    expected_rng = np.random.default_rng(seed)
+    result = check_if_attr_better_than_shuffled(
+        **kwargs, disorder_fun=disorder_fun, rng=rng
+    )
+    expected = _check_if_attr_better_than_shuffled_one_by_one(
+        **_get_check_kwargs(seed), disorder_fun=entropy, rng=expected_rng
+    )
+    assert result is expected
+    assert rng.integers(2**32) == expected_rng.integers(2**32)
+
+
+@pytest.mark.parametrize("disorder_fun", [conflicts_count, entropy, gini_impurity])
+@pytest.mark.parametrize("seed", range(3))
+def test_check_if_attr_better_than_shuffled_unit_weights(disorder_fun, seed):
+    kwargs = _get_check_kwargs(seed)
+    rng = np.random.default_rng(seed)
+    expected_rng = np.random.default_rng(seed)
+    result = check_if_attr_better_than_shuffled(
+        **kwargs,
+        disorder_fun=disorder_fun,
+        rng=rng,
+        weights=np.ones(len(kwargs["values"]), dtype=np.int64),
+    )
+    expected = check_if_attr_better_than_shuffled(
+        **kwargs, disorder_fun=disorder_fun, rng=expected_rng
+    )
+    assert result is expected
+    assert rng.integers(2**32) == expected_rng.integers(2**32)
+
+
+@pytest.mark.parametrize(
+    "attr_values, identity_bank, expected",
+    [
+        ([0, 1, 0, 1, 0, 1], False, True),
+        ([0, 1, 0, 1, 0, 1], True, False),
+        ([0, 0, 0, 0, 0, 0], False, False),
+    ],
+)
+def test_check_if_attr_better_than_shuffled_permutations_bank(
+    attr_values, identity_bank, expected
+):
+    n_objs = 6
+    rng = np.random.default_rng(0)
+    if identity_bank:
+        permutations = np.tile(np.arange(n_objs, dtype=np.int32), (10, 1))
+    else:
+        permutations = rng.permuted(
+            np.tile(np.arange(n_objs, dtype=np.int32), (1000, 1)), axis=1
+        )
+    attr_values, attr_values_count = prepare_factorized_vector(attr_values)
+    y, y_count = prepare_factorized_vector([0, 1, 0, 1, 0, 1])
+    result = check_if_attr_better_than_shuffled(
+        group_index=GroupIndex.create_uniform(n_objs),
+        attr_values=attr_values,
+        attr_values_count=attr_values_count,
+        values=y,
+        values_count=y_count,
+        allowed_randomness=0.3,
+        probes_count=1000,
+        smoothing_parameter=TEST_SMOOTHING_PARAMETER,
+        fast=TEST_FAST,
+        disorder_fun=entropy,
+        rng=rng,
+        permutations=permutations,
+    )
+    assert result is expected
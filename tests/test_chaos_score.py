@@ -10,7 +10,11 @@ from skrough.dataprep import (
     prepare_factorized_vector,
 )
 from skrough.disorder_measures import conflicts_count, entropy, gini_impurity
-from skrough.disorder_score import get_disorder_score_for_data, get_disorder_score_stats
+from skrough.disorder_score import (
+    get_disorder_score_for_data,
+    get_disorder_score_stats,
+    get_epsilon_approx_threshold,
+)
 from tests.helpers import generate_data
 
 
@@ -318,6 +322,27 @@ def test_get_disorder_score_stats_epsilon_out_of_range(epsilon):
         )
 
 
+@pytest.mark.parametrize("epsilon", [0, 0.1, 0.5, 1.0])
+def test_get_epsilon_approx_threshold(epsilon):
+    result = prepare_result(
+        x=generate_data(size=(20, 3), values_max=3),
+        y=generate_data(size=20, values_max=3),
+        disorder_fun=entropy,
+        increment_attrs=None,
+        epsilon=epsilon,
+    )[-1]
+    assert (
+        get_epsilon_approx_threshold(result.base, result.total, epsilon)
+        == result.approx_threshold
+    )
+
+
+@pytest.mark.parametrize("epsilon", [-0.1, 1.1])
+def test_get_epsilon_approx_threshold_out_of_range(epsilon):
+    with pytest.raises(ValueError, match="Epsilon value should be a number"):
+        get_epsilon_approx_threshold(1.0, 0.0, epsilon)
+
+
 @pytest.mark.parametrize(
     "disorder_fun",
     [
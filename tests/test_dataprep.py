@@ -3,7 +3,11 @@ import pandas as pd
 import pytest
 
 import skrough as rgh
-from skrough.dataprep import prepare_factorized_array, prepare_factorized_vector
+from skrough.dataprep import (
+    prepare_deduplicated_data,
+    prepare_factorized_array,
+    prepare_factorized_vector,
+)
 from tests.helpers import generate_data
 
 
@@ -76,6 +80,57 @@ def test_prepare_factorized_array(array, expected, expected_counts):
     result, result_counts = prepare_factorized_array(array)
     assert np.array_equal(result_counts, expected_counts)
     assert np.array_equal(result, expected)
+    result, result_counts, result_uniques = prepare_factorized_array(
+        array, return_unique_values=True
+    )
+    assert np.array_equal(result, expected)
+    assert [len(uniques) for uniques in result_uniques] == list(expected_counts)
+    for i, uniques in enumerate(result_uniques):
+        assert np.array_equal(uniques[result[:, i]], array[:, i])
+
+
+@pytest.mark.parametrize(
+    "x, y, expected_x, expected_y, expected_weights, expected_inverse",
+    [
+        (
+            np.zeros(shape=(0, 2), dtype=np.int64),
+            np.zeros(0, dtype=np.int64),
+            np.zeros(shape=(0, 2), dtype=np.int64),
+            np.zeros(0, dtype=np.int64),
+            [],
+            [],
+        ),
+        (
+            [[0, 1], [1, 0]],
+            [0, 0],
+            [[0, 1], [1, 0]],
+            [0, 0],
+            [1, 1],
+            [0, 1],
+        ),
+        (
+            [[1, 0], [0, 0], [1, 0], [1, 0], [0, 0]],
+            [0, 1, 0, 1, 1],
+            [[1, 0], [0, 0], [1, 0]],
+            [0, 1, 1],
+            [2, 2, 1],
+            [0, 1, 0, 2, 1],
+        ),
+    ],
+)
+def test_prepare_deduplicated_data(
+    x, y, expected_x, expected_y, expected_weights, expected_inverse
+):
+    x = np.asarray(x)
+    y = np.asarray(y)
+    result_x, result_y, result_weights, result_inverse = prepare_deduplicated_data(x, y)
+    assert np.array_equal(result_x, expected_x)
+    assert np.array_equal(result_y, expected_y)
+    assert np.array_equal(result_weights, expected_weights)
+    assert np.array_equal(result_inverse, expected_inverse)
+    # the unique rows restore the input rows
+    assert np.array_equal(result_x[result_inverse], x)
+    assert np.array_equal(result_y[result_inverse], y)
 
 
 def test_add_shadow_attrs(
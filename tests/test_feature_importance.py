@@ -178,3 +178,22 @@ def get_bireducts_scores(
         }
     )
     return result
+
+
+def test_feature_importance_threading_backend():
+    x, x_counts = prepare_factorized_array(np.asarray([[0, 0], [0, 1], [1, 0], [1, 1]]))
+    y, y_count = prepare_factorized_vector(np.asarray([0, 1, 0, 1]))
+    kwargs = {
+        "x": x,
+        "x_counts": x_counts,
+        "y": y,
+        "y_count": y_count,
+        "column_names": ["col1", "col2"],
+        "attrs_subsets": [[0], [0], [1], [0, 1]],
+        "disorder_fun": gini_impurity,
+    }
+    expected = rgh.feature_importance.get_feature_importance(**kwargs)
+    result = rgh.feature_importance.get_feature_importance(
+        **kwargs, n_jobs=2, backend="threading"
+    )
+    pd.testing.assert_frame_equal(result, expected)
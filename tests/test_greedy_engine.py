@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+from skrough.disorder_measures import entropy
+from skrough.greedy_engine import get_greedy_reduct_attrs
+
+
+def test_get_greedy_reduct_attrs_negative_candidates_count():
+    with pytest.raises(ValueError, match="non-negative"):
+        get_greedy_reduct_attrs(
+            x=np.zeros((2, 2), dtype=np.int64),
+            x_counts=np.ones(2, dtype=np.int64),
+            y=np.zeros(2, dtype=np.int64),
+            y_count=1,
+            disorder_fun=entropy,
+            approx_threshold=0.0,
+            candidates_count=-1,
+            rng=np.random.default_rng(0),
+        )
+
+
+def test_get_greedy_reduct_attrs_zero_candidates_count():
+    x = np.asarray([[0, 1], [1, 0]], dtype=np.int64)
+    result = get_greedy_reduct_attrs(
+        x=x,
+        x_counts=np.asarray([2, 2]),
+        y=x[:, 0],
+        y_count=2,
+        disorder_fun=entropy,
+        approx_threshold=0.0,
+        candidates_count=0,
+        rng=np.random.default_rng(0),
+    )
+    assert result == []
@@ -0,0 +1,55 @@
+import logging
+
+import pytest
+
+from skrough.logs import LOG_CALL_ENV_VAR, is_log_call_enabled, log_call
+
+
+def _add(a, b=0):
+    """Add numbers."""
+    return a + b
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (None, True),
+        ("", True),
+        ("1", True),
+        ("0", False),
+        ("off", False),
+        (" False ", False),
+        ("NO", False),
+    ],
+)
+def test_is_log_call_enabled(value, expected, monkeypatch):
+    if value is None:
+        monkeypatch.delenv(LOG_CALL_ENV_VAR, raising=False)
+    else:
+        monkeypatch.setenv(LOG_CALL_ENV_VAR, value)
+    assert is_log_call_enabled() is expected
+
+
+def test_log_call(caplog, monkeypatch):
+    monkeypatch.delenv(LOG_CALL_ENV_VAR, raising=False)
+    decorated = log_call(_add)
+    assert decorated is not _add
+    assert decorated.__name__ == "_add"
+    assert decorated.__doc__ == "Add numbers."
+
+    with caplog.at_level(logging.INFO, logger=__name__):
+        assert decorated(1, b=2) == 3
+    assert not caplog.records
+
+    with caplog.at_level(logging.DEBUG, logger=__name__):
+        assert decorated(2, 3) == 5
+    assert [record.getMessage() for record in caplog.records] == [
+        "enter _add",
+        "exit _add",
+    ]
+    assert all(record.name == __name__ for record in caplog.records)
+
+
+def test_log_call_disabled(monkeypatch):
+    monkeypatch.setenv(LOG_CALL_ENV_VAR, "0")
+    assert log_call(_add) is _add
@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+
+from skrough.dataprep import prepare_factorized_array, prepare_factorized_vector
+from skrough.disorder_measures import conflicts_count, entropy, gini_impurity
+from skrough.disorder_score import get_disorder_score_for_data
+from skrough.partitions import (
+    get_leave_one_out_disorder_scores,
+    reduce_attrs_sequentially,
+)
+from skrough.structs.group_index import GROUP_INDEX_BY_NAME, GroupIndex
+from skrough.unique import get_uniques_and_compacted
+from tests.helpers import generate_data
+
+
+def _canonical(index):
+    """Relabel groups in the order of their first occurrence."""
+    _, compacted = get_uniques_and_compacted(np.asarray(index))
+    _, first = np.unique(compacted, return_index=True)
+    relabel = np.empty(len(first), dtype=np.int64)
+    relabel[np.argsort(first)] = np.arange(len(first))
+    return relabel[compacted]
+
+
+@pytest.mark.parametrize("gi_class", GROUP_INDEX_BY_NAME.values())
+@pytest.mark.parametrize(
+    "attrs, fixed_attrs, removable",
+    [
+        ([], [], set()),
+        ([3], [], {3}),
+        ([0, 1, 2, 3, 4, 5, 6], [], set()),
+        ([0, 1, 2, 3, 4, 5, 6], [], {0, 1, 2, 3, 4, 5, 6}),
+        ([6, 0, 5, 1, 4, 2], [3], {0, 2, 4}),
+        ([2, 4, 1], [0, 6], {4}),
+        ([1, 2, 3, 4, 5], [], {2, 5}),
+    ],
+)
+def test_reduce_attrs_sequentially(gi_class, attrs, fixed_attrs, removable):
+    x, x_counts = prepare_factorized_array(generate_data(size=(40, 7), values_max=3))
+    visited = []
+    current_attrs = list(attrs)
+
+    def _is_removable(attr, group_index):
+        expected = GroupIndex.from_data(
+            x,
+            x_counts,
+            fixed_attrs + [a for a in current_attrs if a != attr],
+        )
+        assert np.array_equal(
+            _canonical(group_index.index),
+            _canonical(expected.index),
+        )
+        visited.append(attr)
+        if attr in removable:
+            current_attrs.remove(attr)
+            return True
+        return False
+
+    kept = reduce_attrs_sequentially(
+        x,
+        x_counts,
+        attrs,
+        _is_removable,
+        group_index=gi_class.from_data(x, x_counts, fixed_attrs),
+    )
+    assert visited == attrs
+    assert kept == [attr for attr in attrs if attr not in removable]
+
+
+@pytest.mark.parametrize("disorder_fun", [conflicts_count, entropy, gini_impurity])
+@pytest.mark.parametrize("attrs", [[], [0], [4, 1], [0, 1, 2, 3, 4, 5], [5, 2, 3]])
+def test_get_leave_one_out_disorder_scores(attrs, disorder_fun):
+    data = generate_data(size=(50, 7), values_max=3)
+    x, x_counts = prepare_factorized_array(data[:, :-1])
+    y, y_count = prepare_factorized_vector(data[:, -1])
+    result = get_leave_one_out_disorder_scores(
+        x, x_counts, y, y_count, attrs, disorder_fun
+    )
+    expected = [
+        get_disorder_score_for_data(
+            x,
+            x_counts,
+            y,
+            y_count,
+            disorder_fun,
+            attrs=[a for a in attrs if a != attr],
+        )
+        for attr in attrs
+    ]
+    assert len(result) == len(attrs)
+    assert np.allclose(result, expected)
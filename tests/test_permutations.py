@@ -7,6 +7,7 @@ from skrough.permutations import (
     get_objs_attrs_permutation,
     get_objs_permutation,
     get_permutation,
+    get_stratified_objs_permutation,
 )
 
 
@@ -125,3 +126,16 @@ def test_get_attrs_permutation(n_attrs):
 def test_get_attrs_permutation_wrong_args(n_attrs):
     with pytest.raises(ValueError, match="`n_attrs` cannot be less than zero"):
         get_attrs_permutation(n_attrs=n_attrs)
+
+
+@pytest.mark.parametrize("n_objs", [0, 1, 5, 100])
+@pytest.mark.parametrize("values_count", [1, 2, 3])
+@pytest.mark.parametrize("seed", range(3))
+def test_get_stratified_objs_permutation(n_objs, values_count, seed):
+    values = np.random.default_rng(seed).integers(values_count, size=n_objs)
+    result = get_stratified_objs_permutation(values, seed=seed)
+    assert np.array_equal(np.sort(result), np.arange(n_objs))
+    counts = np.bincount(values, minlength=values_count)
+    for size in range(1, n_objs + 1):
+        prefix_counts = np.bincount(values[result[:size]], minlength=values_count)
+        assert np.all(np.abs(prefix_counts - counts * size / n_objs) <= 1)
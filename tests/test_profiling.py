@@ -0,0 +1,133 @@
+import json
+import pickle
+
+import pytest
+
+from skrough.algorithms.reducts import (
+    _get_approx_reduct_greedy_heuristic,
+    get_approx_reduct_greedy_heuristic,
+)
+from skrough.disorder_measures import entropy
+from skrough.profiling import (
+    NODE_META_PROFILE_CALLS_KEY,
+    NODE_META_PROFILE_ELEMENTS_KEY,
+    NODE_META_PROFILE_SECONDS_KEY,
+    Profiler,
+)
+from skrough.structs.description_node import DescriptionNode
+from tests.helpers import generate_data
+
+
+def test_profiler_measure():
+    profiler = Profiler()
+    for _ in range(3):
+        with profiler.measure("outer"), profiler.measure("inner") as record:
+            record.elements += 2
+    with pytest.raises(ValueError), profiler.measure("outer"):
+        raise ValueError()
+    records = profiler.get_records()
+    assert set(records) == {"outer", "outer/inner"}
+    assert records["outer"].calls == 4
+    assert records["outer"].elements == 0
+    assert records["outer/inner"].calls == 3
+    assert records["outer/inner"].elements == 6
+    assert records["outer"].seconds >= records["outer/inner"].seconds >= 0
+
+
+@pytest.mark.parametrize("record_events", [False, True])
+def test_profiler_export(record_events):
+    profiler = Profiler(record_events=record_events)
+    with profiler.measure("a"), profiler.measure("b") as record:
+        record.elements += 1
+    assert json.loads(profiler.to_json()) == {
+        "a": {"calls": 1, "seconds": pytest.approx(0, abs=1), "elements": 0},
+        "a/b": {"calls": 1, "seconds": pytest.approx(0, abs=1), "elements": 1},
+    }
+    events = json.loads(profiler.to_chrome_trace())["traceEvents"]
+    if record_events:
+        assert [(event["name"], event["cat"], event["ph"]) for event in events] == [
+            ("b", "a/b", "X"),
+            ("a", "a", "X"),
+        ]
+        assert events[0]["args"] == {"elements": 1}
+    else:
+        assert not events
+
+
+def test_profiler_annotate():
+    profiler = Profiler()
+    with profiler.measure("a"), profiler.measure("0") as record:
+        record.elements += 5
+    graph = DescriptionNode(
+        children=[
+            DescriptionNode(
+                node_name="a",
+                node_meta={"optional": True},
+                children=[DescriptionNode(node_name="0"), DescriptionNode()],
+            ),
+            DescriptionNode(node_name="b"),
+        ]
+    )
+    assert profiler.annotate(graph) is graph
+    assert graph.node_meta is None
+    a_node = graph.children[0]
+    assert a_node.node_meta["optional"] is True
+    assert a_node.node_meta[NODE_META_PROFILE_CALLS_KEY] == 1
+    assert a_node.children[0].node_meta[NODE_META_PROFILE_ELEMENTS_KEY] == 5
+    assert a_node.children[1].node_meta is None
+    assert graph.children[1].node_meta is None
+
+
+def test_profiler_processing():
+    profiler = Profiler()
+    x = generate_data(size=(30, 5), values_max=3)
+    y = generate_data(size=30, values_max=2)
+    get_approx_reduct_greedy_heuristic(
+        x, y, disorder_fun=entropy, epsilon=0.0, n_reducts=2, profiler=profiler
+    )
+    records = profiler.get_records()
+    assert records["shared_init"].calls == 1
+    assert records["init"].calls == 2
+    assert records["prepare_result"].calls == 2
+    select = records["stages/0/outer_loop/select"]
+    assert select.calls >= 2
+    assert records["stages/0/outer_loop/select/0"].calls == select.calls
+    assert select.elements == records["stages/0/outer_loop/select/0"].elements
+
+    graph = profiler.annotate(
+        _get_approx_reduct_greedy_heuristic.get_description_graph()
+    )
+    stage_node = next(
+        node for node in graph.children if node.node_name == "stages"
+    ).children[0]
+    assert stage_node.node_meta[NODE_META_PROFILE_CALLS_KEY] == 2
+    assert stage_node.node_meta[NODE_META_PROFILE_SECONDS_KEY] > 0
+
+
+def test_profiler_processing_process_workers():
+    profiler = Profiler()
+    x = generate_data(size=(30, 5), values_max=3)
+    y = generate_data(size=30, values_max=2)
+    kwargs = {"disorder_fun": entropy, "epsilon": 0.0, "n_reducts": 2, "seed": 0}
+    expected = get_approx_reduct_greedy_heuristic(x, y, **kwargs)
+    result = get_approx_reduct_greedy_heuristic(
+        x, y, n_jobs=2, profiler=profiler, **kwargs
+    )
+    assert result == expected
+    records = profiler.get_records()
+    # the shared init runs in the calling process, the runs in the workers report
+    # to copies of the profiler
+    assert records["shared_init"].calls == 1
+    assert "init" not in records
+
+
+def test_profiler_pickle():
+    profiler = Profiler()
+    with profiler.measure("a"):
+        pass
+    restored = pickle.loads(pickle.dumps(profiler))
+    assert restored.get_records() == profiler.get_records()
+    with restored.measure("b"):
+        pass
+    assert restored.get_records()["b"].calls == 1
+    assert "b" not in profiler.get_records()
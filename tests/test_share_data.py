@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+from skrough.algorithms.reducts import get_approx_reduct_greedy_heuristic
+from skrough.disorder_measures import entropy
+from skrough.predict.predict_attrs_ensemble import predict_attrs_ensemble
+from skrough.structs.attrs_subset import AttrsSubset
+from tests.helpers import generate_data
+
+
+def test_get_approx_reduct_greedy_heuristic_share_data():
+    x = generate_data(size=(40, 6), values_max=3)
+    y = generate_data(size=40, values_max=2)
+    kwargs = {"disorder_fun": entropy, "epsilon": 0.1, "n_reducts": 3, "seed": 1}
+    expected = get_approx_reduct_greedy_heuristic(x, y, **kwargs)
+    result = get_approx_reduct_greedy_heuristic(
+        x, y, n_jobs=2, share_data=True, **kwargs
+    )
+    assert result == expected
+
+
+@pytest.mark.parametrize("return_proba", [False, True])
+def test_predict_attrs_ensemble_share_data(return_proba):
+    x = generate_data(size=(40, 6), values_max=3)
+    y = generate_data(size=40, values_max=2)
+    models = [AttrsSubset(attrs=[0, 1]), AttrsSubset(attrs=[2, 3, 4])]
+    kwargs = {"return_proba": return_proba, "seed": 0}
+    expected = predict_attrs_ensemble(models, x, y, x, **kwargs)
+    result = predict_attrs_ensemble(
+        models, x, y, x, n_jobs=2, share_data=True, **kwargs
+    )
+    if return_proba:
+        assert np.array_equal(result[0], expected[0], equal_nan=True)
+        assert np.array_equal(result[1], expected[1])
+    else:
+        assert np.array_equal(result, expected)